@@ -22,8 +22,14 @@ base_requirements = {
     "phonenumbers>=8.12.56,<=8.13.0",
 }
 
+# predict_infotypes_table
+pandas_requirements = {
+    "pandas>=1.2.0,<=1.5.1",
+}
+
 dev_requirements = {
     *base_requirements,
+    *pandas_requirements,
     "black>=22.1.0",
     "coverage>=5.1",
     "flake8>=3.8.3",
@@ -33,8 +39,7 @@ dev_requirements = {
     "mypy>=0.981",
     "pytest-cov>=2.8.1",
     "scikit-learn",
-    "pandas>=1.2.0,<=1.5.1",
-    "openpyxl"
+    "openpyxl",
 }
 
 
@@ -77,5 +82,5 @@ setuptools.setup(
     packages=setuptools.find_namespace_packages(where="./src"),
     # Dependencies.
     install_requires=list(base_requirements),
-    extras_require={"dev": dev_requirements},
+    extras_require={"dev": dev_requirements, "pandas": pandas_requirements},
 )
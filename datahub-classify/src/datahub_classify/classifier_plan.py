@@ -0,0 +1,308 @@
+import hashlib
+import importlib
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from datahub_classify.constants import (
+    DATATYPE,
+    DESCRIPTION,
+    LIBRARY,
+    NAME,
+    PREDICTION_FACTORS_AND_WEIGHTS,
+    PREDICTION_TYPE,
+    REGEX,
+    TYPE,
+    VALUES,
+)
+from datahub_classify.infotype_utils import (
+    CompiledNamePattern,
+    NamePatternMatcher,
+    ValuePatternMatcher,
+    compile_name_patterns,
+    compile_value_matcher,
+    match_compiled_regex,
+)
+from datahub_classify.stats import (
+    VALUES_LIBRARY_STAGE,
+    VALUES_REGEX_STAGE,
+    VALUES_SPACY_STAGE,
+)
+
+logger = logging.getLogger(__name__)
+
+CLASSIFIER_PLAN_CACHE_SIZE = 8
+INFOTYPE_HELPER_MODULE = "datahub_classify.infotype_helper"
+# infotypes whose values score is adjusted depending on the name score
+NAME_DEPENDENT_VALUES_INFOTYPES = ["Gender", "Full_Name"]
+# Relative cost of values prediction, used to run the cheapest inspectors first
+REGEX_VALUES_PREDICTION_COST = 1
+LIBRARY_VALUES_PREDICTION_COST = {
+    "Age": 1,
+    "IP_Address_v4": 2,
+    "IP_Address_v6": 2,
+    "US_Social_Security_Number": 3,
+    "IBAN": 3,
+    "Vehicle_Identification_Number": 3,
+    "Swift_Code": 3,
+    "Phone_Number": 4,
+    "Street_Address": 10,
+    "Full_Name": 10,
+}
+
+
+InspectorFunction = TypeVar("InspectorFunction", bound=Callable)
+
+
+@dataclass(frozen=True)
+class RegisteredInfotype:
+    inspector: Callable
+    # modules imported by "library" values prediction of the infotype
+    libraries: Tuple[str, ...] = ()
+
+
+_infotype_registry: Dict[str, RegisteredInfotype] = {}
+
+
+def register_infotype(
+    infotype: str, libraries: Tuple[str, ...] = ()
+) -> Callable[[InspectorFunction], InspectorFunction]:
+    """Register the decorated function as the inspector of infotype.
+
+    libraries are not imported until a classifier plan uses the infotype with
+    "library" values prediction, so that regex only configs never load them.
+    """
+
+    def register(inspector: InspectorFunction) -> InspectorFunction:
+        _infotype_registry[infotype] = RegisteredInfotype(inspector, libraries)
+        return inspector
+
+    return register
+
+
+def get_infotype_registry() -> Dict[str, RegisteredInfotype]:
+    # inspectors register themselves when infotype_helper is imported
+    importlib.import_module(INFOTYPE_HELPER_MODULE)
+    return _infotype_registry
+
+
+@dataclass
+class CompiledInfotypeConfig:
+    """Infotype configuration with all regexes compiled and patterns pre-cleaned."""
+
+    config: Dict[str, Dict]
+    name_patterns: List[CompiledNamePattern] = field(default_factory=list)
+    description_patterns: List[CompiledNamePattern] = field(default_factory=list)
+    datatypes: FrozenSet[str] = frozenset()
+    value_matcher: ValuePatternMatcher = field(
+        default_factory=lambda: ValuePatternMatcher([])
+    )
+    # matchers of all infotypes of a classifier plan, which score names and
+    # descriptions for every infotype at once
+    infotype: str = ""
+    name_matcher: Optional[NamePatternMatcher] = None
+    description_matcher: Optional[NamePatternMatcher] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Dict]) -> "CompiledInfotypeConfig":
+        prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
+        compiled_config = cls(config)
+        if prediction_factors_weights.get(NAME, 0) > 0:
+            compiled_config.name_patterns = compile_name_patterns(config[NAME][REGEX])
+        if prediction_factors_weights.get(DESCRIPTION, 0) > 0:
+            compiled_config.description_patterns = compile_name_patterns(
+                config[DESCRIPTION][REGEX]
+            )
+        if prediction_factors_weights.get(DATATYPE, 0) > 0:
+            compiled_config.datatypes = frozenset(
+                str(s).lower() for s in config[DATATYPE][TYPE]
+            )
+        if prediction_factors_weights.get(VALUES, 0) > 0:
+            compiled_config.value_matcher = compile_value_matcher(
+                config[VALUES].get(REGEX, [])
+            )
+        return compiled_config
+
+    def match_name(self, name: str) -> float:
+        if self.name_matcher is not None:
+            return self.name_matcher.score(name, self.infotype)
+        return match_compiled_regex(name, self.name_patterns)
+
+    def match_description(self, description: str) -> float:
+        if self.description_matcher is not None:
+            return self.description_matcher.score(description, self.infotype)
+        return match_compiled_regex(description, self.description_patterns)
+
+
+@dataclass
+class ClassifierPlan:
+    """Everything predict_infotypes needs that only depends on the global config.
+
+    A plan is built once per (global_config, infotypes) pair and reused across
+    calls, so that regex compilation and pattern cleaning are not repeated for
+    every column.
+    """
+
+    config_fingerprint: str
+    infotype_function_map: Dict[str, Callable]
+    compiled_configs: Dict[str, CompiledInfotypeConfig]
+    requires_spacy: bool = False
+    # infotypes ordered by increasing values prediction cost
+    inspection_order: List[str] = field(default_factory=list)
+    # stage under which values inspection of each infotype is timed
+    values_stages: Dict[str, str] = field(default_factory=dict)
+    # Name and Description matchers of all infotypes of the plan
+    name_matcher: Optional[NamePatternMatcher] = None
+    description_matcher: Optional[NamePatternMatcher] = None
+
+
+def get_infotype_function_mapping(
+    infotypes: Optional[List[str]], global_config: Dict[str, Dict]
+) -> Dict[str, Callable]:
+    infotype_registry = get_infotype_registry()
+    infotype_function_map = {}
+    if not infotypes:
+        infotypes = list(global_config.keys())
+    for infotype in infotypes:
+        if infotype not in global_config.keys():
+            logger.warning(f"Configuration is not available for infotype - {infotype}")
+        else:
+            infotype_function_map[infotype] = infotype_registry[infotype].inspector
+    return infotype_function_map
+
+
+def uses_library(config: Dict[str, Dict]) -> bool:
+    return (
+        config[PREDICTION_FACTORS_AND_WEIGHTS].get(VALUES, 0) > 0
+        and config[VALUES][PREDICTION_TYPE] == LIBRARY
+    )
+
+
+def get_libraries(infotype: str, config: Dict[str, Dict]) -> Tuple[str, ...]:
+    """Modules values prediction of infotype imports with this config."""
+    if not uses_library(config):
+        return ()
+    return get_infotype_registry()[infotype].libraries
+
+
+def uses_spacy(infotype: str, config: Dict[str, Dict]) -> bool:
+    return "spacy" in get_libraries(infotype, config)
+
+
+def get_values_stage(infotype: str, config: Dict[str, Dict]) -> str:
+    if uses_spacy(infotype, config):
+        return VALUES_SPACY_STAGE
+    if uses_library(config):
+        return VALUES_LIBRARY_STAGE
+    return VALUES_REGEX_STAGE
+
+
+def get_values_prediction_cost(infotype: str, config: Dict[str, Dict]) -> int:
+    if config[PREDICTION_FACTORS_AND_WEIGHTS].get(VALUES, 0) <= 0:
+        return 0
+    if config[VALUES][PREDICTION_TYPE] == LIBRARY:
+        return LIBRARY_VALUES_PREDICTION_COST.get(infotype, 1)
+    return REGEX_VALUES_PREDICTION_COST
+
+
+def compute_config_fingerprint(global_config: Dict[str, Dict]) -> str:
+    serialized_config = json.dumps(global_config, sort_keys=True, default=str)
+    return hashlib.sha256(serialized_config.encode("utf-8")).hexdigest()
+
+
+def build_name_matcher(
+    global_config: Dict[str, Dict], infotypes: Iterable[str], factor: str
+) -> NamePatternMatcher:
+    """Matcher of the factor (Name or Description) patterns of all infotypes."""
+    return NamePatternMatcher(
+        {
+            infotype: global_config[infotype][factor][REGEX]
+            for infotype in infotypes
+            if global_config[infotype][PREDICTION_FACTORS_AND_WEIGHTS].get(factor, 0)
+            > 0
+        }
+    )
+
+
+def build_classifier_plan(
+    global_config: Dict[str, Dict],
+    infotypes: Optional[List[str]] = None,
+    config_fingerprint: Optional[str] = None,
+) -> ClassifierPlan:
+    infotype_function_map = get_infotype_function_mapping(infotypes, global_config)
+    for infotype in infotype_function_map.keys():
+        # spaCy itself is imported along with its model, by get_spacy_models
+        for library in get_libraries(infotype, global_config[infotype]):
+            if library != "spacy":
+                importlib.import_module(library)
+    compiled_configs = {
+        infotype: CompiledInfotypeConfig.from_config(global_config[infotype])
+        for infotype in infotype_function_map.keys()
+    }
+    name_matcher = build_name_matcher(global_config, infotype_function_map, NAME)
+    description_matcher = build_name_matcher(
+        global_config, infotype_function_map, DESCRIPTION
+    )
+    for infotype, compiled_config in compiled_configs.items():
+        compiled_config.infotype = infotype
+        compiled_config.name_matcher = name_matcher
+        compiled_config.description_matcher = description_matcher
+    return ClassifierPlan(
+        config_fingerprint=config_fingerprint
+        or compute_config_fingerprint(global_config),
+        infotype_function_map=infotype_function_map,
+        compiled_configs=compiled_configs,
+        requires_spacy=any(
+            uses_spacy(infotype, global_config[infotype])
+            for infotype in infotype_function_map.keys()
+        ),
+        inspection_order=sorted(
+            infotype_function_map.keys(),
+            key=lambda infotype: get_values_prediction_cost(
+                infotype, global_config[infotype]
+            ),
+        ),
+        values_stages={
+            infotype: get_values_stage(infotype, global_config[infotype])
+            for infotype in infotype_function_map.keys()
+        },
+        name_matcher=name_matcher,
+        description_matcher=description_matcher,
+    )
+
+
+_classifier_plan_cache: "OrderedDict[Tuple[str, Optional[Tuple[str, ...]]], ClassifierPlan]" = (
+    OrderedDict()
+)
+
+
+def get_classifier_plan(
+    global_config: Dict[str, Dict], infotypes: Optional[List[str]] = None
+) -> ClassifierPlan:
+    """Return a cached ClassifierPlan, building it on first use.
+
+    Plans are keyed by a fingerprint of the config contents (not its identity),
+    so mutating a config in place never returns a stale plan.
+    """
+    config_fingerprint = compute_config_fingerprint(global_config)
+    cache_key = (config_fingerprint, tuple(infotypes) if infotypes else None)
+    plan = _classifier_plan_cache.get(cache_key)
+    if plan is None:
+        plan = build_classifier_plan(global_config, infotypes, config_fingerprint)
+        _classifier_plan_cache[cache_key] = plan
+        if len(_classifier_plan_cache) > CLASSIFIER_PLAN_CACHE_SIZE:
+            _classifier_plan_cache.popitem(last=False)
+    else:
+        _classifier_plan_cache.move_to_end(cache_key)
+    return plan
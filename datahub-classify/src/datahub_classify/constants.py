@@ -8,3 +8,6 @@ REGEX = "regex"
 TYPE = "type"
 PREDICTION_TYPE = "prediction_type"
 LIBRARY = "library"
+BATCH_SIZE = "batch_size"
+N_PROCESS = "n_process"
+REGIONS = "regions"
@@ -1,12 +1,117 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Union
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class BaseInfotypeProposal:
+    """Infotype proposal of a column, an InfotypeProposal or a compact one.
+
+    Proposals are equal if their infotype, confidence level and debug_info are,
+    whichever of the two classes they are.
+    """
+
+    __slots__ = ()
 
-@dataclass
-class InfotypeProposal:
     infotype: str
     confidence_level: float
-    debug_info: Dict[str, Any]
+    debug_info: "DebugInfo"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BaseInfotypeProposal):
+            return NotImplemented
+        return (self.infotype, self.confidence_level, self.debug_info) == (
+            other.infotype,
+            other.confidence_level,
+            other.debug_info,
+        )
+
+
+@dataclass(eq=False)
+class InfotypeProposal(BaseInfotypeProposal):
+    infotype: str
+    confidence_level: float
+    debug_info: "DebugInfo"
+
+
+class CompactInfotypeProposal(BaseInfotypeProposal):
+    """Infotype proposal holding plain float scores in slots.
+
+    Returned with InspectionOptions(compact_results=True). The DebugInfo is not
+    stored until debug_info is first accessed, it is then built from the scores
+    and kept, so that changes to it are not lost.
+    """
+
+    __slots__ = (
+        "infotype",
+        "confidence_level",
+        "_name",
+        "_description",
+        "_datatype",
+        "_values",
+        "_values_consumed",
+        "_debug_info",
+    )
+
+    _debug_info: Optional["DebugInfo"]
+
+    def __init__(
+        self, infotype: str, confidence_level: float, debug_info: "DebugInfo"
+    ) -> None:
+        self.infotype = infotype
+        self.confidence_level = float(confidence_level)
+        self.debug_info = debug_info
+
+    @classmethod
+    def from_proposal(cls, proposal: BaseInfotypeProposal) -> "CompactInfotypeProposal":
+        if isinstance(proposal, CompactInfotypeProposal):
+            return proposal
+        return cls(proposal.infotype, proposal.confidence_level, proposal.debug_info)
+
+    @property  # type: ignore[override]
+    def debug_info(self) -> "DebugInfo":
+        if self._debug_info is None:
+            self._debug_info = DebugInfo(
+                self._name,
+                self._description,
+                self._datatype,
+                self._values,
+                self._values_consumed,
+            )
+        return self._debug_info
+
+    @debug_info.setter
+    def debug_info(self, debug_info: "DebugInfo") -> None:
+        self._name = _to_float(debug_info.name)
+        self._description = _to_float(debug_info.description)
+        self._datatype = _to_float(debug_info.datatype)
+        self._values = _to_float(debug_info.values)
+        self._values_consumed = debug_info.values_consumed
+        self._debug_info = None
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactInfotypeProposal(infotype={self.infotype!r}, "
+            f"confidence_level={self.confidence_level!r}, "
+            f"debug_info={self.debug_info!r})"
+        )
+
+
+# Scores are mostly rounded to two decimals, so that compact proposals can share
+# a few hundred float objects rather than each holding its own
+MAX_SHARED_SCORES = 4096
+_shared_scores: Dict[float, float] = {}
+
+
+def _to_float(score: Optional[float]) -> Optional[float]:
+    # NumPy scalars take more memory than floats, and pickle to more bytes
+    if score is None:
+        return None
+    score = float(score)
+    if len(_shared_scores) < MAX_SHARED_SCORES:
+        return _shared_scores.setdefault(score, score)
+    return _shared_scores.get(score, score)
 
 
 @dataclass
@@ -27,8 +132,9 @@ class Metadata:
 @dataclass
 class ColumnInfo:
     metadata: Metadata
-    values: List[Any]
-    infotype_proposals: Optional[List[InfotypeProposal]] = None
+    # e.g. a list, a NumPy array or StringValues read from a SampleStore
+    values: Union[Sequence[Any], "np.ndarray"]
+    infotype_proposals: Optional[List[BaseInfotypeProposal]] = None
 
 
 @dataclass
@@ -37,3 +143,111 @@ class DebugInfo:
     description: Optional[float] = None
     datatype: Optional[float] = None
     values: Optional[float] = None
+    # number of values scored, set if scoring stopped early or sampled values
+    values_consumed: Optional[int] = None
+
+
+@dataclass
+class ColumnValues:
+    """Views over a column's values, each computed at most once per column.
+
+    predict_infotypes normalizes the values of a column once and hands the
+    same ColumnValues object to every infotype inspector.
+    """
+
+    raw: List[Any]
+    _strings: Optional[List[str]] = field(default=None, init=False, repr=False)
+    _lowered: Optional[List[str]] = field(default=None, init=False, repr=False)
+    _stripped: Optional[List[str]] = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def from_values(cls, values: Union[List[Any], "ColumnValues"]) -> "ColumnValues":
+        if isinstance(values, ColumnValues):
+            return values
+        return cls(list(values))
+
+    @classmethod
+    def normalize(cls, values: Union[Iterable[Any], "ColumnValues"]) -> "ColumnValues":
+        """Drop null-like values ("nan", "", "None"), stringifying each value once."""
+        if isinstance(values, ColumnValues):
+            values = values.raw
+        raw = []
+        strings = []
+        stripped = []
+        for value in values:
+            string_value = str(value)
+            stripped_value = string_value.strip()
+            if stripped_value not in ["nan", "", "None"]:
+                raw.append(value)
+                strings.append(string_value)
+                stripped.append(stripped_value)
+        column_values = cls(raw)
+        column_values._strings = strings
+        column_values._stripped = stripped
+        return column_values
+
+    @property
+    def values(self) -> Union[List[Any], "np.ndarray"]:
+        """Cleaned values, to be kept as the column's values."""
+        return self.raw
+
+    @property
+    def strings(self) -> List[str]:
+        if self._strings is None:
+            self._strings = [str(value) for value in self.raw]
+        return self._strings
+
+    @property
+    def lowered(self) -> List[str]:
+        if self._lowered is None:
+            self._lowered = [value.lower() for value in self.strings]
+        return self._lowered
+
+    @property
+    def stripped(self) -> List[str]:
+        if self._stripped is None:
+            self._stripped = [value.strip() for value in self.strings]
+        return self._stripped
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+
+@dataclass
+class InspectionOptions:
+    # Stop scoring values once the proposal can no longer reach, or has already
+    # passed, confidence_level_threshold. An accepted proposal then reports the
+    # fraction of valid values observed so far as its values score.
+    early_exit: bool = False
+    # Number of values scored between two early exit checks, or the size of
+    # the first sample with adaptive_sampling
+    early_exit_batch_size: int = 50
+    # Score random samples of values of doubling size and stop once a confidence
+    # interval of the fraction of valid values decides the proposal, the
+    # statistical counterpart of early_exit
+    adaptive_sampling: bool = False
+    # z-score of the adaptive_sampling confidence interval, 2.576 is 99%
+    sampling_z_score: float = 2.576
+    # Set by predict_infotypes
+    confidence_level_threshold: Optional[float] = None
+    # "python", or "numpy" to keep typed NumPy arrays of numeric values as such,
+    # masking nulls, checking numbers on the array and regex matching each
+    # distinct value once
+    backend: str = "python"
+    # Return CompactInfotypeProposal objects, which take less than half the
+    # memory of an InfotypeProposal with its DebugInfo
+    compact_results: bool = False
+    # If False, ColumnInfo.values is emptied once the column is classified, so
+    # that sampled values are not kept alive along with the results
+    keep_values: bool = True
+
+
+@dataclass
+class ColumnChanges:
+    """What changed in a column since its infotype proposals were computed."""
+
+    # changed metadata fields, e.g. ["Description", "Datatype"]
+    metadata_fields: List[str] = field(default_factory=list)
+    values_changed: bool = False
+    # infotypes whose configuration changed
+    changed_infotypes: List[str] = field(default_factory=list)
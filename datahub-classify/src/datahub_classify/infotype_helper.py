@@ -2,83 +2,137 @@ import ipaddress
 import logging
 import re
 import string
-from typing import Any, Dict, List, Tuple, cast
-
-import numpy as np
-import phonenumbers
-import spacy
-from schwifty import BIC, IBAN
-from stdnum.us import ssn as us_ssn
-from vininfo import Vin
+from dataclasses import dataclass, replace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
+from datahub_classify.classifier_plan import (
+    ClassifierPlan,
+    CompiledInfotypeConfig,
+    register_infotype,
+)
 from datahub_classify.constants import (
+    BATCH_SIZE,
     DATATYPE,
     DESCRIPTION,
+    N_PROCESS,
     NAME,
     PREDICTION_FACTORS_AND_WEIGHTS,
     PREDICTION_TYPE,
-    REGEX,
-    TYPE,
+    REGIONS,
     VALUES,
 )
-from datahub_classify.helper_classes import DebugInfo, Metadata
+from datahub_classify.helper_classes import (
+    ColumnValues,
+    DebugInfo,
+    InspectionOptions,
+    Metadata,
+)
 from datahub_classify.infotype_utils import (
-    detect_named_entity_spacy,
-    match_datatype,
-    match_regex,
-    match_regex_for_values,
+    EarlyExit,
+    LazyModule,
+    detect_named_entities_spacy,
+    score_values,
+    validate_each,
+)
+from datahub_classify.spacy_models import (
+    get_spacy_model_name_or_path,
+    get_spacy_models,
 )
+from datahub_classify.validation_cache import get_validation_cache
+from datahub_classify.vectorized import score_regex_values, to_int_array
 
 logger = logging.getLogger(__name__)
-spacy_model_name = "en_core_web_sm"
-try:
-    nlp_english = spacy.load(spacy_model_name)
-except OSError:
-    logger.info("Downloading language model for the spaCy")
-    from spacy.cli import download
-
-    download(spacy_model_name)
-    nlp_english = spacy.load(spacy_model_name)
-spacy_models_list = [nlp_english]
+# Imported on first use, or when a classifier plan uses an infotype registered
+# with them, rather than along with this module
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = LazyModule("numpy")
+phonenumbers = LazyModule("phonenumbers")
+schwifty = LazyModule("schwifty")
+us_ssn = LazyModule("stdnum.us.ssn")
+vininfo = LazyModule("vininfo")
+default_spacy_batch_size = 128
+default_spacy_n_process = 1
+# Used when the Phone_Number config does not specify "regions". Earlier versions
+# iterated over a hard-coded list of ISO codes which, due to the unsupported
+# region "AQ" in ninth position, only ever parsed values with these regions.
+default_phone_number_regions = ["AF", "AX", "AL", "DZ", "AS", "AD", "AO", "AI"]
 
 
 def compute_name_description_dtype_score(
-    metadata: Metadata, config: Dict[str, Dict], debug_info: DebugInfo
+    metadata: Metadata,
+    config: Dict[str, Dict],
+    debug_info: DebugInfo,
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    factors: Iterable[str] = (NAME, DESCRIPTION, DATATYPE),
 ) -> DebugInfo:
+    """Score the metadata factors, only those listed in factors."""
+    if compiled_config is None:
+        compiled_config = CompiledInfotypeConfig.from_config(config)
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
     # Name Logic
-    if prediction_factors_weights.get(NAME, 0) > 0:
+    if NAME in factors and prediction_factors_weights.get(NAME, 0) > 0:
         if not metadata.name or not metadata.name.strip():
             # TODO: Add message "Name is None/Blank" in error flag
             # debug_info.name = f"0.0 (Blank {NAME} Metadata)"
             pass
         else:
-            debug_info.name = match_regex(metadata.name, config[NAME][REGEX])
+            debug_info.name = compiled_config.match_name(metadata.name)
 
     # Description_Logic
-    if prediction_factors_weights.get(DESCRIPTION, 0) > 0:
+    if DESCRIPTION in factors and prediction_factors_weights.get(DESCRIPTION, 0) > 0:
         if not metadata.description or not metadata.description.strip():
             # TODO: Add message "Description is None/Blank" in error flag
             # debug_info.description = f"0.0 (Blank {DESCRIPTION} Metadata)"
             pass
         else:
-            debug_info.description = match_regex(
-                metadata.description, config[DESCRIPTION][REGEX]
+            debug_info.description = compiled_config.match_description(
+                metadata.description
             )
 
     # Datatype_Logic
-    if prediction_factors_weights.get(DATATYPE, 0) > 0:
+    if DATATYPE in factors and prediction_factors_weights.get(DATATYPE, 0) > 0:
         if not metadata.datatype or not metadata.datatype.strip():
             # TODO: Add message "Datatype is None/Blank" in error flag
             # debug_info.datatype = f"0.0 (Blank {DATATYPE} Metadata)"
             pass
         else:
-            debug_info.datatype = match_datatype(
-                metadata.datatype, config[DATATYPE][TYPE]
+            debug_info.datatype = (
+                1 if metadata.datatype.lower() in compiled_config.datatypes else 0
             )
     return debug_info
 
 
+def score_metadata(
+    metadata: Metadata,
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    metadata_scores: Optional[DebugInfo] = None,
+) -> DebugInfo:
+    """Name, description and datatype scores of a column.
+
+    metadata_scores are scores already computed by the caller, copied instead of
+    computed again.
+    """
+    if metadata_scores is not None:
+        return replace(metadata_scores)
+    return compute_name_description_dtype_score(
+        metadata, config, DebugInfo(), compiled_config
+    )
+
+
 def compute_overall_confidence(debug_info: DebugInfo, config: Dict[str, Dict]) -> float:
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
     prediction_factors_weights = {
@@ -86,94 +140,330 @@ def compute_overall_confidence(debug_info: DebugInfo, config: Dict[str, Dict]) -
     }
     confidence_level = 0
     for key, value in vars(debug_info).items():
-        if value and type(value) != str:
+        if key in prediction_factors_weights and value and type(value) != str:
             confidence_level += prediction_factors_weights[key] * value
     confidence_level = np.round(confidence_level, 2)
     return confidence_level
 
 
+def compute_max_confidence(
+    metadata: Metadata,
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    metadata_scores: Optional[DebugInfo] = None,
+) -> float:
+    """Upper bound of the confidence level, computed from metadata only.
+
+    No infotype scores values above 1, so this is the confidence level the
+    infotype would reach if every value were valid.
+    """
+    debug_info = score_metadata(metadata, config, compiled_config, metadata_scores)
+    if config[PREDICTION_FACTORS_AND_WEIGHTS].get(VALUES, 0) > 0:
+        debug_info.values = 1.0
+    return compute_overall_confidence(debug_info, config)
+
+
+@dataclass
+class MetadataScores:
+    """Name, description and datatype scores of many columns, for all infotypes.
+
+    Each matrix has one row per column and one column per infotype, in the
+    order of infotypes. Factors with a zero weight, and blank metadata, score 0.
+    """
+
+    infotypes: List[str]
+    name: "np.ndarray"
+    description: "np.ndarray"
+    datatype: "np.ndarray"
+    # compute_max_confidence of each column and infotype
+    max_confidence: "np.ndarray"
+
+
+def _score_distinct_texts(
+    texts: List[Optional[str]],
+    infotypes: List[str],
+    score_text: Callable[[str], Dict[str, float]],
+) -> "np.ndarray":
+    """Scores of texts by infotype, scoring each distinct non blank text once."""
+    distinct_indices: Dict[Optional[str], int] = {}
+    inverse_indices = [
+        distinct_indices.setdefault(text, len(distinct_indices)) for text in texts
+    ]
+    infotype_indices = {infotype: j for j, infotype in enumerate(infotypes)}
+    distinct_scores = np.zeros((len(distinct_indices), len(infotypes)))
+    for i, text in enumerate(distinct_indices):
+        if text and text.strip():
+            for infotype, score in score_text(text).items():
+                distinct_scores[i, infotype_indices[infotype]] = score
+    return distinct_scores[np.array(inverse_indices, dtype=np.intp)]
+
+
+def compute_metadata_scores(
+    metadata_list: List[Metadata],
+    global_config: Dict[str, Dict],
+    classifier_plan: ClassifierPlan,
+) -> MetadataScores:
+    """Score the metadata of all columns against all infotypes of classifier_plan.
+
+    Names, descriptions and datatypes are scored once per distinct value, for
+    all infotypes at once, and the confidence levels are computed over whole
+    matrices. Scores are the same as compute_name_description_dtype_score and
+    compute_max_confidence give column by column.
+    """
+    infotypes = list(classifier_plan.infotype_function_map.keys())
+    weights = {
+        factor: np.array(
+            [
+                global_config[infotype][PREDICTION_FACTORS_AND_WEIGHTS].get(factor, 0)
+                for infotype in infotypes
+            ],
+            dtype=float,
+        )
+        for factor in (NAME, DESCRIPTION, DATATYPE, VALUES)
+    }
+
+    def score_name(name: str) -> Dict[str, float]:
+        if classifier_plan.name_matcher is not None:
+            return classifier_plan.name_matcher.match(name)
+        return {
+            infotype: classifier_plan.compiled_configs[infotype].match_name(name)
+            for infotype, weight in zip(infotypes, weights[NAME])
+            if weight > 0
+        }
+
+    def score_description(description: str) -> Dict[str, float]:
+        if classifier_plan.description_matcher is not None:
+            return classifier_plan.description_matcher.match(description)
+        return {
+            infotype: classifier_plan.compiled_configs[infotype].match_description(
+                description
+            )
+            for infotype, weight in zip(infotypes, weights[DESCRIPTION])
+            if weight > 0
+        }
+
+    def score_datatype(datatype: str) -> Dict[str, float]:
+        lowered_datatype = datatype.lower()
+        return {
+            infotype: 1
+            for infotype, weight in zip(infotypes, weights[DATATYPE])
+            if weight > 0
+            and lowered_datatype in classifier_plan.compiled_configs[infotype].datatypes
+        }
+
+    name_scores = _score_distinct_texts(
+        [metadata.name for metadata in metadata_list], infotypes, score_name
+    )
+    description_scores = _score_distinct_texts(
+        [metadata.description for metadata in metadata_list],
+        infotypes,
+        score_description,
+    )
+    datatype_scores = _score_distinct_texts(
+        [metadata.datatype for metadata in metadata_list], infotypes, score_datatype
+    )
+    # summed in the order compute_overall_confidence sums factors, so that
+    # rounding gives the same confidence levels
+    max_confidence = (
+        weights[NAME] * name_scores
+        + weights[DESCRIPTION] * description_scores
+        + weights[DATATYPE] * datatype_scores
+        + np.maximum(weights[VALUES], 0)
+    )
+    return MetadataScores(
+        infotypes,
+        name_scores,
+        description_scores,
+        datatype_scores,
+        np.round(max_confidence, 2),
+    )
+
+
+def get_early_exit(
+    debug_info: DebugInfo,
+    config: Dict[str, Dict],
+    options: Optional[InspectionOptions],
+) -> Optional[EarlyExit]:
+    """Condition for score_values to stop once the proposal outcome is known.
+
+    debug_info must already hold the name, description and datatype scores.
+    """
+    if (
+        options is None
+        or not (options.early_exit or options.adaptive_sampling)
+        or options.confidence_level_threshold is None
+    ):
+        return None
+    confidence_level_threshold = options.confidence_level_threshold
+
+    def compute_confidence(values_score: float) -> float:
+        return compute_overall_confidence(
+            replace(debug_info, values=np.round(values_score, 2)), config
+        )
+
+    def is_decided(min_values_score: float, max_values_score: float) -> bool:
+        return (
+            compute_confidence(max_values_score) <= confidence_level_threshold
+            or compute_confidence(min_values_score) > confidence_level_threshold
+        )
+
+    return EarlyExit(
+        is_decided,
+        batch_size=options.early_exit_batch_size,
+        sampling_z_score=options.sampling_z_score
+        if options.adaptive_sampling
+        else None,
+        debug_info=debug_info,
+    )
+
+
+def name_matches_fully(
+    debug_info: DebugInfo, prediction_factors_weights: Dict[str, float]
+) -> bool:
+    return (
+        prediction_factors_weights.get(NAME, 0) > 0
+        and debug_info.name is not None
+        and abs(1 - debug_info.name) < 1e-10
+    )
+
+
+@register_infotype("Email_Address")
 def inspect_for_email_address(
-    metadata: Metadata, values: List[Any], config: Dict[str, Dict]
+    metadata: Metadata,
+    values: Union[List[Any], ColumnValues],
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    options: Optional[InspectionOptions] = None,
+    metadata_scores: Optional[DebugInfo] = None,
 ) -> Tuple[float, DebugInfo]:
+    if compiled_config is None:
+        compiled_config = CompiledInfotypeConfig.from_config(config)
+    column_values = ColumnValues.from_values(values)
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
-    debug_info = DebugInfo()
+    debug_info = score_metadata(metadata, config, compiled_config, metadata_scores)
+
     # Value Logic
     if prediction_factors_weights.get(VALUES, 0) > 0:
         values_score = 0.0
+        early_exit = get_early_exit(debug_info, config, options)
         try:
             if config[VALUES][PREDICTION_TYPE] == "regex":
-                values_score = match_regex_for_values(values, config[VALUES][REGEX])
+                values_score = score_regex_values(
+                    column_values,
+                    compiled_config.value_matcher,
+                    early_exit=early_exit,
+                )
             elif config[VALUES][PREDICTION_TYPE] == "library":
                 raise Exception(
                     "Currently prediction type 'library' is not supported for infotype Email Address"
                 )
             else:
                 raise Exception(
-                    f"Inappropriate Prediction type {config[VALUES][PREDICTION_TYPE]}"
+                    f"Inappropriate values_prediction_type {config[VALUES][PREDICTION_TYPE]}"
                 )
         except Exception as e:
             logger.error(f"Column {metadata.name} failed due to {e}")
         values_score = np.round(values_score, 2)
         debug_info.values = values_score
 
-    debug_info = compute_name_description_dtype_score(metadata, config, debug_info)
     confidence_level = compute_overall_confidence(debug_info, config)
     return confidence_level, debug_info
 
 
+@register_infotype("Street_Address", libraries=("spacy",))
 def inspect_for_street_address(
-    metadata: Metadata, values: List[Any], config: Dict[str, Dict]
+    metadata: Metadata,
+    values: Union[List[Any], ColumnValues],
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    options: Optional[InspectionOptions] = None,
+    metadata_scores: Optional[DebugInfo] = None,
 ) -> Tuple[float, DebugInfo]:  # noqa: C901
+    if compiled_config is None:
+        compiled_config = CompiledInfotypeConfig.from_config(config)
+    column_values = ColumnValues.from_values(values)
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
-    debug_info = DebugInfo()
+    debug_info = score_metadata(metadata, config, compiled_config, metadata_scores)
 
-    # Values logic
+    # Value Logic
     if prediction_factors_weights.get(VALUES, 0) > 0:
         values_score = 0.0
+        early_exit = get_early_exit(debug_info, config, options)
         try:
             if config[VALUES][PREDICTION_TYPE] == "regex":
-                values_score = match_regex_for_values(values, config[VALUES][REGEX])
+                values_score = score_regex_values(
+                    column_values,
+                    compiled_config.value_matcher,
+                    early_exit=early_exit,
+                )
             elif config[VALUES][PREDICTION_TYPE] == "library":
-                entity_count: float = 0
                 entities_of_interest = ["FAC", "LOC", "ORG"]
                 weight = 1.5
-                for value in values:
-                    try:
-                        if detect_named_entity_spacy(
-                            spacy_models_list, entities_of_interest, value
-                        ):
-                            entity_count += weight
-                    except Exception:
-                        pass
-                entities_score = entity_count / len(values)
-                values_score = np.minimum(entities_score, 1)
+                spacy_models_list = get_spacy_models()
+                values_score = score_values(
+                    column_values.raw,
+                    get_validation_cache().cached(
+                        "Street_Address",
+                        f"spacy:{get_spacy_model_name_or_path()}",
+                        lambda batch: detect_named_entities_spacy(
+                            spacy_models_list,
+                            entities_of_interest,
+                            batch,
+                            batch_size=config[VALUES].get(
+                                BATCH_SIZE, default_spacy_batch_size
+                            ),
+                            n_process=config[VALUES].get(
+                                N_PROCESS, default_spacy_n_process
+                            ),
+                        ),
+                    ),
+                    weight=weight,
+                    early_exit=early_exit,
+                )
             else:
                 raise Exception(
                     f"Inappropriate values_prediction_type {config[VALUES][PREDICTION_TYPE]}"
                 )
         except Exception as e:
             logger.error(f"Column {metadata.name} failed due to {e}")
-            pass
         values_score = np.round(values_score, 2)
         debug_info.values = values_score
 
-    debug_info = compute_name_description_dtype_score(metadata, config, debug_info)
     confidence_level = compute_overall_confidence(debug_info, config)
     return confidence_level, debug_info
 
 
+@register_infotype("Gender")
 def inspect_for_gender(
-    metadata: Metadata, values: List[Any], config: Dict[str, Dict]
+    metadata: Metadata,
+    values: Union[List[Any], ColumnValues],
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    options: Optional[InspectionOptions] = None,
+    metadata_scores: Optional[DebugInfo] = None,
 ) -> Tuple[float, DebugInfo]:  # noqa: C901
+    if compiled_config is None:
+        compiled_config = CompiledInfotypeConfig.from_config(config)
+    column_values = ColumnValues.from_values(values)
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
-    debug_info = DebugInfo()
+    debug_info = score_metadata(metadata, config, compiled_config, metadata_scores)
 
     # Value Logic
     if prediction_factors_weights.get(VALUES, 0) > 0:
         values_score = 0.0
+        # values score may be overridden below when the name matches fully
+        early_exit = (
+            None
+            if name_matches_fully(debug_info, prediction_factors_weights)
+            else get_early_exit(debug_info, config, options)
+        )
         try:
             if config[VALUES][PREDICTION_TYPE] == "regex":
-                values_score = match_regex_for_values(values, config[VALUES][REGEX])
+                values_score = score_regex_values(
+                    column_values,
+                    compiled_config.value_matcher,
+                    early_exit=early_exit,
+                )
             elif config[VALUES][PREDICTION_TYPE] == "library":
                 raise Exception(
                     "Currently prediction type 'library' is not supported for infotype Gender"
@@ -187,17 +477,13 @@ def inspect_for_gender(
         values_score = np.round(values_score, 2)
         debug_info.values = values_score
 
-    debug_info = compute_name_description_dtype_score(metadata, config, debug_info)
-
     try:
         if (
-            prediction_factors_weights.get(NAME, 0) > 0
-            and debug_info.name is not None
-            and abs(1 - debug_info.name) < 1e-10
+            name_matches_fully(debug_info, prediction_factors_weights)
             and prediction_factors_weights.get(VALUES, 0) > 0
             and debug_info.values == 0.0
         ):
-            num_unique_values = len(np.unique(values))
+            num_unique_values = len(np.unique(column_values.raw))
             if num_unique_values < 5:
                 debug_info.values = 0.9
     except Exception as e:
@@ -209,24 +495,36 @@ def inspect_for_gender(
     return confidence_level, debug_info
 
 
+def remove_card_number_separators(value: str) -> str:
+    return re.sub(r"[ _-]+", "", value)
+
+
+@register_infotype("Credit_Debit_Card_Number")
 def inspect_for_credit_debit_card_number(
-    metadata: Metadata, values: List[Any], config: Dict[str, Dict]
+    metadata: Metadata,
+    values: Union[List[Any], ColumnValues],
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    options: Optional[InspectionOptions] = None,
+    metadata_scores: Optional[DebugInfo] = None,
 ) -> Tuple[float, DebugInfo]:
+    if compiled_config is None:
+        compiled_config = CompiledInfotypeConfig.from_config(config)
+    column_values = ColumnValues.from_values(values)
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
-    debug_info = DebugInfo()
+    debug_info = score_metadata(metadata, config, compiled_config, metadata_scores)
 
     # Value Logic
     if prediction_factors_weights.get(VALUES, 0) > 0:
         values_score = 0.0
+        early_exit = get_early_exit(debug_info, config, options)
         try:
-            values = [str(s).lower() for s in values]
-            values_cleaned = []
-            for value in values:
-                string_cleaned = re.sub(r"[ _-]+", "", value)
-                values_cleaned.append(string_cleaned)
             if config[VALUES][PREDICTION_TYPE] == "regex":
-                values_score = match_regex_for_values(
-                    values_cleaned, config[VALUES][REGEX]
+                values_score = score_regex_values(
+                    column_values,
+                    compiled_config.value_matcher,
+                    clean=remove_card_number_separators,
+                    early_exit=early_exit,
                 )
             elif config[VALUES][PREDICTION_TYPE] == "library":
                 raise Exception(
@@ -241,107 +539,162 @@ def inspect_for_credit_debit_card_number(
         values_score = np.round(values_score, 2)
         debug_info.values = values_score
 
-    debug_info = compute_name_description_dtype_score(metadata, config, debug_info)
     confidence_level = compute_overall_confidence(debug_info, config)
     return confidence_level, debug_info
 
 
+def is_possible_phone_number(value: Any, regions: List[str]) -> bool:
+    # cheap prefilter, phonenumbers can not parse a number without any digit
+    if not isinstance(value, str) or not any(c.isdigit() for c in value):
+        return False
+    try:
+        if value.lstrip().startswith(("+", "\uff0b")):
+            # E.164 / international format, default region is ignored while parsing
+            return phonenumbers.is_possible_number(phonenumbers.parse(value, None))
+        # regions are tried in the configured order, so that the result only
+        # depends on the value
+        for region in regions:
+            parsed_number = phonenumbers.parse(value, region)
+            if phonenumbers.is_possible_number(parsed_number):
+                return True
+    except Exception:
+        pass
+    return False
+
+
+def get_phone_number_validator(regions: List[str]) -> Callable[[Any], bool]:
+    """Phone number validator, results are memoized for its lifetime."""
+    results: Dict[Any, bool] = {}
+
+    def is_valid_phone_number(value: Any) -> bool:
+        try:
+            return results[value]
+        except (KeyError, TypeError):
+            is_possible = is_possible_phone_number(value, regions)
+            if isinstance(value, str):
+                results[value] = is_possible
+            return is_possible
+
+    return is_valid_phone_number
+
+
+@register_infotype("Phone_Number", libraries=("phonenumbers",))
 def inspect_for_phone_number(
-    metadata: Metadata, values: List[Any], config: Dict[str, Dict]
+    metadata: Metadata,
+    values: Union[List[Any], ColumnValues],
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    options: Optional[InspectionOptions] = None,
+    metadata_scores: Optional[DebugInfo] = None,
 ) -> Tuple[float, DebugInfo]:  # noqa: C901
+    if compiled_config is None:
+        compiled_config = CompiledInfotypeConfig.from_config(config)
+    column_values = ColumnValues.from_values(values)
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
-    debug_info = DebugInfo()
-
-    # fmt: off
-    # TODO: shall we have these country codes in config?
-    iso_codes = ["AF", "AX", "AL", "DZ", "AS", "AD", "AO", "AI", "AQ", "AG", "AR",
-                 "AM", "AW", "AU", "AT", "AZ", "BS", "BH", "BD", "BB", "BY", "BE",
-                 "BZ", "BJ", "BM", "BT", "BO", "BQ", "BA", "BW", "BV", "BR", "IO",
-                 "BN", "BG", "BF", "BI", "CV", "KH", "CM", "CA", "KY", "CF", "TD",
-                 "CL", "CN", "CX", "CC", "CO", "KM", "CG", "CD", "CK", "CR", "CI",
-                 "HR", "CU", "CW", "CY", "CZ", "DK", "DJ", "DM", "DO", "EC", "EG",
-                 "SV", "GQ", "ER", "EE", "ET", "FK", "FO", "FJ", "FI", "FR", "GF",
-                 "PF", "TF", "GA", "GM", "GE", "DE", "GH", "GI", "GR", "GL", "GD",
-                 "GP", "GU", "GT", "GG", "GN", "GW", "GY", "HT", "HM", "VA", "HN",
-                 "HK", "HU", "IS", "IN", "ID", "IR", "IQ", "IE", "IM", "IL", "IT",
-                 "JM", "JP", "JE", "JO", "KZ", "KE", "KI", "KP", "KR", "KW", "KG",
-                 "LA", "LV", "LB", "LS", "LR", "LY", "LI", "LT", "LU", "MO", "MK",
-                 "MG", "MW", "MY", "MV", "ML", "MT", "MH", "MQ", "MR", "MU", "YT",
-                 "MX", "FM", "MD", "MC", "MN", "ME", "MS", "MA", "MZ", "MM", "NA",
-                 "NR", "NP", "NL", "NC", "NZ", "NI", "NE", "NG", "NU", "NF", "MP",
-                 "NO", "OM", "PK", "PW", "PS", "PA", "PG", "PY", "PE", "PH", "PN",
-                 "PL", "PT", "PR", "QA", "RE", "RO", "RU", "RW", "BL", "SH", "KN",
-                 "LC", "MF", "PM", "VC", "WS", "SM", "ST", "SA", "SN", "RS", "SC",
-                 "SL", "SG", "SX", "SK", "SI", "SB", "SO", "ZA", "GS", "SS", "ES",
-                 "LK", "SD", "SR", "SJ", "SZ", "SE", "CH", "SY", "TW", "TJ", "TZ",
-                 "TH", "TL", "TG", "TK", "TO", "TT", "TN", "TR", "TM", "TC", "TV",
-                 "UG", "UA", "AE", "GB", "US", "UM", "UY", "UZ", "VU", "VE", "VN",
-                 "VG", "VI", "WF", "EH", "YE", "ZM", "ZW"]
-    # fmt: on
-    # Values logic
+    debug_info = score_metadata(metadata, config, compiled_config, metadata_scores)
+
+    # Value Logic
     if prediction_factors_weights.get(VALUES, 0) > 0:
-        values_score: float = 0.0
+        values_score = 0.0
+        early_exit = get_early_exit(debug_info, config, options)
         try:
             if config[VALUES][PREDICTION_TYPE] == "regex":
-                values_score = match_regex_for_values(values, config[VALUES][REGEX])
+                values_score = score_regex_values(
+                    column_values,
+                    compiled_config.value_matcher,
+                    early_exit=early_exit,
+                )
             elif config[VALUES][PREDICTION_TYPE] == "library":
-                valid_phone_numbers_count = 0
-                for value in values:
-                    try:
-                        for code in iso_codes:
-                            parsed_number = phonenumbers.parse(value, code)
-                            if phonenumbers.is_possible_number(parsed_number):
-                                valid_phone_numbers_count += 1
-                                break
-                    except Exception:
-                        pass
-                values_score = valid_phone_numbers_count / len(values)
+                regions = config[VALUES].get(REGIONS, default_phone_number_regions)
+                values_score = score_values(
+                    column_values.raw,
+                    get_validation_cache().cached(
+                        "Phone_Number",
+                        f"phonenumbers:{','.join(regions)}",
+                        validate_each(get_phone_number_validator(regions)),
+                    ),
+                    early_exit=early_exit,
+                )
             else:
                 raise Exception(
                     f"Inappropriate values_prediction_type {config[VALUES][PREDICTION_TYPE]}"
                 )
-
         except Exception as e:
             logger.error(f"Column {metadata.name} failed due to {e}")
-
         values_score = np.round(values_score, 2)
         debug_info.values = values_score
 
-    debug_info = compute_name_description_dtype_score(metadata, config, debug_info)
     confidence_level = compute_overall_confidence(debug_info, config)
     return confidence_level, debug_info
 
 
+def is_full_name_candidate(value: Any) -> bool:
+    try:
+        return (
+            len(value) <= 50
+            and len(re.split(rf"[\s{string.punctuation}]+", value)) >= 2
+        )
+    except Exception:
+        return False
+
+
+@register_infotype("Full_Name", libraries=("spacy",))
 def inspect_for_full_name(
-    metadata: Metadata, values: List[Any], config: Dict[str, Dict]
+    metadata: Metadata,
+    values: Union[List[Any], ColumnValues],
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    options: Optional[InspectionOptions] = None,
+    metadata_scores: Optional[DebugInfo] = None,
 ) -> Tuple[float, DebugInfo]:  # noqa: C901
+    if compiled_config is None:
+        compiled_config = CompiledInfotypeConfig.from_config(config)
+    column_values = ColumnValues.from_values(values)
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
-    debug_info = DebugInfo()
+    debug_info = score_metadata(metadata, config, compiled_config, metadata_scores)
 
-    # Values logic
+    # Value Logic
     if prediction_factors_weights.get(VALUES, 0) > 0:
         values_score = 0.0
+        # values score may be overridden below when the name matches fully
+        early_exit = (
+            None
+            if name_matches_fully(debug_info, prediction_factors_weights)
+            else get_early_exit(debug_info, config, options)
+        )
         try:
             if config[VALUES][PREDICTION_TYPE] == "regex":
-                values_score = match_regex_for_values(values, config[VALUES][REGEX])
+                values_score = score_regex_values(
+                    column_values,
+                    compiled_config.value_matcher,
+                    early_exit=early_exit,
+                )
             elif config[VALUES][PREDICTION_TYPE] == "library":
-                entity_count = 0
                 entities_of_interest = ["PERSON"]
-                weight = 1
-                for value in values:
-                    try:
-                        if (
-                            len(value) <= 50
-                            and len(re.split(rf"[\s{string.punctuation}]+", value)) >= 2
-                        ):
-                            if detect_named_entity_spacy(
-                                spacy_models_list, entities_of_interest, value
-                            ):
-                                entity_count += weight
-                    except Exception:
-                        pass
-                entities_score = entity_count / len(values)
-                values_score = np.minimum(entities_score, 1)
+                spacy_models_list = get_spacy_models()
+                values_score = score_values(
+                    column_values.raw,
+                    get_validation_cache().cached(
+                        "Full_Name",
+                        f"spacy:{get_spacy_model_name_or_path()}",
+                        lambda batch: detect_named_entities_spacy(
+                            spacy_models_list,
+                            entities_of_interest,
+                            # values which are not candidates are reported as not detected
+                            [
+                                value if is_full_name_candidate(value) else None
+                                for value in batch
+                            ],
+                            batch_size=config[VALUES].get(
+                                BATCH_SIZE, default_spacy_batch_size
+                            ),
+                            n_process=config[VALUES].get(
+                                N_PROCESS, default_spacy_n_process
+                            ),
+                        ),
+                    ),
+                    early_exit=early_exit,
+                )
             else:
                 raise Exception(
                     f"Inappropriate values_prediction_type {config[VALUES][PREDICTION_TYPE]}"
@@ -351,13 +704,9 @@ def inspect_for_full_name(
         values_score = np.round(values_score, 2)
         debug_info.values = values_score
 
-    debug_info = compute_name_description_dtype_score(metadata, config, debug_info)
-
     try:
         if (
-            prediction_factors_weights.get(NAME, 0) > 0
-            and debug_info.name is not None
-            and abs(1 - debug_info.name) < 1e-10
+            name_matches_fully(debug_info, prediction_factors_weights)
             and prediction_factors_weights.get(VALUES, 0) > 0
             and 0.5 > cast(float, debug_info.values) > 0.1
         ):
@@ -369,28 +718,41 @@ def inspect_for_full_name(
     return confidence_level, debug_info
 
 
+@register_infotype("Age")
 def inspect_for_age(
-    metadata: Metadata, values: List[Any], config: Dict[str, Dict]
+    metadata: Metadata,
+    values: Union[List[Any], ColumnValues],
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    options: Optional[InspectionOptions] = None,
+    metadata_scores: Optional[DebugInfo] = None,
 ) -> Tuple[float, DebugInfo]:  # noqa: C901
+    if compiled_config is None:
+        compiled_config = CompiledInfotypeConfig.from_config(config)
+    column_values = ColumnValues.from_values(values)
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
-    debug_info = DebugInfo()
+    debug_info = score_metadata(metadata, config, compiled_config, metadata_scores)
 
     # Values logic
     if prediction_factors_weights.get(VALUES, 0) > 0:
         values_score: float = 0.0
         try:
             if config[VALUES][PREDICTION_TYPE] == "regex":
-                values_score = match_regex_for_values(values, config[VALUES][REGEX])
+                values_score = score_regex_values(
+                    column_values,
+                    compiled_config.value_matcher,
+                    early_exit=get_early_exit(debug_info, config, options),
+                )
             elif config[VALUES][PREDICTION_TYPE] == "library":
                 try:
                     # Check if column is convertible to int dtype
-                    int_col = [int(s) for s in values]
+                    int_col = to_int_array(column_values)
                     max_val = np.percentile(int_col, 95)
                     min_val = np.percentile(int_col, 5)
                     num_unique = len(np.unique(int_col))
                     if max_val <= 120 and min_val > 0:
                         values_score += 0.4
-                        if num_unique >= np.minimum(len(values) / 10, 40):
+                        if num_unique >= np.minimum(len(column_values) / 10, 40):
                             values_score += 0.3
                     else:
                         values_score = 0
@@ -404,32 +766,51 @@ def inspect_for_age(
             logger.error(f"Column {metadata.name} failed due to {e}")
         debug_info.values = values_score
 
-    debug_info = compute_name_description_dtype_score(metadata, config, debug_info)
     confidence_level = compute_overall_confidence(debug_info, config)
     return confidence_level, debug_info
 
 
+def is_valid_iban(value: Any) -> bool:
+    try:
+        return bool(schwifty.IBAN(value, allow_invalid=True).is_valid)
+    except Exception:
+        return False
+
+
+@register_infotype("IBAN", libraries=("schwifty",))
 def inspect_for_iban(
-    metadata: Metadata, values: List[Any], config: Dict[str, Dict]
+    metadata: Metadata,
+    values: Union[List[Any], ColumnValues],
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    options: Optional[InspectionOptions] = None,
+    metadata_scores: Optional[DebugInfo] = None,
 ) -> Tuple[float, DebugInfo]:  # noqa: C901
+    if compiled_config is None:
+        compiled_config = CompiledInfotypeConfig.from_config(config)
+    column_values = ColumnValues.from_values(values)
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
-    debug_info = DebugInfo()
+    debug_info = score_metadata(metadata, config, compiled_config, metadata_scores)
 
     # Value Logic
     if prediction_factors_weights.get(VALUES, 0) > 0:
         values_score = 0.0
+        early_exit = get_early_exit(debug_info, config, options)
         try:
             if config[VALUES][PREDICTION_TYPE] == "regex":
-                values_score = match_regex_for_values(values, config[VALUES][REGEX])
+                values_score = score_regex_values(
+                    column_values,
+                    compiled_config.value_matcher,
+                    early_exit=early_exit,
+                )
             elif config[VALUES][PREDICTION_TYPE] == "library":
-                iban_score = 0.0
-                for val in values:
-                    try:
-                        if IBAN(val, allow_invalid=True).is_valid:
-                            iban_score += 1.0
-                    except Exception:
-                        pass
-                values_score = iban_score / len(values)
+                values_score = score_values(
+                    column_values.raw,
+                    get_validation_cache().cached(
+                        "IBAN", "schwifty.IBAN", validate_each(is_valid_iban)
+                    ),
+                    early_exit=early_exit,
+                )
             else:
                 raise Exception(
                     f"Inappropriate values_prediction_type {config[VALUES][PREDICTION_TYPE]}"
@@ -439,33 +820,55 @@ def inspect_for_iban(
         values_score = np.round(values_score, 2)
         debug_info.values = values_score
 
-    debug_info = compute_name_description_dtype_score(metadata, config, debug_info)
     confidence_level = compute_overall_confidence(debug_info, config)
     return confidence_level, debug_info
 
 
+def is_valid_vin(value: Any) -> bool:
+    try:
+        # Vin constructor implicitly validates the VIN
+        _ = vininfo.Vin(value)
+        return True
+    except Exception:
+        return False
+
+
+@register_infotype("Vehicle_Identification_Number", libraries=("vininfo",))
 def inspect_for_vehicle_identification_number(
-    metadata: Metadata, values: List[Any], config: Dict[str, Dict]
+    metadata: Metadata,
+    values: Union[List[Any], ColumnValues],
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    options: Optional[InspectionOptions] = None,
+    metadata_scores: Optional[DebugInfo] = None,
 ) -> Tuple[float, DebugInfo]:  # noqa: C901
+    if compiled_config is None:
+        compiled_config = CompiledInfotypeConfig.from_config(config)
+    column_values = ColumnValues.from_values(values)
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
-    debug_info = DebugInfo()
+    debug_info = score_metadata(metadata, config, compiled_config, metadata_scores)
 
     # Value Logic
     if prediction_factors_weights.get(VALUES, 0) > 0:
         values_score = 0.0
+        early_exit = get_early_exit(debug_info, config, options)
         try:
             if config[VALUES][PREDICTION_TYPE] == "regex":
-                values_score = match_regex_for_values(values, config[VALUES][REGEX])
+                values_score = score_regex_values(
+                    column_values,
+                    compiled_config.value_matcher,
+                    early_exit=early_exit,
+                )
             elif config[VALUES][PREDICTION_TYPE] == "library":
-                vin_score = 0
-                for val in values:
-                    try:
-                        # Vin constructor implicitly validates the VIN
-                        _ = Vin(val)
-                        vin_score += 1
-                    except Exception:
-                        pass
-                values_score = vin_score / len(values)
+                values_score = score_values(
+                    column_values.raw,
+                    get_validation_cache().cached(
+                        "Vehicle_Identification_Number",
+                        "vininfo.Vin",
+                        validate_each(is_valid_vin),
+                    ),
+                    early_exit=early_exit,
+                )
             else:
                 raise Exception(
                     f"Inappropriate values_prediction_type {config[VALUES][PREDICTION_TYPE]}"
@@ -475,32 +878,54 @@ def inspect_for_vehicle_identification_number(
         values_score = np.round(values_score, 2)
         debug_info.values = values_score
 
-    debug_info = compute_name_description_dtype_score(metadata, config, debug_info)
     confidence_level = compute_overall_confidence(debug_info, config)
     return confidence_level, debug_info
 
 
+def is_valid_ipv4_address(value: str) -> bool:
+    try:
+        _ = ipaddress.IPv4Address(value)
+        return True
+    except Exception:
+        return False
+
+
+@register_infotype("IP_Address_v4")
 def inspect_for_ip_address_v4(
-    metadata: Metadata, values: List[Any], config: Dict[str, Dict]
+    metadata: Metadata,
+    values: Union[List[Any], ColumnValues],
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    options: Optional[InspectionOptions] = None,
+    metadata_scores: Optional[DebugInfo] = None,
 ) -> Tuple[float, DebugInfo]:  # noqa: C901
+    if compiled_config is None:
+        compiled_config = CompiledInfotypeConfig.from_config(config)
+    column_values = ColumnValues.from_values(values)
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
-    debug_info = DebugInfo()
+    debug_info = score_metadata(metadata, config, compiled_config, metadata_scores)
 
     # Value Logic
     if prediction_factors_weights.get(VALUES, 0) > 0:
         values_score = 0.0
+        early_exit = get_early_exit(debug_info, config, options)
         try:
             if config[VALUES][PREDICTION_TYPE] == "regex":
-                values_score = match_regex_for_values(values, config[VALUES][REGEX])
+                values_score = score_regex_values(
+                    column_values,
+                    compiled_config.value_matcher,
+                    early_exit=early_exit,
+                )
             elif config[VALUES][PREDICTION_TYPE] == "library":
-                count = 0
-                for value in values:
-                    try:
-                        _ = ipaddress.IPv4Address(str(value))
-                        count = count + 1
-                    except Exception:
-                        pass
-                values_score = count / len(values)
+                values_score = score_values(
+                    column_values.strings,
+                    get_validation_cache().cached(
+                        "IP_Address_v4",
+                        "ipaddress.IPv4Address",
+                        validate_each(is_valid_ipv4_address),
+                    ),
+                    early_exit=early_exit,
+                )
             else:
                 raise Exception(
                     f"Inappropriate values_prediction_type {config[VALUES][PREDICTION_TYPE]}"
@@ -510,32 +935,54 @@ def inspect_for_ip_address_v4(
         values_score = np.round(values_score, 2)
         debug_info.values = values_score
 
-    debug_info = compute_name_description_dtype_score(metadata, config, debug_info)
     confidence_level = compute_overall_confidence(debug_info, config)
     return confidence_level, debug_info
 
 
+def is_valid_ipv6_address(value: str) -> bool:
+    try:
+        _ = ipaddress.IPv6Address(value)
+        return True
+    except Exception:
+        return False
+
+
+@register_infotype("IP_Address_v6")
 def inspect_for_ip_address_v6(
-    metadata: Metadata, values: List[Any], config: Dict[str, Dict]
+    metadata: Metadata,
+    values: Union[List[Any], ColumnValues],
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    options: Optional[InspectionOptions] = None,
+    metadata_scores: Optional[DebugInfo] = None,
 ) -> Tuple[float, DebugInfo]:  # noqa: C901
+    if compiled_config is None:
+        compiled_config = CompiledInfotypeConfig.from_config(config)
+    column_values = ColumnValues.from_values(values)
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
-    debug_info = DebugInfo()
+    debug_info = score_metadata(metadata, config, compiled_config, metadata_scores)
 
     # Value Logic
     if prediction_factors_weights.get(VALUES, 0) > 0:
         values_score = 0.0
+        early_exit = get_early_exit(debug_info, config, options)
         try:
             if config[VALUES][PREDICTION_TYPE] == "regex":
-                values_score = match_regex_for_values(values, config[VALUES][REGEX])
+                values_score = score_regex_values(
+                    column_values,
+                    compiled_config.value_matcher,
+                    early_exit=early_exit,
+                )
             elif config[VALUES][PREDICTION_TYPE] == "library":
-                count = 0
-                for value in values:
-                    try:
-                        _ = ipaddress.IPv6Address(str(value))
-                        count = count + 1
-                    except Exception:
-                        pass
-                values_score = count / len(values)
+                values_score = score_values(
+                    column_values.strings,
+                    get_validation_cache().cached(
+                        "IP_Address_v6",
+                        "ipaddress.IPv6Address",
+                        validate_each(is_valid_ipv6_address),
+                    ),
+                    early_exit=early_exit,
+                )
             else:
                 raise Exception(
                     f"Inappropriate values_prediction_type {config[VALUES][PREDICTION_TYPE]}"
@@ -545,23 +992,36 @@ def inspect_for_ip_address_v6(
         values_score = np.round(values_score, 2)
         debug_info.values = values_score
 
-    debug_info = compute_name_description_dtype_score(metadata, config, debug_info)
     confidence_level = compute_overall_confidence(debug_info, config)
     return confidence_level, debug_info
 
 
+@register_infotype("US_Driving_License_Number")
 def inspect_for_us_driving_license_number(
-    metadata: Metadata, values: List[Any], config: Dict[str, Dict]
+    metadata: Metadata,
+    values: Union[List[Any], ColumnValues],
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    options: Optional[InspectionOptions] = None,
+    metadata_scores: Optional[DebugInfo] = None,
 ) -> Tuple[float, DebugInfo]:
+    if compiled_config is None:
+        compiled_config = CompiledInfotypeConfig.from_config(config)
+    column_values = ColumnValues.from_values(values)
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
-    debug_info = DebugInfo()
+    debug_info = score_metadata(metadata, config, compiled_config, metadata_scores)
 
     # Value Logic
     if prediction_factors_weights.get(VALUES, 0) > 0:
         values_score = 0.0
+        early_exit = get_early_exit(debug_info, config, options)
         try:
             if config[VALUES][PREDICTION_TYPE] == "regex":
-                values_score = match_regex_for_values(values, config[VALUES][REGEX])
+                values_score = score_regex_values(
+                    column_values,
+                    compiled_config.value_matcher,
+                    early_exit=early_exit,
+                )
             elif config[VALUES][PREDICTION_TYPE] == "library":
                 raise Exception(
                     "Currently prediction type 'library' is not supported for "
@@ -576,32 +1036,53 @@ def inspect_for_us_driving_license_number(
         values_score = np.round(values_score, 2)
         debug_info.values = values_score
 
-    debug_info = compute_name_description_dtype_score(metadata, config, debug_info)
     confidence_level = compute_overall_confidence(debug_info, config)
     return confidence_level, debug_info
 
 
+def is_valid_us_ssn(value: Any) -> bool:
+    try:
+        return bool(us_ssn.is_valid(value))
+    except Exception:
+        return False
+
+
+@register_infotype("US_Social_Security_Number", libraries=("stdnum.us.ssn",))
 def inspect_for_us_social_security_number(
-    metadata: Metadata, values: List[Any], config: Dict[str, Dict]
+    metadata: Metadata,
+    values: Union[List[Any], ColumnValues],
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    options: Optional[InspectionOptions] = None,
+    metadata_scores: Optional[DebugInfo] = None,
 ) -> Tuple[float, DebugInfo]:  # noqa: C901
+    if compiled_config is None:
+        compiled_config = CompiledInfotypeConfig.from_config(config)
+    column_values = ColumnValues.from_values(values)
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
-    debug_info = DebugInfo()
+    debug_info = score_metadata(metadata, config, compiled_config, metadata_scores)
 
     # Value Logic
     if prediction_factors_weights.get(VALUES, 0) > 0:
         values_score = 0.0
+        early_exit = get_early_exit(debug_info, config, options)
         try:
             if config[VALUES][PREDICTION_TYPE] == "regex":
-                values_score = match_regex_for_values(values, config[VALUES][REGEX])
+                values_score = score_regex_values(
+                    column_values,
+                    compiled_config.value_matcher,
+                    early_exit=early_exit,
+                )
             elif config[VALUES][PREDICTION_TYPE] == "library":
-                us_ssn_score = 0
-                for val in values:
-                    try:
-                        if us_ssn.is_valid(val):
-                            us_ssn_score += 1
-                    except Exception:
-                        pass
-                values_score = us_ssn_score / len(values)
+                values_score = score_values(
+                    column_values.raw,
+                    get_validation_cache().cached(
+                        "US_Social_Security_Number",
+                        "stdnum.us.ssn",
+                        validate_each(is_valid_us_ssn),
+                    ),
+                    early_exit=early_exit,
+                )
             else:
                 raise Exception(
                     f"Inappropriate values_prediction_type {config[VALUES][PREDICTION_TYPE]}"
@@ -611,32 +1092,51 @@ def inspect_for_us_social_security_number(
         values_score = np.round(values_score, 2)
         debug_info.values = values_score
 
-    debug_info = compute_name_description_dtype_score(metadata, config, debug_info)
     confidence_level = compute_overall_confidence(debug_info, config)
     return confidence_level, debug_info
 
 
+def is_valid_swift_code(value: Any) -> bool:
+    try:
+        return bool(schwifty.BIC(value, allow_invalid=True).is_valid)
+    except Exception:
+        return False
+
+
+@register_infotype("Swift_Code", libraries=("schwifty",))
 def inspect_for_swift_code(
-    metadata: Metadata, values: List[Any], config: Dict[str, Dict]
+    metadata: Metadata,
+    values: Union[List[Any], ColumnValues],
+    config: Dict[str, Dict],
+    compiled_config: Optional[CompiledInfotypeConfig] = None,
+    options: Optional[InspectionOptions] = None,
+    metadata_scores: Optional[DebugInfo] = None,
 ) -> Tuple[float, DebugInfo]:  # noqa: C901
+    if compiled_config is None:
+        compiled_config = CompiledInfotypeConfig.from_config(config)
+    column_values = ColumnValues.from_values(values)
     prediction_factors_weights = config[PREDICTION_FACTORS_AND_WEIGHTS]
-    debug_info = DebugInfo()
+    debug_info = score_metadata(metadata, config, compiled_config, metadata_scores)
 
     # Value Logic
     if prediction_factors_weights.get(VALUES, 0) > 0:
         values_score = 0.0
+        early_exit = get_early_exit(debug_info, config, options)
         try:
             if config[VALUES][PREDICTION_TYPE] == "regex":
-                values_score = match_regex_for_values(values, config[VALUES][REGEX])
+                values_score = score_regex_values(
+                    column_values,
+                    compiled_config.value_matcher,
+                    early_exit=early_exit,
+                )
             elif config[VALUES][PREDICTION_TYPE] == "library":
-                swift_score = 0
-                for val in values:
-                    try:
-                        if BIC(val, allow_invalid=True).is_valid:
-                            swift_score += 1
-                    except Exception:
-                        pass
-                values_score = swift_score / len(values)
+                values_score = score_values(
+                    column_values.raw,
+                    get_validation_cache().cached(
+                        "Swift_Code", "schwifty.BIC", validate_each(is_valid_swift_code)
+                    ),
+                    early_exit=early_exit,
+                )
             else:
                 raise Exception(
                     f"Inappropriate values_prediction_type {config[VALUES][PREDICTION_TYPE]}"
@@ -646,6 +1146,5 @@ def inspect_for_swift_code(
         values_score = np.round(values_score, 2)
         debug_info.values = values_score
 
-    debug_info = compute_name_description_dtype_score(metadata, config, debug_info)
     confidence_level = compute_overall_confidence(debug_info, config)
     return confidence_level, debug_info
@@ -1,31 +1,796 @@
-import importlib
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import replace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-from datahub_classify.helper_classes import ColumnInfo, InfotypeProposal
-from datahub_classify.infotype_utils import perform_basic_checks
+from datahub_classify.classifier_plan import (  # noqa: F401
+    NAME_DEPENDENT_VALUES_INFOTYPES,
+    ClassifierPlan,
+    get_classifier_plan,
+    get_infotype_function_mapping,
+)
+from datahub_classify.constants import DATATYPE, DESCRIPTION, NAME
+from datahub_classify.helper_classes import (
+    BaseInfotypeProposal,
+    ColumnChanges,
+    ColumnInfo,
+    CompactInfotypeProposal,
+    InfotypeProposal,
+    InspectionOptions,
+    Metadata,
+)
+from datahub_classify.infotype_helper import (
+    MetadataScores,
+    compute_max_confidence,
+    compute_metadata_scores,
+    compute_name_description_dtype_score,
+    compute_overall_confidence,
+    score_metadata,
+)
+from datahub_classify.infotype_utils import LazyModule, perform_basic_checks
+from datahub_classify.result_cache import ClassificationResultCache, compute_column_key
+from datahub_classify.sample_store import SampleStore
+from datahub_classify.spacy_models import get_spacy_models
+from datahub_classify.stats import (
+    METADATA_STAGE,
+    ClassificationStats,
+    timed,
+    timed_column,
+)
+from datahub_classify.vectorized import (
+    NUMPY_BACKEND,
+    PYTHON_BACKEND,
+    normalize_column_values,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+else:
+    # only needed by predict_infotypes_table, installed by the "pandas" extra
+    pd = LazyModule("pandas", extra="pandas")
 
 logger = logging.getLogger(__name__)
 
 
-def get_infotype_function_mapping(
-    infotypes: Optional[List[str]], global_config: Dict[str, Dict]
-) -> Dict[str, Any]:
-    from inspect import getmembers, isfunction
-
-    module_name = "datahub_classify.infotype_helper"
-    module = importlib.import_module(module_name)
-    module_fn_dict = dict(getmembers(module, isfunction))
-    infotype_function_map = {}
-    if not infotypes:
-        infotypes = list(global_config.keys())
-    for infotype in infotypes:
-        if infotype not in global_config.keys():
-            logger.warning(f"Configuration is not available for infotype - {infotype}")
+def classify_column(
+    column_info: ColumnInfo,
+    confidence_level_threshold: float,
+    global_config: Dict[str, Dict],
+    classifier_plan: ClassifierPlan,
+    options: Optional[InspectionOptions] = None,
+    stats: Optional[ClassificationStats] = None,
+) -> bool:
+    """Populate infotype proposals of a single column.
+
+    Returns False if basic checks failed for any of the infotypes. If stats is
+    given, time spent per infotype and stage is recorded in it.
+    """
+    logger.debug(
+        f"processing column: {column_info.metadata.name} -- dataset: {column_info.metadata.dataset_name}"
+    )
+    basic_checks_passed = True
+    # normalize values once, all infotype functions share the same views
+    column_values = normalize_column_values(
+        column_info.values, options.backend if options else PYTHON_BACKEND
+    )
+    column_info.values = column_values.values
+    # iterate over all infotype functions, cheapest values prediction first
+    proposals: Dict[str, BaseInfotypeProposal] = {}
+    for infotype in classifier_plan.inspection_order:
+        infotype_fn = classifier_plan.infotype_function_map[infotype]
+        compiled_config = classifier_plan.compiled_configs[infotype]
+        # get the configuration
+        config_dict = global_config[infotype]
+
+        # call the infotype prediction function
+        try:
+            if not perform_basic_checks(
+                column_info.metadata, column_values.values, config_dict, infotype
+            ):
+                basic_checks_passed = False
+                continue
+            with timed(stats, infotype, METADATA_STAGE):
+                metadata_scores = score_metadata(
+                    column_info.metadata, config_dict, compiled_config
+                )
+                max_confidence_level = compute_max_confidence(
+                    column_info.metadata, config_dict, compiled_config, metadata_scores
+                )
+            if max_confidence_level <= confidence_level_threshold:
+                # metadata scores rule the infotype out, skip values inspection
+                continue
+            # the inspector reuses the metadata scores, so that the values stage
+            # is timed on its own
+            with timed(stats, infotype, classifier_plan.values_stages[infotype]):
+                confidence_level, debug_info = infotype_fn(
+                    column_info.metadata,
+                    column_values,
+                    config_dict,
+                    compiled_config,
+                    options,
+                    metadata_scores,
+                )
+            if confidence_level > confidence_level_threshold:
+                proposals[infotype] = InfotypeProposal(
+                    infotype, confidence_level, debug_info
+                )
+
+        except Exception as e:
+            # traceback.print_exc()
+            logger.warning(f"Failed to extract info type due to {e}")
+    column_info.infotype_proposals = _order_proposals(
+        proposals, classifier_plan, options
+    )
+    return basic_checks_passed
+
+
+def _order_proposals(
+    proposals: Dict[str, BaseInfotypeProposal],
+    classifier_plan: ClassifierPlan,
+    options: Optional[InspectionOptions] = None,
+) -> List[BaseInfotypeProposal]:
+    # keep proposals in configuration order
+    return _compact_proposals(
+        [
+            proposals[infotype]
+            for infotype in classifier_plan.infotype_function_map.keys()
+            if infotype in proposals
+        ],
+        options,
+    )
+
+
+def _compact_proposals(
+    proposals: List[BaseInfotypeProposal], options: Optional[InspectionOptions]
+) -> List[BaseInfotypeProposal]:
+    if options is None or not options.compact_results:
+        return proposals
+    return [CompactInfotypeProposal.from_proposal(proposal) for proposal in proposals]
+
+
+def reclassify_column(
+    column_info: ColumnInfo,
+    column_changes: ColumnChanges,
+    confidence_level_threshold: float,
+    global_config: Dict[str, Dict],
+    classifier_plan: ClassifierPlan,
+    options: Optional[InspectionOptions] = None,
+) -> bool:
+    """Update the infotype proposals of a column after column_changes.
+
+    column_info holds the current metadata and values, and the proposals
+    previously computed with the same threshold. Only the factor scores
+    affected by the changes are recomputed, values are inspected again only if
+    they changed or no previous values score can be reused.
+    """
+    if column_info.infotype_proposals is None:
+        return classify_column(
+            column_info,
+            confidence_level_threshold,
+            global_config,
+            classifier_plan,
+            options,
+        )
+    logger.debug(
+        f"reprocessing column: {column_info.metadata.name} -- dataset: {column_info.metadata.dataset_name}"
+    )
+    previous_proposals = {
+        proposal.infotype: proposal for proposal in column_info.infotype_proposals
+    }
+    changed_factors = [
+        factor
+        for factor in [NAME, DESCRIPTION, DATATYPE]
+        if factor in column_changes.metadata_fields
+    ]
+    basic_checks_passed = True
+    column_values = normalize_column_values(
+        column_info.values, options.backend if options else PYTHON_BACKEND
+    )
+    column_info.values = column_values.values
+    proposals: Dict[str, BaseInfotypeProposal] = {}
+    for infotype in classifier_plan.inspection_order:
+        compiled_config = classifier_plan.compiled_configs[infotype]
+        config_dict = global_config[infotype]
+        previous_proposal = previous_proposals.get(infotype)
+        config_changed = infotype in column_changes.changed_infotypes
+        try:
+            if not perform_basic_checks(
+                column_info.metadata, column_values.values, config_dict, infotype
+            ):
+                basic_checks_passed = False
+            elif not (
+                changed_factors or column_changes.values_changed or config_changed
+            ):
+                # nothing the infotype depends on changed
+                if previous_proposal is not None:
+                    proposals[infotype] = previous_proposal
+            elif (
+                compute_max_confidence(
+                    column_info.metadata, config_dict, compiled_config
+                )
+                <= confidence_level_threshold
+            ):
+                continue
+            elif (
+                previous_proposal is not None
+                and not column_changes.values_changed
+                and not config_changed
+                and not (
+                    options is not None
+                    and (options.early_exit or options.adaptive_sampling)
+                )
+                and not (
+                    NAME in changed_factors
+                    and infotype in NAME_DEPENDENT_VALUES_INFOTYPES
+                )
+                # a score of a sample of the values depends on when sampling
+                # stopped, which depends on the metadata scores
+                and not (
+                    previous_proposal.debug_info.values_consumed is not None
+                    and previous_proposal.debug_info.values_consumed
+                    < len(column_values.values)
+                )
+            ):
+                # reuse the previous values score, rescore changed metadata only
+                debug_info = compute_name_description_dtype_score(
+                    column_info.metadata,
+                    config_dict,
+                    replace(
+                        previous_proposal.debug_info,
+                        **{factor.lower(): None for factor in changed_factors},
+                    ),
+                    compiled_config,
+                    factors=changed_factors,
+                )
+                confidence_level = compute_overall_confidence(debug_info, config_dict)
+                if confidence_level > confidence_level_threshold:
+                    proposals[infotype] = InfotypeProposal(
+                        infotype, confidence_level, debug_info
+                    )
+            else:
+                confidence_level, debug_info = classifier_plan.infotype_function_map[
+                    infotype
+                ](
+                    column_info.metadata,
+                    column_values,
+                    config_dict,
+                    compiled_config,
+                    options,
+                )
+                if confidence_level > confidence_level_threshold:
+                    proposals[infotype] = InfotypeProposal(
+                        infotype, confidence_level, debug_info
+                    )
+        except Exception as e:
+            logger.warning(f"Failed to extract info type due to {e}")
+    column_info.infotype_proposals = _order_proposals(
+        proposals, classifier_plan, options
+    )
+    return basic_checks_passed
+
+
+def classify_column_cached(
+    column_info: ColumnInfo,
+    confidence_level_threshold: float,
+    global_config: Dict[str, Dict],
+    classifier_plan: ClassifierPlan,
+    options: Optional[InspectionOptions] = None,
+    result_cache: Optional[ClassificationResultCache] = None,
+    stats: Optional[ClassificationStats] = None,
+) -> bool:
+    """classify_column, reusing results stored in result_cache if given.
+
+    Values are dropped from column_info afterwards unless options keep them.
+    """
+    if result_cache is None:
+        basic_checks_passed = classify_column(
+            column_info,
+            confidence_level_threshold,
+            global_config,
+            classifier_plan,
+            options,
+            stats,
+        )
+    else:
+        column_key = compute_column_key(
+            column_info,
+            classifier_plan.config_fingerprint,
+            list(classifier_plan.infotype_function_map.keys()),
+            confidence_level_threshold,
+            options,
+        )
+        cached_result = result_cache.get(column_key)
+        if cached_result is not None:
+            column_info.values = normalize_column_values(
+                column_info.values, options.backend if options else PYTHON_BACKEND
+            ).values
+            cached_proposals, basic_checks_passed = cached_result
+            column_info.infotype_proposals = _compact_proposals(
+                cached_proposals, options
+            )
+        else:
+            basic_checks_passed = classify_column(
+                column_info,
+                confidence_level_threshold,
+                global_config,
+                classifier_plan,
+                options,
+                stats,
+            )
+            result_cache.put(
+                column_key, column_info.infotype_proposals or [], basic_checks_passed
+            )
+    if options is not None and not options.keep_values:
+        column_info.values = []
+    return basic_checks_passed
+
+
+# Per worker process state, set once by _init_worker so that the config, the
+# compiled classifier plan and the spaCy model are not shipped with every task
+_worker_context: Optional[
+    Tuple[
+        float,
+        Dict[str, Dict],
+        ClassifierPlan,
+        Optional[InspectionOptions],
+        Optional[ClassificationResultCache],
+    ]
+] = None
+
+
+def _init_worker(
+    confidence_level_threshold: float,
+    global_config: Dict[str, Dict],
+    infotypes: Optional[List[str]],
+    options: Optional[InspectionOptions],
+    result_cache: Optional[ClassificationResultCache],
+) -> None:
+    global _worker_context
+    classifier_plan = get_classifier_plan(global_config, infotypes)
+    if classifier_plan.requires_spacy:
+        get_spacy_models()
+    _worker_context = (
+        confidence_level_threshold,
+        global_config,
+        classifier_plan,
+        options,
+        result_cache,
+    )
+
+
+# values shipped back if they changed, whether the original values are to be
+# converted to a list instead, proposals, basic checks outcome and stats
+_ChunkResults = List[
+    Tuple[
+        Optional[Union[Sequence[Any], "np.ndarray"]],
+        bool,
+        Optional[List[BaseInfotypeProposal]],
+        bool,
+        Optional[ClassificationStats],
+    ]
+]
+
+
+def _classify_columns_in_worker(
+    column_infos: List[ColumnInfo], collect_stats: bool
+) -> _ChunkResults:
+    assert _worker_context is not None, "worker is not initialized"
+    return _classify_chunk(column_infos, _worker_context, collect_stats)
+
+
+def _classify_columns_in_executor(
+    column_infos: List[ColumnInfo],
+    confidence_level_threshold: float,
+    global_config: Dict[str, Dict],
+    infotypes: Optional[List[str]],
+    options: Optional[InspectionOptions],
+    result_cache: Optional[ClassificationResultCache],
+    collect_stats: bool,
+) -> _ChunkResults:
+    """_classify_columns_in_worker for executors not initialized by _init_worker."""
+    context = (
+        confidence_level_threshold,
+        global_config,
+        get_classifier_plan(global_config, infotypes),
+        options,
+        result_cache,
+    )
+    return _classify_chunk(column_infos, context, collect_stats)
+
+
+def _classify_chunk(
+    column_infos: List[ColumnInfo],
+    context: Tuple[
+        float,
+        Dict[str, Dict],
+        ClassifierPlan,
+        Optional[InspectionOptions],
+        Optional[ClassificationResultCache],
+    ],
+    collect_stats: bool,
+) -> _ChunkResults:
+    results = []
+    for column_info in column_infos:
+        original_values = column_info.values
+        column_stats = ClassificationStats(columns=1) if collect_stats else None
+        with timed_column(column_stats):
+            basic_checks_passed = classify_column_cached(
+                column_info, *context, stats=column_stats
+            )
+        values: Optional[Union[Sequence[Any], "np.ndarray"]] = None
+        values_as_list = False
+        if column_info.values is original_values:
+            # kept as they are, e.g. numeric arrays with the "numpy" backend
+            pass
+        elif len(column_info.values) == len(original_values):
+            # the same values in a list, the caller builds it from its own copy
+            values_as_list = True
         else:
-            fn_name = f"inspect_for_{infotype.lower()}"
-            infotype_function_map[infotype] = module_fn_dict[fn_name]
-    return infotype_function_map
+            # ship the values back only if null-like values, or all values
+            # with keep_values=False, were dropped
+            values = column_info.values
+        results.append(
+            (
+                values,
+                values_as_list,
+                column_info.infotype_proposals,
+                basic_checks_passed,
+                column_stats,
+            )
+        )
+    return results
+
+
+def _chunked(
+    column_infos: Iterable[ColumnInfo], chunk_size: int
+) -> Iterator[List[ColumnInfo]]:
+    chunk = []
+    for column_info in column_infos:
+        chunk.append(column_info)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _classify_columns_in_pool(
+    column_infos: Iterable[ColumnInfo],
+    confidence_level_threshold: float,
+    global_config: Dict[str, Dict],
+    infotypes: Optional[List[str]],
+    n_workers: int,
+    chunk_size: int,
+    max_pending_chunks: int,
+    options: Optional[InspectionOptions],
+    result_cache: Optional[ClassificationResultCache],
+    collect_stats: bool,
+) -> Iterator[Tuple[ColumnInfo, bool, Optional[ClassificationStats]]]:
+    if result_cache is not None:
+        result_cache.check_shareable()
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_worker,
+        initargs=(
+            confidence_level_threshold,
+            global_config,
+            infotypes,
+            options,
+            result_cache,
+        ),
+    ) as executor:
+        pending: Deque[Tuple[List[ColumnInfo], Future]] = deque()
+        try:
+            for chunk in _chunked(column_infos, chunk_size):
+                pending.append(
+                    (
+                        chunk,
+                        executor.submit(
+                            _classify_columns_in_worker, chunk, collect_stats
+                        ),
+                    )
+                )
+                # stop pulling input until the oldest chunk is consumed
+                while len(pending) >= max_pending_chunks:
+                    chunk, future = pending.popleft()
+                    yield from _collect_chunk(chunk, future.result())
+            while pending:
+                chunk, future = pending.popleft()
+                yield from _collect_chunk(chunk, future.result())
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def _collect_chunk(
+    chunk: List[ColumnInfo], results: _ChunkResults
+) -> Iterator[Tuple[ColumnInfo, bool, Optional[ClassificationStats]]]:
+    for column_info, (
+        values,
+        values_as_list,
+        proposal_list,
+        basic_checks_passed,
+        column_stats,
+    ) in zip(chunk, results):
+        if values is not None:
+            column_info.values = values
+        elif values_as_list:
+            column_info.values = list(column_info.values)
+        column_info.infotype_proposals = proposal_list
+        yield column_info, basic_checks_passed, column_stats
+
+
+def _prepare_classification(
+    confidence_level_threshold: float,
+    global_config: Dict[str, Dict],
+    infotypes: Optional[List[str]],
+    options: Optional[InspectionOptions],
+    load_spacy_models: bool,
+) -> Tuple[ClassifierPlan, Optional[InspectionOptions]]:
+    """Classifier plan and options of a classification run.
+
+    load_spacy_models is False when columns are classified by the workers of a
+    process pool, which load the spaCy model themselves.
+    """
+    classifier_plan = get_classifier_plan(global_config, infotypes)
+    if options is not None:
+        options = replace(
+            options, confidence_level_threshold=confidence_level_threshold
+        )
+    if load_spacy_models and classifier_plan.requires_spacy:
+        # fail fast on a missing spaCy model instead of failing every column
+        get_spacy_models()
+    return classifier_plan, options
+
+
+def _classify_columns(
+    column_infos: Iterable[ColumnInfo],
+    confidence_level_threshold: float,
+    global_config: Dict[str, Dict],
+    infotypes: Optional[List[str]],
+    n_workers: Optional[int],
+    chunk_size: int,
+    max_pending_chunks: Optional[int],
+    options: Optional[InspectionOptions],
+    result_cache: Optional[ClassificationResultCache],
+    collect_stats: bool = False,
+) -> Iterator[Tuple[ColumnInfo, bool, Optional[ClassificationStats]]]:
+    n_workers = n_workers or 1
+    classifier_plan, options = _prepare_classification(
+        confidence_level_threshold, global_config, infotypes, options, n_workers <= 1
+    )
+    if n_workers > 1:
+        yield from _classify_columns_in_pool(
+            column_infos,
+            confidence_level_threshold,
+            global_config,
+            infotypes,
+            n_workers,
+            chunk_size,
+            max_pending_chunks or 2 * n_workers,
+            options,
+            result_cache,
+            collect_stats,
+        )
+    else:
+        for column_info in column_infos:
+            column_stats = ClassificationStats(columns=1) if collect_stats else None
+            with timed_column(column_stats):
+                basic_checks_passed = classify_column_cached(
+                    column_info,
+                    confidence_level_threshold,
+                    global_config,
+                    classifier_plan,
+                    options,
+                    result_cache,
+                    column_stats,
+                )
+            yield column_info, basic_checks_passed, column_stats
+
+
+def _collect_stats(
+    results: Iterator[Tuple[ColumnInfo, bool, Optional[ClassificationStats]]],
+    stats: Optional[ClassificationStats],
+    on_column_stats: Optional[Callable[[ColumnInfo, ClassificationStats], None]],
+) -> Iterator[Tuple[ColumnInfo, bool]]:
+    for column_info, basic_checks_passed, column_stats in results:
+        if column_stats is not None:
+            if stats is not None:
+                stats.merge(column_stats)
+            if on_column_stats is not None:
+                on_column_stats(column_info, column_stats)
+        yield column_info, basic_checks_passed
+
+
+def predict_infotypes_stream(
+    column_infos: Iterable[ColumnInfo],
+    confidence_level_threshold: float,
+    global_config: Dict[str, Dict],
+    infotypes: Optional[List[str]] = None,
+    n_workers: Optional[int] = None,
+    chunk_size: int = 16,
+    max_pending_chunks: Optional[int] = None,
+    options: Optional[InspectionOptions] = None,
+    result_cache: Optional[ClassificationResultCache] = None,
+    stats: Optional[ClassificationStats] = None,
+    on_column_stats: Optional[Callable[[ColumnInfo, ClassificationStats], None]] = None,
+) -> Iterator[ColumnInfo]:
+    """Streaming counterpart of predict_infotypes.
+
+    Columns are pulled from column_infos lazily and yielded, in input order, as
+    soon as they are classified. With n_workers > 1 at most max_pending_chunks
+    chunks of chunk_size columns (default 2 chunks per worker) are in flight,
+    input is not consumed any further until the caller takes the next result.
+    """
+    for column_info, basic_checks_passed in _collect_stats(
+        _classify_columns(
+            column_infos,
+            confidence_level_threshold,
+            global_config,
+            infotypes,
+            n_workers,
+            chunk_size,
+            max_pending_chunks,
+            options,
+            result_cache,
+            stats is not None or on_column_stats is not None,
+        ),
+        stats,
+        on_column_stats,
+    ):
+        if not basic_checks_passed:
+            logger.debug(
+                f"Basic Checks failed for column {column_info.metadata.name} -- dataset: {column_info.metadata.dataset_name}"
+            )
+        yield column_info
+
+
+async def _chunked_async(
+    column_infos: Union[AsyncIterable[ColumnInfo], Iterable[ColumnInfo]],
+    chunk_size: int,
+) -> AsyncIterator[List[ColumnInfo]]:
+    if not isinstance(column_infos, AsyncIterable):
+        for chunk in _chunked(column_infos, chunk_size):
+            yield chunk
+        return
+    chunk = []
+    async for column_info in column_infos:
+        chunk.append(column_info)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def predict_infotypes_async(
+    column_infos: Union[AsyncIterable[ColumnInfo], Iterable[ColumnInfo]],
+    confidence_level_threshold: float,
+    global_config: Dict[str, Dict],
+    infotypes: Optional[List[str]] = None,
+    n_workers: Optional[int] = None,
+    chunk_size: int = 1,
+    max_pending_chunks: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    options: Optional[InspectionOptions] = None,
+    result_cache: Optional[ClassificationResultCache] = None,
+    stats: Optional[ClassificationStats] = None,
+    on_column_stats: Optional[Callable[[ColumnInfo, ClassificationStats], None]] = None,
+) -> AsyncIterator[ColumnInfo]:
+    """Asynchronous counterpart of predict_infotypes_stream.
+
+    column_infos may be an async iterable, e.g. fed by async sample fetchers.
+    Columns are classified in chunks of chunk_size by executor, or by a process
+    pool of n_workers (default 1) processes managed by this function, so the
+    event loop keeps running meanwhile. At most max_pending_chunks chunks
+    (default 2 per worker) are in flight or waiting for the caller, input is
+    not pulled any further until the caller takes the next result. Results are
+    yielded in input order.
+    """
+    loop = asyncio.get_running_loop()
+    _, options = await loop.run_in_executor(
+        None,
+        _prepare_classification,
+        confidence_level_threshold,
+        global_config,
+        infotypes,
+        options,
+        # workers of the managed pool load it in _init_worker, executors given
+        # by the caller may be threads of this process
+        executor is not None,
+    )
+    collect_stats = stats is not None or on_column_stats is not None
+    managed_executor = None
+    if executor is None:
+        if result_cache is not None:
+            result_cache.check_shareable()
+        # workers of a managed pool get the plan and result cache only once
+        executor = managed_executor = ProcessPoolExecutor(
+            max_workers=n_workers or 1,
+            initializer=_init_worker,
+            initargs=(
+                confidence_level_threshold,
+                global_config,
+                infotypes,
+                options,
+                result_cache,
+            ),
+        )
+    slots = asyncio.Semaphore(max_pending_chunks or 2 * (n_workers or 1))
+    pending: "asyncio.Queue[Optional[Tuple[List[ColumnInfo], asyncio.Future]]]" = (
+        asyncio.Queue()
+    )
+
+    async def submit_chunks() -> None:
+        try:
+            async for chunk in _chunked_async(column_infos, chunk_size):
+                await slots.acquire()
+                if managed_executor is not None:
+                    future = loop.run_in_executor(
+                        executor, _classify_columns_in_worker, chunk, collect_stats
+                    )
+                else:
+                    future = loop.run_in_executor(
+                        executor,
+                        _classify_columns_in_executor,
+                        chunk,
+                        confidence_level_threshold,
+                        global_config,
+                        infotypes,
+                        options,
+                        result_cache,
+                        collect_stats,
+                    )
+                pending.put_nowait((chunk, future))
+        finally:
+            pending.put_nowait(None)
+
+    producer = asyncio.ensure_future(submit_chunks())
+    try:
+        while True:
+            item = await pending.get()
+            if item is None:
+                # raise errors of the input, if any
+                await producer
+                break
+            chunk, future = item
+            results = await future
+            slots.release()
+            for column_info, basic_checks_passed in _collect_stats(
+                _collect_chunk(chunk, results), stats, on_column_stats
+            ):
+                if not basic_checks_passed:
+                    logger.debug(
+                        f"Basic Checks failed for column {column_info.metadata.name} -- dataset: {column_info.metadata.dataset_name}"
+                    )
+                yield column_info
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+        while not pending.empty():
+            item = pending.get_nowait()
+            if item is not None:
+                item[1].cancel()
+        if managed_executor is not None:
+            managed_executor.shutdown(wait=False)
 
 
 def predict_infotypes(
@@ -33,52 +798,47 @@ def predict_infotypes(
     confidence_level_threshold: float,
     global_config: Dict[str, Dict],
     infotypes: Optional[List[str]] = None,
+    n_workers: Optional[int] = None,
+    options: Optional[InspectionOptions] = None,
+    result_cache: Optional[ClassificationResultCache] = None,
+    stats: Optional[ClassificationStats] = None,
+    on_column_stats: Optional[Callable[[ColumnInfo, ClassificationStats], None]] = None,
 ) -> List[ColumnInfo]:
-    infotype_function_map = get_infotype_function_mapping(infotypes, global_config)
+    """Populate infotype proposals of column_infos.
+
+    If stats is given, time spent per infotype and stage (metadata scoring and
+    regex, library or spaCy values inspection) is accumulated in it across all
+    columns. on_column_stats, if given, is called with the stats of each column
+    as soon as it is classified. Neither is collected when both are None.
+    """
     logger.debug(f"Total columns to be processed --> {len(column_infos)}")
     logger.debug(f"Confidence Level Threshold set to --> {confidence_level_threshold}")
     logger.debug("===========================================================")
     basic_checks_failed_columns = []
     num_cols_with_infotype_assigned = 0
-    for column_info in column_infos:
-        logger.debug(
-            f"processing column: {column_info.metadata.name} -- dataset: {column_info.metadata.dataset_name}"
-        )
-        # iterate over all infotype functions
-        proposal_list = []
-        for infotype, infotype_fn in infotype_function_map.items():
-            # get the configuration
-            config_dict = global_config[infotype]
-
-            # call the infotype prediction function
-            column_info.values = [
-                val
-                for val in column_info.values
-                if str(val).strip() not in ["nan", "", "None"]
-            ]
-            try:
-                if perform_basic_checks(
-                    column_info.metadata, column_info.values, config_dict, infotype
-                ):
-                    confidence_level, debug_info = infotype_fn(
-                        column_info.metadata, column_info.values, config_dict
-                    )
-                    if confidence_level > confidence_level_threshold:
-                        infotype_proposal = InfotypeProposal(
-                            infotype, confidence_level, debug_info
-                        )
-                        proposal_list.append(infotype_proposal)
-                else:
-                    basic_checks_failed_columns.append(
-                        (column_info.metadata.name, column_info.metadata.dataset_name)
-                    )
-
-            except Exception as e:
-                # traceback.print_exc()
-                logger.warning(f"Failed to extract info type due to {e}")
-        if len(proposal_list) > 0:
+    chunk_size = max(1, len(column_infos) // ((n_workers or 1) * 4))
+    for column_info, basic_checks_passed in _collect_stats(
+        _classify_columns(
+            column_infos,
+            confidence_level_threshold,
+            global_config,
+            infotypes,
+            n_workers,
+            chunk_size,
+            None,
+            options,
+            result_cache,
+            stats is not None or on_column_stats is not None,
+        ),
+        stats,
+        on_column_stats,
+    ):
+        if not basic_checks_passed:
+            basic_checks_failed_columns.append(
+                (column_info.metadata.name, column_info.metadata.dataset_name)
+            )
+        if column_info.infotype_proposals:
             num_cols_with_infotype_assigned += 1
-        column_info.infotype_proposals = proposal_list
     if len(basic_checks_failed_columns) > 0:
         basic_checks_failed_columns_set = set(basic_checks_failed_columns)
         logger.warning(
@@ -92,3 +852,183 @@ def predict_infotypes(
     )
 
     return column_infos
+
+
+def score_column_metadata(
+    column_metadata: Iterable[Union[ColumnInfo, Metadata]],
+    global_config: Dict[str, Dict],
+    infotypes: Optional[List[str]] = None,
+) -> MetadataScores:
+    """Score the name, description and datatype of many columns in one pass.
+
+    Returns (columns x infotypes) score matrices, without inspecting values nor
+    running basic checks. Columns whose max_confidence is at most the
+    confidence level threshold for every infotype get no proposal from
+    predict_infotypes, whatever their values, so there is no need to sample them.
+    """
+    metadata_list = [
+        metadata.metadata if isinstance(metadata, ColumnInfo) else metadata
+        for metadata in column_metadata
+    ]
+    return compute_metadata_scores(
+        metadata_list, global_config, get_classifier_plan(global_config, infotypes)
+    )
+
+
+def predict_infotypes_incremental(
+    column_infos: List[ColumnInfo],
+    column_changes: List[ColumnChanges],
+    confidence_level_threshold: float,
+    global_config: Dict[str, Dict],
+    infotypes: Optional[List[str]] = None,
+    options: Optional[InspectionOptions] = None,
+) -> List[ColumnInfo]:
+    """Update previous predict_infotypes results after changes to the columns.
+
+    column_infos carry the previous infotype_proposals along with the current
+    metadata and values, column_changes lists what changed for each of them.
+    confidence_level_threshold must be the one used for the previous results.
+    """
+    classifier_plan = get_classifier_plan(global_config, infotypes)
+    if options is not None:
+        options = replace(
+            options, confidence_level_threshold=confidence_level_threshold
+        )
+    for column_info, changes in zip(column_infos, column_changes):
+        if not reclassify_column(
+            column_info,
+            changes,
+            confidence_level_threshold,
+            global_config,
+            classifier_plan,
+            options,
+        ):
+            logger.debug(
+                f"Basic Checks failed for column {column_info.metadata.name} -- dataset: {column_info.metadata.dataset_name}"
+            )
+    return column_infos
+
+
+# columns of the results table returned by predict_infotypes_table
+TABLE_RESULT_COLUMNS = [
+    "column_name",
+    "infotype",
+    "confidence_level",
+    "name",
+    "description",
+    "datatype",
+    "values",
+]
+
+
+def predict_infotypes_from_store(
+    sample_store: SampleStore,
+    confidence_level_threshold: float,
+    global_config: Dict[str, Dict],
+    infotypes: Optional[List[str]] = None,
+    n_workers: Optional[int] = None,
+    chunk_size: int = 16,
+    max_pending_chunks: Optional[int] = None,
+    options: Optional[InspectionOptions] = None,
+    result_cache: Optional[ClassificationResultCache] = None,
+    stats: Optional[ClassificationStats] = None,
+    on_column_stats: Optional[Callable[[ColumnInfo, ClassificationStats], None]] = None,
+) -> Iterator[ColumnInfo]:
+    """predict_infotypes_stream over the columns of a memory-mapped sample store.
+
+    Values are read from the store without copying and only the columns being
+    classified are in memory. Unless options say otherwise, values are scored
+    with the "numpy" backend and dropped once the column is classified, so
+    that memory use does not grow with the size of the store.
+    """
+    if options is None:
+        options = InspectionOptions(backend=NUMPY_BACKEND, keep_values=False)
+    return predict_infotypes_stream(
+        sample_store.column_infos(),
+        confidence_level_threshold,
+        global_config,
+        infotypes,
+        n_workers,
+        chunk_size,
+        max_pending_chunks,
+        options,
+        result_cache,
+        stats,
+        on_column_stats,
+    )
+
+
+def _iter_table_columns(table: Any) -> Iterator[Tuple[str, "np.ndarray"]]:
+    """Non-null values of each column of a pandas DataFrame or an Arrow table.
+
+    Column buffers are read without copying wherever NumPy can view them, i.e.
+    for numeric columns without nulls.
+    """
+    if isinstance(table, pd.DataFrame):
+        for column_name in table.columns:
+            series = table[column_name]
+            if series.hasnans:
+                series = series.dropna()
+            yield str(column_name), series.to_numpy()
+    elif hasattr(table, "column_names") and hasattr(table, "column"):
+        # pyarrow.Table, pyarrow is not a dependency of this package
+        for column_name in table.column_names:
+            column = table.column(column_name)
+            if column.null_count:
+                column = column.drop_null()
+            yield column_name, column.to_numpy()
+    else:
+        raise TypeError(
+            f"Expected a pandas DataFrame or an Arrow table, got {type(table)}"
+        )
+
+
+def predict_infotypes_table(
+    table: Any,
+    confidence_level_threshold: float,
+    global_config: Dict[str, Dict],
+    column_metadata: Optional[Dict[str, Dict[str, Any]]] = None,
+    infotypes: Optional[List[str]] = None,
+    options: Optional[InspectionOptions] = None,
+) -> "pd.DataFrame":
+    """Classify all columns of a pandas DataFrame or an Arrow table.
+
+    column_metadata maps column names to their metadata ("Description",
+    "Datatype", "Dataset_Name"), "Name" defaults to the column name. Values are
+    scored with the "numpy" backend unless options say otherwise. Returns one
+    row per infotype proposal, with the columns in TABLE_RESULT_COLUMNS.
+
+    Requires pandas, installed by the "pandas" extra of this package.
+    """
+    column_metadata = column_metadata or {}
+    if options is None:
+        options = InspectionOptions(backend=NUMPY_BACKEND)
+    column_infos = (
+        ColumnInfo(
+            Metadata({"Name": column_name, **column_metadata.get(column_name, {})}),
+            values,
+        )
+        for column_name, values in _iter_table_columns(table)
+    )
+    rows = []
+    for column_info in predict_infotypes_stream(
+        column_infos,
+        confidence_level_threshold,
+        global_config,
+        infotypes,
+        options=options,
+    ):
+        for proposal in column_info.infotype_proposals or []:
+            debug_info = proposal.debug_info
+            rows.append(
+                (
+                    column_info.metadata.name,
+                    proposal.infotype,
+                    float(proposal.confidence_level),
+                    debug_info.name,
+                    debug_info.description,
+                    debug_info.datatype,
+                    debug_info.values,
+                )
+            )
+    return pd.DataFrame.from_records(rows, columns=TABLE_RESULT_COLUMNS)
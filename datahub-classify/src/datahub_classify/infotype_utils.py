@@ -1,40 +1,332 @@
+import importlib
 import logging
+import math
+import random
 import re
-from typing import Any, Dict, List, Optional
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Set,
+    Sized,
+    Tuple,
+)
 
 from datahub_classify.constants import PREDICTION_FACTORS_AND_WEIGHTS, VALUES
-from datahub_classify.helper_classes import Metadata
+from datahub_classify.helper_classes import DebugInfo, Metadata
 
 logger = logging.getLogger(__name__)
 
 
+class LazyModule:
+    """Module imported on first attribute access.
+
+    Attributes are cached on the instance once looked up, so later lookups cost
+    the same as on the module itself. extra names the package extra installing
+    an optional dependency, for the error raised if it is missing.
+    """
+
+    def __init__(self, name: str, extra: Optional[str] = None) -> None:
+        self._name = name
+        self._extra = extra
+
+    def __getattr__(self, attr: str) -> Any:
+        try:
+            module = importlib.import_module(self._name)
+        except ImportError as e:
+            if self._extra is None:
+                raise
+            raise ImportError(
+                f"{self._name} is not installed, install it with "
+                f'pip install "acryl-datahub-classify[{self._extra}]"'
+            ) from e
+        value = getattr(module, attr)
+        setattr(self, attr, value)
+        return value
+
+
+class CompiledNamePattern(NamedTuple):
+    pattern: str
+    cleaned_pattern: str
+    regex: Optional[Pattern]
+
+
+# Compile regex for Name and Description
+def compile_name_patterns(regex_list: List[str]) -> List[CompiledNamePattern]:
+    compiled_patterns = []
+    for pattern in regex_list:
+        # TODO: evaluate a case if [A-Za-z] is present in the pattern then it will not give any error,
+        # TODO: are there any other cases like above?
+        pattern = pattern.lower()
+        cleaned_pattern = "".join(e for e in pattern if e.isalpha())
+        regex: Optional[Pattern]
+        try:
+            regex = re.compile(pattern)
+        except Exception as e:
+            logger.error(f"Column Name matching failed due to: {e}")
+            regex = None
+        compiled_patterns.append(CompiledNamePattern(pattern, cleaned_pattern, regex))
+    return compiled_patterns
+
+
 # TODO: Exception handling
-# Match regex for Name and Description
-def match_regex(text_to_match: str, regex_list: List[str]) -> float:
+# Match compiled regex for Name and Description
+def match_compiled_regex(
+    text_to_match: str, compiled_patterns: List[CompiledNamePattern]
+) -> float:
     original_text = text_to_match.lower()
     cleaned_text = "".join(e for e in original_text if e.isalpha())
     match_score: float = 0
-    for pattern in regex_list:
-        try:
-            # TODO: evaluate a case if [A-Za-z] is present in the pattern then it will not give any error,
-            # TODO: are there any other cases like above?
-            pattern = pattern.lower()
+    for pattern, cleaned_pattern, regex in compiled_patterns:
+        if cleaned_pattern == cleaned_text:
+            match_score = 1
+            break
+        if regex is None:
+            # pattern failed to compile, the error is logged by compile_name_patterns
+            continue
+        if regex.fullmatch(original_text):
+            match_score = 1
+            break
+        # elif re.match(pattern,cleaned_text):  ## revisit later
+        #     match_score = 1
+        #     break
+        elif pattern in original_text:
+            match_score = 0.65
+        else:
+            pass
+    return match_score
+
+
+# Match regex for Name and Description
+def match_regex(text_to_match: str, regex_list: List[str]) -> float:
+    return match_compiled_regex(text_to_match, compile_name_patterns(regex_list))
+
+
+NAME_MATCH_CACHE_SIZE = 10000
+# a literal keyword, or a group of alternative literal keywords like "(num|no)"
+_KEYWORD_RE = re.compile(r"[a-z0-9_ ]+")
+_KEYWORD_GROUP_RE = re.compile(r"\(([a-z0-9_ ]+(?:\|[a-z0-9_ ]+)*)\)")
+
+
+class KeywordPattern(NamedTuple):
+    """Pattern like "^.*card.*number.*$": keywords in order, separated by ".*"."""
+
+    # alternative keywords of each position
+    keywords: Tuple[Tuple[str, ...], ...]
+    anchored_start: bool
+    anchored_end: bool
+    regex: Pattern
+
+
+def parse_keyword_pattern(pattern: str, regex: Pattern) -> Optional[KeywordPattern]:
+    """KeywordPattern equivalent to the lowercased pattern, None if there is none."""
+    if pattern.startswith("^"):
+        pattern = pattern[1:]
+    if pattern.endswith("$") and not pattern.endswith("\\$"):
+        pattern = pattern[:-1]
+    parts = pattern.split(".*")
+    keywords = []
+    for part in parts:
+        if not part:
+            continue
+        if _KEYWORD_RE.fullmatch(part):
+            keywords.append((part,))
+            continue
+        group_match = _KEYWORD_GROUP_RE.fullmatch(part)
+        if group_match is None:
+            return None
+        keywords.append(tuple(group_match.group(1).split("|")))
+    anchored_start = parts[0] != ""
+    anchored_end = parts[-1] != ""
+    if (
+        not keywords
+        or (anchored_start and len(keywords[0]) > 1)
+        or (anchored_end and len(keywords[-1]) > 1)
+    ):
+        return None
+    return KeywordPattern(tuple(keywords), anchored_start, anchored_end, regex)
+
+
+def _trie_to_regex(node: Dict[str, Any]) -> str:
+    branches = [
+        re.escape(char) + _trie_to_regex(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    regex = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    # greedy, so that the longest keyword is matched
+    return f"(?:{regex})?" if "" in node else regex
+
+
+def compile_keyword_scanner(keywords: Iterable[str]) -> Pattern:
+    """Regex finding the longest of keywords starting at each position of a text.
+
+    Keywords are folded into a trie, so that each position is matched in time
+    proportional to the keyword length rather than the number of keywords.
+    """
+    trie: Dict[str, Any] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = True
+    if not trie:
+        # never matches, rather than matching "" everywhere
+        return re.compile("(?!)")
+    return re.compile(f"(?=({_trie_to_regex(trie)}))")
+
+
+class NamePatternMatcher:
+    """Scores a text against the Name (or Description) patterns of many infotypes.
+
+    Gives the same score as match_compiled_regex for each infotype, with one
+    scan of the text: a keyword scanner finds every pattern occurring in the
+    text, as well as the keywords of patterns like "^.*card.*number.*$", which
+    are then matched without running their regex. Only other patterns are
+    matched by regex, once each even if shared by several infotypes. Scores are
+    cached by text, since the same column names show up in many datasets.
+    """
+
+    def __init__(
+        self,
+        regex_lists: Dict[str, List[str]],
+        cache_size: int = NAME_MATCH_CACHE_SIZE,
+    ) -> None:
+        patterns: Dict[str, Set[str]] = {}
+        for infotype, regex_list in regex_lists.items():
+            for pattern in regex_list:
+                patterns.setdefault(pattern.lower(), set()).add(infotype)
+
+        # infotypes by cleaned pattern, by pattern found in the text (for partial
+        # matches) and by first keyword of keyword patterns
+        self._cleaned_patterns: Dict[str, Set[str]] = {}
+        self._substring_patterns: Dict[str, FrozenSet[str]] = {}
+        self._keyword_patterns: Dict[
+            str, List[Tuple[KeywordPattern, FrozenSet[str]]]
+        ] = {}
+        self._regex_patterns: List[Tuple[Pattern, FrozenSet[str]]] = []
+        # infotypes of a "" pattern, a partial match of any text
+        self._empty_pattern_infotypes: FrozenSet[str] = frozenset()
+        keywords = set()
+        for pattern, pattern_infotypes in patterns.items():
+            infotypes = frozenset(pattern_infotypes)
             cleaned_pattern = "".join(e for e in pattern if e.isalpha())
-            if (cleaned_pattern == cleaned_text) or (
-                re.fullmatch(pattern, original_text)
-            ):
-                match_score = 1
-                break
-            # elif re.match(pattern,cleaned_text):  ## revisit later
-            #     match_score = 1
-            #     break
-            elif pattern in original_text:
-                match_score = 0.65
+            self._cleaned_patterns.setdefault(cleaned_pattern, set()).update(infotypes)
+            try:
+                regex = re.compile(pattern)
+            except Exception as e:
+                logger.error(f"Column Name matching failed due to: {e}")
+                continue
+            if pattern:
+                self._substring_patterns[pattern] = infotypes
+                keywords.add(pattern)
             else:
-                pass
-        except Exception as e:
-            logger.error(f"Column Name matching failed due to: {e}")
-    return match_score
+                self._empty_pattern_infotypes |= infotypes
+            keyword_pattern = parse_keyword_pattern(pattern, regex)
+            if keyword_pattern is None:
+                self._regex_patterns.append((regex, infotypes))
+                continue
+            for alternatives in keyword_pattern.keywords:
+                keywords.update(alternatives)
+            for keyword in keyword_pattern.keywords[0]:
+                self._keyword_patterns.setdefault(keyword, []).append(
+                    (keyword_pattern, infotypes)
+                )
+
+        self._keyword_scanner = compile_keyword_scanner(keywords)
+        # the scanner only reports the longest keyword at each position, the
+        # other keywords starting there are its prefixes
+        self._keyword_prefixes = {
+            keyword: [
+                keyword[:i]
+                for i in range(1, len(keyword) + 1)
+                if keyword[:i] in keywords
+            ]
+            for keyword in keywords
+        }
+        self.cache_size = cache_size
+        self._cache: Dict[str, Dict[str, float]] = {}
+
+    def match(self, text: str) -> Dict[str, float]:
+        """Scores of the infotypes whose patterns match text at least partially."""
+        scores = self._cache.get(text)
+        if scores is None:
+            scores = self._match(text)
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[text] = scores
+        return scores
+
+    def _match(self, text: str) -> Dict[str, float]:
+        original_text = text.lower()
+        cleaned_text = "".join(e for e in original_text if e.isalpha())
+        full_matches = set(self._cleaned_patterns.get(cleaned_text, ()))
+
+        keyword_starts: Dict[str, List[int]] = {}
+        for match in self._keyword_scanner.finditer(original_text):
+            for keyword in self._keyword_prefixes[match.group(1)]:
+                keyword_starts.setdefault(keyword, []).append(match.start())
+
+        partial_matches = set(self._empty_pattern_infotypes)
+        for keyword in keyword_starts:
+            partial_matches.update(self._substring_patterns.get(keyword, ()))
+            for keyword_pattern, infotypes in self._keyword_patterns.get(keyword, ()):
+                if not infotypes <= full_matches and (
+                    # "." does not match newlines, leave those to the regex
+                    keyword_pattern.regex.fullmatch(original_text)
+                    if "\n" in original_text
+                    else _match_keywords(keyword_pattern, original_text, keyword_starts)
+                ):
+                    full_matches |= infotypes
+        for regex, infotypes in self._regex_patterns:
+            if not infotypes <= full_matches and regex.fullmatch(original_text):
+                full_matches |= infotypes
+
+        scores: Dict[str, float] = {infotype: 0.65 for infotype in partial_matches}
+        scores.update((infotype, 1) for infotype in full_matches)
+        return scores
+
+    def score(self, text: str, infotype: str) -> float:
+        return self.match(text).get(infotype, 0)
+
+
+def _match_keywords(
+    keyword_pattern: KeywordPattern, text: str, keyword_starts: Dict[str, List[int]]
+) -> bool:
+    # earliest ends of each keyword in turn leave the most room for the next one
+    position = 0
+    last = len(keyword_pattern.keywords) - 1
+    for i, alternatives in enumerate(keyword_pattern.keywords):
+        if i == 0 and keyword_pattern.anchored_start:
+            if not text.startswith(alternatives[0]):
+                return False
+            position = len(alternatives[0])
+        elif i == last and keyword_pattern.anchored_end:
+            start = len(text) - len(alternatives[0])
+            if start < position or not text.endswith(alternatives[0]):
+                return False
+            position = len(text)
+        else:
+            ends = []
+            for keyword in alternatives:
+                starts = keyword_starts.get(keyword, [])
+                j = bisect_left(starts, position)
+                if j < len(starts):
+                    ends.append(starts[j] + len(keyword))
+            if not ends:
+                return False
+            position = min(ends)
+    return not keyword_pattern.anchored_end or position == len(text)
 
 
 # Match data type
@@ -48,26 +340,81 @@ def match_datatype(dtype_to_match: str, dtype_list: List[str]) -> int:
     return match_score
 
 
-# Match regex for values
-def match_regex_for_values(values: List[Any], regex_list: List[str]) -> float:
-    values_score_list = []
-    length_values = len(values)
-    values = [str(x).lower() for x in values]
+# Compile regex for values
+def compile_value_patterns(regex_list: List[str]) -> List[Pattern]:
+    compiled_patterns = []
     for pattern in regex_list:
         try:
-            r = re.compile(pattern)
-            matches = list(filter(r.fullmatch, values))
-            values = [val for val in values if val not in matches]
-            values_score_list.append(len(matches))
-            if len(values) == 0:
-                break
+            compiled_patterns.append(re.compile(pattern))
         except Exception as e:
-            # TODO: print the exception for debugging purpose
             logger.error(f"Regex match for values failed due to: {e}", exc_info=e)
-    values_score = sum(values_score_list) / length_values
+    return compiled_patterns
+
+
+# backreferences and inline flags change meaning once patterns are joined together
+_UNCOMBINABLE_PATTERN_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?[aiLmsux]")
+
+
+class ValuePatternMatcher:
+    """Checks a value against all value patterns of an infotype in one pass.
+
+    Patterns are folded into a single alternation so that each value is
+    scanned once by the regex engine. Patterns which cannot be safely combined
+    (backreferences, inline flags, custom compile flags) are checked one by one
+    after the combined regex.
+    """
+
+    def __init__(self, patterns: List[Pattern]) -> None:
+        self.patterns = patterns
+        combinable = []
+        self.standalone_patterns: List[Pattern] = []
+        for pattern in patterns:
+            if pattern.flags == re.UNICODE and not _UNCOMBINABLE_PATTERN_RE.search(
+                pattern.pattern
+            ):
+                combinable.append(pattern)
+            else:
+                self.standalone_patterns.append(pattern)
+        self.combined_pattern: Optional[Pattern] = None
+        if combinable:
+            try:
+                self.combined_pattern = re.compile(
+                    "|".join(f"(?:{pattern.pattern})" for pattern in combinable)
+                )
+            except re.error:
+                self.standalone_patterns = patterns
+
+    def fullmatch(self, value: str) -> bool:
+        if self.combined_pattern is not None and self.combined_pattern.fullmatch(value):
+            return True
+        return any(pattern.fullmatch(value) for pattern in self.standalone_patterns)
+
+
+def compile_value_matcher(regex_list: List[str]) -> ValuePatternMatcher:
+    return ValuePatternMatcher(compile_value_patterns(regex_list))
+
+
+# Count values matching compiled regex, values are expected to be lowercased already
+def count_value_matches(
+    lowered_values: List[str], value_matcher: ValuePatternMatcher
+) -> int:
+    return sum(1 for value in lowered_values if value_matcher.fullmatch(value))
+
+
+# Match compiled regex for values
+def match_compiled_regex_for_values(
+    values: List[Any], value_matcher: ValuePatternMatcher
+) -> float:
+    lowered_values = [str(value).lower() for value in values]
+    values_score = count_value_matches(lowered_values, value_matcher) / len(values)
     return values_score
 
 
+# Match regex for values
+def match_regex_for_values(values: List[Any], regex_list: List[str]) -> float:
+    return match_compiled_regex_for_values(values, compile_value_matcher(regex_list))
+
+
 def detect_named_entity_spacy(
     spacy_models_list: List, entities_of_interest: List[str], value: str
 ) -> bool:
@@ -79,9 +426,219 @@ def detect_named_entity_spacy(
     return False
 
 
+# Validates a batch of values, yielding one boolean per value
+ValuesValidator = Callable[[List[Any]], Iterable[bool]]
+
+
+def validate_each(is_valid: Callable[[Any], bool]) -> ValuesValidator:
+    def validate_values(values: List[Any]) -> Iterable[bool]:
+        return map(is_valid, values)
+
+    return validate_values
+
+
+def count_distinct_values(values: List[Any]) -> Tuple[List[Any], List[int]]:
+    """Distinct values in order of first occurrence, with their counts.
+
+    Values are distinguished by type as well, so that 1 and "1" (or 1 and 1.0)
+    are validated separately. Columns with unhashable values are returned as is.
+    """
+    distinct_indices: Dict[Tuple[type, Any], int] = {}
+    distinct_values: List[Any] = []
+    counts: List[int] = []
+    try:
+        for value in values:
+            key = (type(value), value)
+            index = distinct_indices.get(key)
+            if index is None:
+                distinct_indices[key] = len(distinct_values)
+                distinct_values.append(value)
+                counts.append(1)
+            else:
+                counts[index] += 1
+    except TypeError:
+        return list(values), [1] * len(values)
+    return distinct_values, counts
+
+
+@dataclass
+class EarlyExit:
+    """Lets score_values stop before all values are validated."""
+
+    # is_decided(min_score, max_score) holds once the outcome is the same for
+    # any values score between min_score and max_score
+    is_decided: Callable[[float, float], bool]
+    # number of values validated between two checks, with sampling_z_score the
+    # size of the first sample, which then doubles
+    batch_size: int = 50
+    # if set, values are sampled at random and scores are bounded by a Wilson
+    # confidence interval with this z-score as well as exactly
+    sampling_z_score: Optional[float] = None
+    # receives the number of values validated, as values_consumed
+    debug_info: Optional[DebugInfo] = None
+
+    def record_values_consumed(self, num_values: int) -> None:
+        if self.debug_info is not None:
+            self.debug_info.values_consumed = num_values
+
+
+def wilson_interval(
+    num_valid: int, num_scored: int, z_score: float
+) -> Tuple[float, float]:
+    """Wilson score interval of the fraction of valid values."""
+    fraction = num_valid / num_scored
+    z_squared = z_score * z_score
+    denominator = 1 + z_squared / num_scored
+    center = (fraction + z_squared / (2 * num_scored)) / denominator
+    margin = (
+        z_score
+        * math.sqrt(
+            fraction * (1 - fraction) / num_scored
+            + z_squared / (4 * num_scored * num_scored)
+        )
+        / denominator
+    )
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def count_valid_values(values: List[Any], validate_values: ValuesValidator) -> int:
+    distinct_values, counts = count_distinct_values(values)
+    return sum(
+        count
+        for count, is_valid in zip(counts, validate_values(distinct_values))
+        if is_valid
+    )
+
+
+def score_values(
+    values: List[Any],
+    validate_values: ValuesValidator,
+    weight: float = 1.0,
+    early_exit: Optional[EarlyExit] = None,
+) -> float:
+    """Fraction of valid values, multiplied by weight and capped at 1.
+
+    Each distinct value is validated once and counted as many times as it
+    occurs. If early_exit is given, distinct values are validated in batches
+    and scoring stops as soon as early_exit.is_decided(min_score, max_score)
+    holds for the range of scores still reachable with the remaining values.
+    The observed fraction of valid values is returned in that case.
+    """
+    num_values = len(values)
+    if early_exit is None:
+        return min(weight * count_valid_values(values, validate_values) / num_values, 1)
+    if early_exit.sampling_z_score is not None:
+        return score_values_adaptively(values, validate_values, weight, early_exit)
+    distinct_values, counts = count_distinct_values(values)
+    batch_size = early_exit.batch_size
+    valid_count = 0
+    num_scored = 0
+    for start in range(0, len(distinct_values), batch_size):
+        batch = distinct_values[start : start + batch_size]
+        batch_counts = counts[start : start + batch_size]
+        for count, is_valid in zip(batch_counts, validate_values(batch)):
+            num_scored += count
+            if is_valid:
+                valid_count += count
+        if num_scored < num_values and early_exit.is_decided(
+            min(weight * valid_count / num_values, 1),
+            min(weight * (valid_count + num_values - num_scored) / num_values, 1),
+        ):
+            early_exit.record_values_consumed(num_scored)
+            return min(weight * valid_count / num_scored, 1)
+    early_exit.record_values_consumed(num_values)
+    return min(weight * valid_count / num_values, 1)
+
+
+def score_values_adaptively(
+    values: List[Any],
+    validate_values: ValuesValidator,
+    weight: float,
+    early_exit: EarlyExit,
+) -> float:
+    """score_values on random samples of values, doubling until decided.
+
+    Scores are bounded by the Wilson interval of the sampled fraction of valid
+    values, intersected with the exact bounds. The sample order is seeded, so
+    results are reproducible.
+    """
+    assert early_exit.sampling_z_score is not None
+    num_values = len(values)
+    sample_order = list(range(num_values))
+    random.Random(0).shuffle(sample_order)
+    valid_count = 0
+    num_scored = 0
+    sample_size = early_exit.batch_size
+    while num_scored < num_values:
+        batch = [values[i] for i in sample_order[num_scored:sample_size]]
+        valid_count += count_valid_values(batch, validate_values)
+        num_scored += len(batch)
+        sample_size *= 2
+        if num_scored == num_values:
+            break
+        lower, upper = wilson_interval(
+            valid_count, num_scored, early_exit.sampling_z_score
+        )
+        lower = max(lower, valid_count / num_values)
+        upper = min(upper, (valid_count + num_values - num_scored) / num_values)
+        if early_exit.is_decided(min(weight * lower, 1), min(weight * upper, 1)):
+            early_exit.record_values_consumed(num_scored)
+            return min(weight * valid_count / num_scored, 1)
+    early_exit.record_values_consumed(num_values)
+    return min(weight * valid_count / num_values, 1)
+
+
+# pipeline components which named entity recognition does not depend on
+SPACY_NON_NER_COMPONENTS = [
+    "tagger",
+    "parser",
+    "attribute_ruler",
+    "lemmatizer",
+    "senter",
+]
+
+
+def detect_named_entities_spacy(
+    spacy_models_list: List,
+    entities_of_interest: List[str],
+    values: List[Any],
+    batch_size: int = 128,
+    n_process: int = 1,
+) -> List[bool]:
+    """Batched counterpart of detect_named_entity_spacy.
+
+    Streams all values through nlp.pipe with the components NER does not need
+    disabled. Values which are not strings are reported as not detected.
+    """
+    detected = [False] * len(values)
+    for spacy_model in spacy_models_list:
+        pending_indices = [
+            i
+            for i, value in enumerate(values)
+            if not detected[i]
+            and isinstance(value, str)
+            and len(value) <= spacy_model.max_length
+        ]
+        if not pending_indices:
+            break
+        disabled_components = [
+            name for name in SPACY_NON_NER_COMPONENTS if name in spacy_model.pipe_names
+        ]
+        docs = spacy_model.pipe(
+            (values[i] for i in pending_indices),
+            batch_size=batch_size,
+            n_process=n_process,
+            disable=disabled_components,
+        )
+        for i, doc in zip(pending_indices, docs):
+            if any(ent.label_ in entities_of_interest for ent in doc.ents):
+                detected[i] = True
+    return detected
+
+
 def perform_basic_checks(
     metadata: Metadata,
-    values: List[Any],
+    values: Sized,
     config_dict: Dict[str, Dict],
     infotype: Optional[str] = None,
 ) -> bool:
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import asdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from datahub_classify import __version__
+from datahub_classify.helper_classes import (
+    BaseInfotypeProposal,
+    ColumnInfo,
+    DebugInfo,
+    InfotypeProposal,
+    InspectionOptions,
+)
+from datahub_classify.spacy_models import get_spacy_model_name_or_path
+
+# sqlite waits this long (in seconds) for other processes writing to the cache
+RESULT_CACHE_TIMEOUT = 30.0
+# path of a SQLite database held in memory, private to a process
+IN_MEMORY_PATH = ":memory:"
+# inspection options which change how results are returned, not the proposals
+RESULT_FORMAT_OPTIONS = ["compact_results", "keep_values"]
+
+
+def compute_values_fingerprint(values: Iterable[Any]) -> str:
+    """Hash of the sampled values, sensitive to their order and types."""
+    values_hash = hashlib.sha256()
+    for value in values:
+        values_hash.update(f"{type(value).__name__}:{value}".encode("utf-8"))
+        values_hash.update(b"\x00")
+    return values_hash.hexdigest()
+
+
+def _options_to_dict(options: Optional[InspectionOptions]) -> Optional[Dict[str, Any]]:
+    if options is None:
+        return None
+    options_dict = asdict(options)
+    for option in RESULT_FORMAT_OPTIONS:
+        del options_dict[option]
+    return options_dict
+
+
+def compute_column_key(
+    column_info: ColumnInfo,
+    config_fingerprint: str,
+    infotypes: List[str],
+    confidence_level_threshold: float,
+    options: Optional[InspectionOptions] = None,
+) -> str:
+    """Cache key of a column classification.
+
+    Covers the column metadata and values as well as everything else proposals
+    depend on: the config, the infotypes, the threshold, inspection options, the
+    spaCy model and the version of this package, whose inspectors may change.
+    """
+    key = json.dumps(
+        [
+            column_info.metadata.meta_info,
+            compute_values_fingerprint(column_info.values),
+            config_fingerprint,
+            infotypes,
+            confidence_level_threshold,
+            _options_to_dict(options),
+            get_spacy_model_name_or_path(),
+            __version__,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _proposal_to_dict(proposal: BaseInfotypeProposal) -> Dict[str, Any]:
+    return {
+        "infotype": proposal.infotype,
+        "confidence_level": float(proposal.confidence_level),
+        "debug_info": asdict(proposal.debug_info),
+    }
+
+
+def _proposal_from_dict(proposal: Dict[str, Any]) -> InfotypeProposal:
+    return InfotypeProposal(
+        proposal["infotype"],
+        proposal["confidence_level"],
+        DebugInfo(**proposal["debug_info"]),
+    )
+
+
+class ClassificationResultCache:
+    """Persistent cache of column classification results, stored in SQLite.
+
+    Entries never expire, a changed column, config, threshold or option simply
+    maps to a new key. The cache can be handed to predict_infotypes with
+    n_workers > 1, each worker process then opens its own connection to path.
+    An in-memory cache (path ":memory:") can not be shared with worker
+    processes.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._open(path)
+
+    def _open(self, path: str) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=RESULT_CACHE_TIMEOUT, check_same_thread=False
+        )
+        with self._connection:
+            if path != IN_MEMORY_PATH:
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS classification_results ("
+                "column_key TEXT PRIMARY KEY, "
+                "basic_checks_passed INTEGER NOT NULL, "
+                "infotype_proposals TEXT NOT NULL)"
+            )
+
+    def get(self, column_key: str) -> Optional[Tuple[List[BaseInfotypeProposal], bool]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT infotype_proposals, basic_checks_passed "
+                "FROM classification_results WHERE column_key = ?",
+                (column_key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        proposals: List[BaseInfotypeProposal] = [
+            _proposal_from_dict(proposal) for proposal in json.loads(row[0])
+        ]
+        return proposals, bool(row[1])
+
+    def put(
+        self,
+        column_key: str,
+        infotype_proposals: List[BaseInfotypeProposal],
+        basic_checks_passed: bool,
+    ) -> None:
+        serialized_proposals = json.dumps(
+            [_proposal_to_dict(proposal) for proposal in infotype_proposals],
+            default=float,
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO classification_results "
+                "(column_key, basic_checks_passed, infotype_proposals) "
+                "VALUES (?, ?, ?)",
+                (column_key, int(basic_checks_passed), serialized_proposals),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM classification_results")
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "ClassificationResultCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def check_shareable(self) -> None:
+        """Raise ValueError if worker processes can not open this cache."""
+        if self.path == IN_MEMORY_PATH:
+            raise ValueError(
+                "An in-memory ClassificationResultCache can not be shared with "
+                "worker processes, each would use its own empty database. Use a "
+                "file path instead."
+            )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # connections can not be pickled, reopen the database in worker processes
+        self.check_shareable()
+        return {"path": self.path}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._open(state["path"])
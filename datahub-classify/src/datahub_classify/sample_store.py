@@ -0,0 +1,213 @@
+import json
+import mmap
+import pickle
+import struct
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Union,
+    overload,
+)
+
+from datahub_classify.helper_classes import ColumnInfo, Metadata
+from datahub_classify.infotype_utils import LazyModule
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = LazyModule("numpy")
+
+# A sample store file holds the values of each column, 8-byte aligned, followed
+# by a JSON index of the columns, the index size and SAMPLE_STORE_MAGIC
+SAMPLE_STORE_MAGIC = b"DHCSMPL1"
+_FOOTER = struct.Struct("<Q8s")
+_ALIGNMENT = 8
+# how the values of a column are stored
+NUMERIC_VALUES = "numeric"  # buffer of a NumPy array of numbers
+STRING_VALUES = "string"  # int64 offsets of each string, then UTF-8 bytes
+PICKLED_VALUES = "pickle"  # anything else, pickled
+
+
+class StringValues(Sequence[str]):
+    """Strings of a column, decoded from the memory-mapped store on access."""
+
+    def __init__(self, buffer: memoryview, offsets: "np.ndarray") -> None:
+        self._buffer = buffer
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("string index out of range")
+        return self._decode(int(self._offsets[index]), int(self._offsets[index + 1]))
+
+    def __iter__(self) -> Iterator[str]:
+        offsets = self._offsets.tolist()
+        for start, end in zip(offsets, offsets[1:]):
+            yield self._decode(start, end)
+
+    def _decode(self, start: int, end: int) -> str:
+        return str(self._buffer[start:end], "utf-8", "surrogatepass")
+
+    def __reduce__(self) -> Any:
+        # the memory map stays in this process, ship the strings themselves
+        return list, (list(self),)
+
+
+class SampleStoreWriter:
+    """Writes sampled values of columns to a sample store file.
+
+    Values of each column are written as soon as they are added, only the
+    metadata of the columns is held in memory until close() writes the index.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "wb")
+        self._position = 0
+        self._columns: List[Dict[str, Any]] = []
+
+    def add(self, metadata: Metadata, values: Iterable[Any]) -> None:
+        """Write the values of a column.
+
+        Numeric NumPy arrays are stored as their buffer and strings as UTF-8,
+        both read back without copying. Other values are pickled.
+        """
+        self._write(b"\0" * (-self._position % _ALIGNMENT))
+        column: Dict[str, Any] = {
+            "meta_info": metadata.meta_info,
+            "offset": self._position,
+        }
+        if isinstance(values, np.ndarray) and values.dtype.kind in "biuf":
+            array = np.ascontiguousarray(values)
+            column.update(kind=NUMERIC_VALUES, dtype=array.dtype.str, count=len(array))
+            self._write(array.tobytes())
+        else:
+            values = list(values)
+            if all(isinstance(value, str) for value in values):
+                encoded_values = [
+                    value.encode("utf-8", "surrogatepass") for value in values
+                ]
+                offsets = np.zeros(len(values) + 1, dtype="<i8")
+                np.cumsum([len(value) for value in encoded_values], out=offsets[1:])
+                column.update(kind=STRING_VALUES, count=len(values))
+                self._write(offsets.tobytes())
+                self._write(b"".join(encoded_values))
+            else:
+                column.update(kind=PICKLED_VALUES)
+                self._write(pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL))
+        column["size"] = self._position - column["offset"]
+        self._columns.append(column)
+
+    def _write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._position += len(data)
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        index = json.dumps(self._columns, default=str).encode("utf-8")
+        self._write(index)
+        self._write(_FOOTER.pack(len(index), SAMPLE_STORE_MAGIC))
+        self._file.close()
+
+    def __enter__(self) -> "SampleStoreWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class SampleStore:
+    """Memory-mapped sample store, written by SampleStoreWriter.
+
+    Values of numeric columns are NumPy arrays and values of string columns
+    StringValues, both viewing the memory map without copying. The operating
+    system pages values in as they are read, so a store may be larger than the
+    available memory.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _FOOTER.size:
+            raise ValueError(f"{path} is not a sample store")
+        index_end = len(self._mmap) - _FOOTER.size
+        index_size, magic = _FOOTER.unpack(self._mmap[index_end:])
+        if magic != SAMPLE_STORE_MAGIC:
+            raise ValueError(f"{path} is not a sample store")
+        self._columns: List[Dict[str, Any]] = json.loads(
+            self._mmap[index_end - index_size : index_end]
+        )
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def get_metadata(self, index: int) -> Metadata:
+        return Metadata(self._columns[index]["meta_info"])
+
+    def get_values(self, index: int) -> Union[Sequence[Any], "np.ndarray"]:
+        column = self._columns[index]
+        offset = column["offset"]
+        if column["kind"] == NUMERIC_VALUES:
+            return np.frombuffer(
+                self._mmap,
+                dtype=np.dtype(column["dtype"]),
+                count=column["count"],
+                offset=offset,
+            )
+        if column["kind"] == STRING_VALUES:
+            offsets = np.frombuffer(
+                self._mmap, dtype="<i8", count=column["count"] + 1, offset=offset
+            )
+            strings_offset = offset + offsets.nbytes
+            return StringValues(
+                memoryview(self._mmap)[strings_offset : offset + column["size"]],
+                offsets,
+            )
+        return pickle.loads(self._mmap[offset : offset + column["size"]])
+
+    def column_infos(self) -> Iterator[ColumnInfo]:
+        """ColumnInfo of each column, in the order they were added."""
+        for index in range(len(self)):
+            yield ColumnInfo(self.get_metadata(index), self.get_values(index))
+
+    def close(self) -> None:
+        try:
+            self._mmap.close()
+        except BufferError:
+            # values still in use keep the memory map open until they are freed
+            pass
+
+    def __enter__(self) -> "SampleStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def write_sample_store(path: str, column_infos: Iterable[ColumnInfo]) -> None:
+    """Write the metadata and values of column_infos to a sample store file."""
+    with SampleStoreWriter(path) as writer:
+        for column_info in column_infos:
+            writer.add(column_info.metadata, column_info.values)
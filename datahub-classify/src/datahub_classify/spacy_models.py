@@ -0,0 +1,60 @@
+import logging
+import os
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPACY_MODEL = "en_core_web_sm"
+# Name of an installed spaCy package or path of a local model directory
+SPACY_MODEL_ENV_VAR = "DATAHUB_CLASSIFY_SPACY_MODEL"
+
+_spacy_model_name_or_path: Optional[str] = None
+_spacy_models_list: Optional[List[Any]] = None
+
+
+class SpacyModelNotAvailableError(Exception):
+    pass
+
+
+def set_spacy_model(name_or_path: Optional[str]) -> None:
+    """Use the given spaCy package name or local model path for NER based infotypes.
+
+    Passing None restores the default resolution order: the
+    DATAHUB_CLASSIFY_SPACY_MODEL environment variable, then en_core_web_sm.
+    The model is loaded on next use.
+    """
+    global _spacy_model_name_or_path, _spacy_models_list
+    _spacy_model_name_or_path = name_or_path
+    _spacy_models_list = None
+
+
+def get_spacy_model_name_or_path() -> str:
+    return (
+        _spacy_model_name_or_path
+        or os.environ.get(SPACY_MODEL_ENV_VAR)
+        or DEFAULT_SPACY_MODEL
+    )
+
+
+def get_spacy_models() -> List[Any]:
+    """Load the spaCy model on first use and return it as a list of models.
+
+    The model is never downloaded, a missing model raises
+    SpacyModelNotAvailableError instead.
+    """
+    global _spacy_models_list
+    if _spacy_models_list is None:
+        import spacy
+
+        model_name_or_path = get_spacy_model_name_or_path()
+        logger.debug(f"Loading spaCy model {model_name_or_path}")
+        try:
+            nlp_english = spacy.load(model_name_or_path)
+        except OSError as e:
+            raise SpacyModelNotAvailableError(
+                f"spaCy model '{model_name_or_path}' is not available. Install it "
+                f"with 'python -m spacy download {DEFAULT_SPACY_MODEL}', or point "
+                f"{SPACY_MODEL_ENV_VAR} (or set_spacy_model) at a local model path."
+            ) from e
+        _spacy_models_list = [nlp_english]
+    return _spacy_models_list
@@ -0,0 +1,113 @@
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import (
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+# name, description and datatype scoring
+METADATA_STAGE = "metadata"
+# values scoring, by kind of values prediction
+VALUES_REGEX_STAGE = "values_regex"
+VALUES_LIBRARY_STAGE = "values_library"
+VALUES_SPACY_STAGE = "values_spacy"
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    seconds: float = 0.0
+
+
+class StageStatsRow(NamedTuple):
+    infotype: str
+    stage: str
+    calls: int
+    seconds: float
+
+
+@dataclass
+class ClassificationStats:
+    """Wall time and number of calls per infotype and stage.
+
+    predict_infotypes records one of these per column when instrumentation is
+    enabled, and merges them into the aggregate passed by the caller.
+    """
+
+    stages: Dict[Tuple[str, str], StageStats] = field(default_factory=dict)
+    columns: int = 0
+    # wall time of classifying the columns as a whole, which stages break down,
+    # also covering values normalization, basic checks and the result cache
+    column_seconds: float = 0.0
+
+    def record(self, infotype: str, stage: str, seconds: float) -> None:
+        stage_stats = self.stages.get((infotype, stage))
+        if stage_stats is None:
+            stage_stats = self.stages[(infotype, stage)] = StageStats()
+        stage_stats.calls += 1
+        stage_stats.seconds += seconds
+
+    @contextmanager
+    def timed(self, infotype: str, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(infotype, stage, time.perf_counter() - start)
+
+    @contextmanager
+    def timed_column(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.column_seconds += time.perf_counter() - start
+
+    def merge(self, other: "ClassificationStats") -> None:
+        for (infotype, stage), stage_stats in other.stages.items():
+            merged_stats = self.stages.setdefault((infotype, stage), StageStats())
+            merged_stats.calls += stage_stats.calls
+            merged_stats.seconds += stage_stats.seconds
+        self.columns += other.columns
+        self.column_seconds += other.column_seconds
+
+    def total_seconds(
+        self, infotype: Optional[str] = None, stage: Optional[str] = None
+    ) -> float:
+        return sum(
+            stage_stats.seconds
+            for (stats_infotype, stats_stage), stage_stats in self.stages.items()
+            if infotype in (None, stats_infotype) and stage in (None, stats_stage)
+        )
+
+    def to_rows(self) -> List[StageStatsRow]:
+        """One row per infotype and stage, the most time consuming first."""
+        return sorted(
+            (
+                StageStatsRow(infotype, stage, stage_stats.calls, stage_stats.seconds)
+                for (infotype, stage), stage_stats in self.stages.items()
+            ),
+            key=lambda row: -row.seconds,
+        )
+
+
+def timed(
+    stats: Optional[ClassificationStats], infotype: str, stage: str
+) -> ContextManager[None]:
+    """stats.timed(infotype, stage), or a no-op if stats is None."""
+    if stats is None:
+        return nullcontext()
+    return stats.timed(infotype, stage)
+
+
+def timed_column(stats: Optional[ClassificationStats]) -> ContextManager[None]:
+    """stats.timed_column(), or a no-op if stats is None."""
+    if stats is None:
+        return nullcontext()
+    return stats.timed_column()
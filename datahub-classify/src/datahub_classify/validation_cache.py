@@ -0,0 +1,105 @@
+import threading
+from collections import OrderedDict
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from datahub_classify.infotype_utils import ValuesValidator
+
+DEFAULT_VALIDATION_CACHE_SIZE = 100000
+
+
+class ValidationCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    max_size: int
+    current_size: int
+
+
+class ValidationCache:
+    """Per-process LRU cache of value validation results, shared across columns.
+
+    Results are keyed by (infotype, validator, value type, value). The validator
+    name must identify everything the result depends on besides the value, e.g.
+    the phone number regions or the spaCy model. Validators whose result also
+    depends on other values of the column must not be cached, since a result
+    would then be served to every later column. A max_size of 0 disables it.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_VALIDATION_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._results: "OrderedDict[Tuple[Any, ...], bool]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def validate(
+        self,
+        infotype: str,
+        validator: str,
+        values: List[Any],
+        validate_values: ValuesValidator,
+    ) -> List[bool]:
+        if self.max_size <= 0:
+            return list(validate_values(values))
+        try:
+            keys = [(infotype, validator, type(value), value) for value in values]
+            with self._lock:
+                results: List[Optional[bool]] = [self._results.get(key) for key in keys]
+                for key, result in zip(keys, results):
+                    if result is not None:
+                        self._results.move_to_end(key)
+        except TypeError:
+            # unhashable values are not cached
+            return list(validate_values(values))
+
+        missing_indices = [i for i, result in enumerate(results) if result is None]
+        if missing_indices:
+            missing_results = validate_values([values[i] for i in missing_indices])
+            for i, result in zip(missing_indices, missing_results):
+                results[i] = bool(result)
+
+        with self._lock:
+            self.hits += len(values) - len(missing_indices)
+            self.misses += len(missing_indices)
+            for i in missing_indices:
+                self._results[keys[i]] = bool(results[i])
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+        return [bool(result) for result in results]
+
+    def cached(
+        self, infotype: str, validator: str, validate_values: ValuesValidator
+    ) -> ValuesValidator:
+        """Wrap validate_values so that it only validates values not cached yet."""
+        return lambda values: self.validate(
+            infotype, validator, values, validate_values
+        )
+
+    def info(self) -> ValidationCacheInfo:
+        with self._lock:
+            return ValidationCacheInfo(
+                self.hits, self.misses, self.max_size, len(self._results)
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_validation_cache = ValidationCache()
+
+
+def get_validation_cache() -> ValidationCache:
+    return _validation_cache
+
+
+def set_validation_cache_size(max_size: int) -> None:
+    """Resize the shared validation cache, evicting least recently used results.
+
+    A max_size of 0 disables caching.
+    """
+    with _validation_cache._lock:
+        _validation_cache.max_size = max_size
+        while len(_validation_cache._results) > max(max_size, 0):
+            _validation_cache._results.popitem(last=False)
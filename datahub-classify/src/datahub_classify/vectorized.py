@@ -0,0 +1,172 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Tuple, Union
+
+from datahub_classify.helper_classes import ColumnValues
+from datahub_classify.infotype_utils import (
+    EarlyExit,
+    LazyModule,
+    ValuePatternMatcher,
+    count_distinct_values,
+    score_values,
+    validate_each,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = LazyModule("numpy")
+
+PYTHON_BACKEND = "python"
+NUMPY_BACKEND = "numpy"
+# largest value to_int_array converts without a Python level loop
+INT64_MAX = 2**63 - 1
+
+
+@dataclass
+class VectorizedColumnValues(ColumnValues):
+    """ColumnValues which keep typed NumPy arrays as such, used by the "numpy" backend.
+
+    Null values of a numeric array are dropped with a mask and the typed array
+    is kept for numeric checks, as the column's values. raw, a list of NumPy
+    scalars, is only built if an inspector validating values one by one asks
+    for it. Regex matching runs once per distinct value, found with np.unique,
+    so numeric values are only stringified once each. Values of any other kind
+    are cleaned like the "python" backend does.
+    """
+
+    array: Optional["np.ndarray"] = field(default=None, repr=False)
+    _raw: Optional[List[Any]] = field(default=None, init=False, repr=False)
+    _distinct_lowered: Optional[Tuple[List[str], List[int]]] = field(
+        default=None, init=False, repr=False
+    )
+
+    @property  # type: ignore[misc]
+    def raw(self) -> List[Any]:
+        if self._raw is None:
+            assert self.array is not None
+            self._raw = list(self.array)
+        return self._raw
+
+    @raw.setter
+    def raw(self, raw: Optional[List[Any]]) -> None:
+        self._raw = raw
+
+    @property
+    def values(self) -> Union[List[Any], "np.ndarray"]:
+        return self.array if self.array is not None else self.raw
+
+    @property
+    def strings(self) -> List[str]:
+        if self._strings is None:
+            self._strings = [
+                str(value)
+                for value in (self.array if self.array is not None else self.raw)
+            ]
+        return self._strings
+
+    def __len__(self) -> int:
+        return len(self.array) if self.array is not None else len(self.raw)
+
+    @classmethod
+    def normalize(
+        cls, values: Union[Iterable[Any], ColumnValues]
+    ) -> "VectorizedColumnValues":
+        if isinstance(values, VectorizedColumnValues) and values.array is not None:
+            values = values.array
+        elif isinstance(values, ColumnValues):
+            values = values.raw
+        if isinstance(values, np.ndarray) and values.dtype.kind in "biuf":
+            array = values
+            if array.dtype.kind == "f":
+                # str() of any other number is neither blank, "nan" nor "None"
+                is_nan = np.isnan(array)
+                if is_nan.any():
+                    array = array[~is_nan]
+            return cls(None, array)  # type: ignore[arg-type]
+        column_values = ColumnValues.normalize(values)
+        vectorized_column_values = cls(column_values.raw)
+        vectorized_column_values._strings = column_values._strings
+        vectorized_column_values._stripped = column_values._stripped
+        return vectorized_column_values
+
+    def distinct_lowered(self) -> Tuple[List[str], List[int]]:
+        """Distinct lowercased values and the number of values mapping to each."""
+        if self._distinct_lowered is None:
+            if self.array is not None:
+                # unique by bit pattern, so that e.g. 0.0 and -0.0 stay apart
+                bits = self.array.view(f"u{self.array.dtype.itemsize}")
+                _, first_indices, counts = np.unique(
+                    bits, return_index=True, return_counts=True
+                )
+                self._distinct_lowered = (
+                    [str(self.array[i]).lower() for i in first_indices],
+                    counts.tolist(),
+                )
+            else:
+                self._distinct_lowered = count_distinct_values(self.lowered)
+        return self._distinct_lowered
+
+
+def normalize_column_values(
+    values: Union[Iterable[Any], ColumnValues], backend: str = PYTHON_BACKEND
+) -> ColumnValues:
+    if backend == NUMPY_BACKEND:
+        return VectorizedColumnValues.normalize(values)
+    if backend == PYTHON_BACKEND:
+        return ColumnValues.normalize(values)
+    raise ValueError(f"Unknown values backend {backend}")
+
+
+def score_regex_values(
+    column_values: ColumnValues,
+    matcher: ValuePatternMatcher,
+    early_exit: Optional[EarlyExit] = None,
+    clean: Optional[Callable[[str], str]] = None,
+) -> float:
+    """Fraction of lowercased values fully matching any pattern of matcher.
+
+    clean, if given, maps a lowercased value to the string to match. Values of
+    the "numpy" backend are matched in one pass over their distinct values,
+    early exit does not apply to them.
+    """
+    if isinstance(column_values, VectorizedColumnValues):
+        distinct_values, counts = column_values.distinct_lowered()
+        num_matches = sum(
+            count
+            for value, count in zip(distinct_values, counts)
+            if matcher.fullmatch(clean(value) if clean else value)
+        )
+        if early_exit is not None:
+            early_exit.record_values_consumed(len(column_values))
+        return min(num_matches / len(column_values), 1)
+    lowered_values = column_values.lowered
+    if clean is not None:
+        lowered_values = [clean(value) for value in lowered_values]
+    return score_values(
+        lowered_values,
+        validate_each(matcher.fullmatch),
+        early_exit=early_exit,
+    )
+
+
+def to_int_array(column_values: ColumnValues) -> "np.ndarray":
+    """Values as integers, the way int() converts them, raising if one fails.
+
+    Typed numeric arrays of the "numpy" backend are converted without a
+    Python level loop, unless some values do not fit in an int64.
+    """
+    array = (
+        column_values.array
+        if isinstance(column_values, VectorizedColumnValues)
+        else None
+    )
+    if array is not None and array.dtype.kind in "biu":
+        if array.dtype.kind != "u" or not array.size or array.max() <= INT64_MAX:
+            return array.astype(np.int64)
+    elif array is not None and array.dtype.kind == "f":
+        if not np.isfinite(array).all():
+            raise ValueError("cannot convert non-finite values to integer")
+        truncated = np.trunc(array)
+        if (np.abs(truncated) < INT64_MAX + 1).all():
+            return truncated.astype(np.int64)
+    return np.array([int(value) for value in column_values.raw])
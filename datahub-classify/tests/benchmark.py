@@ -0,0 +1,492 @@
+"""Throughput benchmark of predict_infotypes.
+
+Classifies either the bundled datasets in tests/datasets ("public") or
+generated columns ("synthetic"), and reports columns/sec, values/sec, p50/p99
+per-column latency and peak RSS, in total and per infotype. Every run happens
+in a fresh process, so that peak RSS is not polluted by earlier runs.
+
+    python tests/benchmark.py public --output baseline.json
+    python tests/benchmark.py public --baseline baseline.json
+    python tests/benchmark.py synthetic --columns 100000 --infotypes Email_Address Age
+
+With --baseline the exit status is 1 if any metric got worse than the baseline
+by more than --tolerance.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import string
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from datahub_classify.helper_classes import ColumnInfo, InspectionOptions, Metadata
+from datahub_classify.infotype_predictor import predict_infotypes_stream
+from datahub_classify.reference_input import input1 as input_dict
+from datahub_classify.stats import METADATA_STAGE, ClassificationStats
+
+current_wdr = os.path.dirname(os.path.abspath(__file__))
+input_data_dir = os.path.join(current_wdr, "datasets")
+
+PUBLIC_DATASET = "public"
+SYNTHETIC_DATASET = "synthetic"
+# same sampling as tests/test_infotype_predictor.py
+MAX_PUBLIC_VALUES = 1000
+# metrics compared against a baseline, and whether higher values are better
+COMPARED_METRICS = {
+    "columns_per_sec": True,
+    "values_per_sec": True,
+    "p50_latency_ms": False,
+    "p99_latency_ms": False,
+    "peak_rss_mb": False,
+}
+
+FIRST_NAMES = ["james", "mary", "john", "patricia", "robert", "jennifer", "wei"]
+LAST_NAMES = ["smith", "johnson", "williams", "brown", "jones", "garcia", "chen"]
+STREETS = ["main", "oak", "pine", "maple", "cedar", "elm", "washington"]
+STREET_SUFFIXES = ["street", "avenue", "road", "boulevard", "lane"]
+CITIES = ["springfield", "riverside", "franklin", "greenville", "bristol"]
+VIN_CHARACTERS = "0123456789ABCDEFGHJKLMNPRSTUVWXYZ"
+VIN_TRANSLITERATION = dict(
+    zip(
+        "ABCDEFGHJKLMNPRSTUVWXYZ",
+        [1, 2, 3, 4, 5, 6, 7, 8, 1, 2, 3, 4, 5, 7, 9, 2, 3, 4, 5, 6, 7, 8, 9],
+    )
+)
+VIN_WEIGHTS = [8, 7, 6, 5, 4, 3, 2, 10, 0, 9, 8, 7, 6, 5, 4, 3, 2]
+
+
+def _digits(rng: random.Random, n: int) -> str:
+    return "".join(rng.choice(string.digits) for _ in range(n))
+
+
+def _card_number(rng: random.Random) -> str:
+    number = "4" + _digits(rng, 14)
+    total = 0
+    for i, digit in enumerate(reversed(number)):
+        doubled = int(digit) * (2 if i % 2 == 0 else 1)
+        total += doubled - 9 if doubled > 9 else doubled
+    return f"{number}{(10 - total % 10) % 10}"
+
+
+def _iban(rng: random.Random) -> str:
+    bban = _digits(rng, 18)
+    # "DE" is 1314, moved behind the BBAN with a "00" check placeholder
+    return f"DE{98 - int(bban + '131400') % 97:02d}{bban}"
+
+
+def _vin(rng: random.Random) -> str:
+    vin = [rng.choice(VIN_CHARACTERS) for _ in range(17)]
+    total = sum(
+        (VIN_TRANSLITERATION[c] if c.isalpha() else int(c)) * weight
+        for c, weight in zip(vin, VIN_WEIGHTS)
+    )
+    vin[8] = "X" if total % 11 == 10 else str(total % 11)
+    return "".join(vin)
+
+
+# column name and value generator of each kind of synthetic column
+SYNTHETIC_GENERATORS: Dict[str, Tuple[str, Callable[[random.Random], Any]]] = {
+    "Email_Address": (
+        "email",
+        lambda rng: f"{rng.choice(FIRST_NAMES)}.{rng.choice(LAST_NAMES)}{rng.randint(1, 9999)}@example.com",
+    ),
+    "Gender": ("gender", lambda rng: rng.choice(["Male", "Female", "M", "F"])),
+    "Credit_Debit_Card_Number": ("card_number", _card_number),
+    "Phone_Number": (
+        "phone",
+        lambda rng: f"+1 212-{rng.randint(200, 999)}-{_digits(rng, 4)}",
+    ),
+    "Full_Name": (
+        "full_name",
+        lambda rng: f"{rng.choice(FIRST_NAMES).title()} {rng.choice(LAST_NAMES).title()}",
+    ),
+    "Age": ("age", lambda rng: rng.randint(1, 90)),
+    "IBAN": ("iban", _iban),
+    "Vehicle_Identification_Number": ("vin", _vin),
+    "US_Social_Security_Number": (
+        "ssn",
+        lambda rng: f"{rng.randint(100, 665)}-{rng.randint(1, 99):02d}-{rng.randint(1, 9999):04d}",
+    ),
+    "IP_Address_v4": (
+        "ip_address",
+        lambda rng: ".".join(str(rng.randint(1, 254)) for _ in range(4)),
+    ),
+    "IP_Address_v6": (
+        "ipv6_address",
+        lambda rng: ":".join(f"{rng.randint(0, 0xFFFF):x}" for _ in range(8)),
+    ),
+    "Swift_Code": (
+        "swift_code",
+        lambda rng: "".join(rng.choice(string.ascii_uppercase) for _ in range(6))
+        + rng.choice(["XX", "2L", "33"]),
+    ),
+    "Street_Address": (
+        "street_address",
+        lambda rng: f"{rng.randint(1, 999)} {rng.choice(STREETS).title()} "
+        f"{rng.choice(STREET_SUFFIXES).title()}, {rng.choice(CITIES).title()}",
+    ),
+    "US_Driving_License_Number": (
+        "driving_license",
+        lambda rng: rng.choice(string.ascii_uppercase) + _digits(rng, 7),
+    ),
+    # columns of no infotype
+    "Text": (
+        "comment",
+        lambda rng: " ".join(
+            "".join(
+                rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 8))
+            )
+            for _ in range(rng.randint(1, 6))
+        ),
+    ),
+    "Amount": ("amount", lambda rng: round(rng.uniform(0, 10000), 2)),
+}
+
+
+def generate_synthetic_column_infos(
+    num_columns: int, num_values: int = 100, seed: int = 0
+) -> Iterator[ColumnInfo]:
+    """Columns of every kind in SYNTHETIC_GENERATORS, generated lazily.
+
+    Column i only depends on seed and i, so any prefix of a run is reproducible.
+    """
+    kinds = list(SYNTHETIC_GENERATORS.keys())
+    for i in range(num_columns):
+        rng = random.Random(f"{seed}:{i}")
+        name, generate_value = SYNTHETIC_GENERATORS[kinds[i % len(kinds)]]
+        metadata = Metadata(
+            {
+                "Name": f"{name}_{i}",
+                "Description": f"This column contains {name}",
+                "Datatype": "str",
+                "Dataset_Name": f"synthetic_{i // 100}",
+            }
+        )
+        yield ColumnInfo(metadata, [generate_value(rng) for _ in range(num_values)])
+
+
+def load_public_column_infos(input_data_path: str = input_data_dir) -> List[ColumnInfo]:
+    column_infos = []
+    for filename in sorted(os.listdir(input_data_path)):
+        dataset_name, extension = os.path.splitext(filename)
+        if extension == ".csv":
+            data = pd.read_csv(os.path.join(input_data_path, filename))
+        elif extension == ".xlsx":
+            data = pd.read_excel(os.path.join(input_data_path, filename))
+        else:
+            continue
+        for col in data.columns:
+            metadata = Metadata(
+                {
+                    "Name": col,
+                    "Description": f"This column contains name of the {col}",
+                    "Datatype": "str",
+                    "Dataset_Name": dataset_name,
+                }
+            )
+            values = data[col].dropna().values[:MAX_PUBLIC_VALUES]
+            column_infos.append(ColumnInfo(metadata, values))
+    return column_infos
+
+
+def load_column_infos(dataset: Dict[str, Any]) -> Iterable[ColumnInfo]:
+    if dataset["name"] == PUBLIC_DATASET:
+        return load_public_column_infos()
+    if dataset["name"] == SYNTHETIC_DATASET:
+        return generate_synthetic_column_infos(
+            dataset["columns"], dataset["values"], dataset["seed"]
+        )
+    raise ValueError(f"Unknown dataset {dataset['name']}")
+
+
+def get_peak_rss_mb() -> float:
+    """Peak RSS of this process or of any of its finished worker processes."""
+    peak_rss = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak_rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def summarize(
+    num_columns: int, num_values: int, seconds: float, latencies: List[float]
+) -> Dict[str, float]:
+    return {
+        "columns": num_columns,
+        "values": num_values,
+        "seconds": seconds,
+        "columns_per_sec": num_columns / seconds if seconds else 0.0,
+        "values_per_sec": num_values / seconds if seconds else 0.0,
+        "p50_latency_ms": float(np.percentile(latencies, 50) * 1000)
+        if latencies
+        else 0.0,
+        "p99_latency_ms": float(np.percentile(latencies, 99) * 1000)
+        if latencies
+        else 0.0,
+    }
+
+
+def run_benchmark(
+    column_infos: Iterable[ColumnInfo],
+    confidence_level_threshold: float,
+    infotypes: Optional[List[str]] = None,
+    n_workers: Optional[int] = None,
+    options: Optional[InspectionOptions] = None,
+) -> Dict[str, Any]:
+    """Classify column_infos and measure throughput and latency.
+
+    Latency of a column is the wall time of its whole classification, including
+    values normalization and basic checks, as recorded in its
+    ClassificationStats. Stage timers break that time down, per infotype and
+    in total. Time spent producing the input columns is not counted.
+    The first column is classified once beforehand, so that loading spaCy and
+    compiling the configuration are not counted either.
+    """
+    column_infos = iter(column_infos)
+    first_column_info = next(column_infos, None)
+    if first_column_info is None:
+        raise ValueError("No columns to benchmark")
+    list(
+        predict_infotypes_stream(
+            [ColumnInfo(first_column_info.metadata, list(first_column_info.values))],
+            confidence_level_threshold,
+            input_dict,
+            infotypes,
+            options=options,
+        )
+    )
+
+    input_seconds = 0.0
+    num_values: Dict[int, int] = {}
+
+    def timed_column_infos() -> Iterator[ColumnInfo]:
+        nonlocal input_seconds
+        column_info: Optional[ColumnInfo] = first_column_info
+        while column_info is not None:
+            num_values[id(column_info)] = len(column_info.values)
+            yield column_info
+            start = time.perf_counter()
+            column_info = next(column_infos, None)
+            input_seconds += time.perf_counter() - start
+
+    latencies: List[float] = []
+    total_values = 0
+    infotype_latencies: Dict[str, List[float]] = {}
+    infotype_values: Dict[str, int] = {}
+
+    def on_column_stats(column_info: ColumnInfo, stats: ClassificationStats) -> None:
+        nonlocal total_values
+        column_values = num_values.pop(id(column_info))
+        total_values += column_values
+        latencies.append(stats.column_seconds)
+        column_seconds: Dict[str, float] = {}
+        for (infotype, stage), stage_stats in stats.stages.items():
+            column_seconds[infotype] = (
+                column_seconds.get(infotype, 0.0) + stage_stats.seconds
+            )
+            if stage != METADATA_STAGE:
+                infotype_values[infotype] = (
+                    infotype_values.get(infotype, 0) + column_values
+                )
+        for infotype, seconds in column_seconds.items():
+            infotype_latencies.setdefault(infotype, []).append(seconds)
+
+    total_stats = ClassificationStats()
+    start = time.perf_counter()
+    for _ in predict_infotypes_stream(
+        timed_column_infos(),
+        confidence_level_threshold,
+        input_dict,
+        infotypes,
+        n_workers=n_workers,
+        options=options,
+        stats=total_stats,
+        on_column_stats=on_column_stats,
+    ):
+        pass
+    seconds = time.perf_counter() - start - input_seconds
+
+    stage_seconds: Dict[str, float] = {}
+    for (_, stage), stage_stats in total_stats.stages.items():
+        stage_seconds[stage] = stage_seconds.get(stage, 0.0) + stage_stats.seconds
+    return {
+        "total": {
+            **summarize(total_stats.columns, total_values, seconds, latencies),
+            "input_seconds": input_seconds,
+            "peak_rss_mb": get_peak_rss_mb(),
+            # breakdown of the time spent classifying columns
+            "column_seconds": total_stats.column_seconds,
+            "stage_seconds": stage_seconds,
+            "other_seconds": total_stats.column_seconds - sum(stage_seconds.values()),
+        },
+        "infotypes": {
+            infotype: summarize(
+                len(infotype_latencies[infotype]),
+                infotype_values.get(infotype, 0),
+                total_stats.total_seconds(infotype=infotype),
+                infotype_latencies[infotype],
+            )
+            for infotype in sorted(infotype_latencies)
+        },
+    }
+
+
+def _run_benchmark_in_process(
+    dataset: Dict[str, Any],
+    confidence_level_threshold: float,
+    infotypes: Optional[List[str]],
+    n_workers: Optional[int],
+    options: Optional[InspectionOptions],
+) -> Dict[str, Any]:
+    return run_benchmark(
+        load_column_infos(dataset),
+        confidence_level_threshold,
+        infotypes,
+        n_workers,
+        options,
+    )
+
+
+def run_isolated(*args: Any) -> Dict[str, Any]:
+    """run_benchmark in a fresh process, loading the dataset there."""
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(_run_benchmark_in_process, *args).result()
+
+
+def compare_to_baseline(
+    result: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """Descriptions of the metrics worse than in baseline by more than tolerance."""
+    regressions = []
+    sections = [("total", result["total"], baseline["total"])] + [
+        (infotype, metrics, baseline["infotypes"][infotype])
+        for infotype, metrics in result["infotypes"].items()
+        if infotype in baseline.get("infotypes", {})
+    ]
+    for section, metrics, baseline_metrics in sections:
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            value = metrics.get(metric)
+            baseline_value = baseline_metrics.get(metric)
+            if not value or not baseline_value:
+                continue
+            ratio = value / baseline_value
+            if (higher_is_better and ratio < 1 - tolerance) or (
+                not higher_is_better and ratio > 1 + tolerance
+            ):
+                regressions.append(
+                    f"{section} {metric}: {value:.2f} vs {baseline_value:.2f} in baseline"
+                )
+    return regressions
+
+
+def format_report(result: Dict[str, Any]) -> str:
+    rows = [("total", result["total"])] + list(result["infotypes"].items())
+    lines = [
+        f"{'':<32}{'columns':>10}{'columns/s':>12}{'values/s':>12}"
+        f"{'p50 ms':>10}{'p99 ms':>10}{'peak MB':>10}"
+    ]
+    for name, metrics in rows:
+        peak_rss = metrics.get("peak_rss_mb")
+        lines.append(
+            f"{name:<32}{metrics['columns']:>10}{metrics['columns_per_sec']:>12.1f}"
+            f"{metrics['values_per_sec']:>12.0f}{metrics['p50_latency_ms']:>10.3f}"
+            f"{metrics['p99_latency_ms']:>10.3f}"
+            f"{f'{peak_rss:.0f}' if peak_rss is not None else '-':>10}"
+        )
+    total = result["total"]
+    if total.get("column_seconds"):
+        breakdown = {**total["stage_seconds"], "other": total["other_seconds"]}
+        lines.append(
+            f"classification time {total['column_seconds']:.3f}s: "
+            + ", ".join(
+                f"{stage} {seconds / total['column_seconds']:.0%}"
+                for stage, seconds in breakdown.items()
+            )
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("dataset", choices=[PUBLIC_DATASET, SYNTHETIC_DATASET])
+    parser.add_argument("--columns", type=int, default=10000)
+    parser.add_argument("--values", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--infotypes", nargs="+")
+    parser.add_argument("--threshold", type=float, default=0.6)
+    parser.add_argument("--n-workers", type=int)
+    parser.add_argument("--backend", default="python")
+    parser.add_argument(
+        "--isolate-infotypes",
+        action="store_true",
+        help="also benchmark each infotype alone in its own process, "
+        "which measures its peak RSS",
+    )
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against results of an earlier run")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    dataset = {"name": args.dataset}
+    if args.dataset == SYNTHETIC_DATASET:
+        dataset.update(columns=args.columns, values=args.values, seed=args.seed)
+    options = InspectionOptions(backend=args.backend)
+    result = run_isolated(
+        dataset, args.threshold, args.infotypes, args.n_workers, options
+    )
+    if args.isolate_infotypes:
+        for infotype in list(result["infotypes"]):
+            isolated_result = run_isolated(
+                dataset, args.threshold, [infotype], args.n_workers, options
+            )
+            result["infotypes"][infotype] = {
+                **isolated_result["infotypes"].get(infotype, {}),
+                "peak_rss_mb": isolated_result["total"]["peak_rss_mb"],
+            }
+    result["config"] = {
+        "dataset": dataset,
+        "infotypes": args.infotypes,
+        "threshold": args.threshold,
+        "n_workers": args.n_workers,
+        "backend": args.backend,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+    print(format_report(result))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(result, file, indent=2)
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        baseline_config = baseline.get("config", {})
+        if any(
+            baseline_config.get(key) != value
+            for key, value in result["config"].items()
+            if key not in ("python", "platform")
+        ):
+            print("Warning: baseline was measured with a different configuration")
+        regressions = compare_to_baseline(result, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+import copy
+
+import pytest
+from benchmark import (
+    SYNTHETIC_GENERATORS,
+    compare_to_baseline,
+    format_report,
+    generate_synthetic_column_infos,
+    run_benchmark,
+)
+
+
+def test_generate_synthetic_column_infos():
+    column_infos = list(generate_synthetic_column_infos(40, num_values=10, seed=1))
+    assert len(column_infos) == 40
+    assert {len(column_info.values) for column_info in column_infos} == {10}
+    assert column_infos[0].metadata.name == "email_0"
+    assert column_infos[len(SYNTHETIC_GENERATORS)].metadata.name.startswith("email_")
+    # columns do not depend on how many are generated
+    assert [
+        column_info.values
+        for column_info in generate_synthetic_column_infos(5, num_values=10, seed=1)
+    ] == [column_info.values for column_info in column_infos[:5]]
+
+
+def test_run_benchmark():
+    result = run_benchmark(
+        generate_synthetic_column_infos(32, num_values=60),
+        0.6,
+        ["Email_Address", "Age"],
+    )
+    assert result["total"]["columns"] == 32
+    assert result["total"]["values"] == 32 * 60
+    assert result["total"]["columns_per_sec"] > 0
+    assert result["total"]["p99_latency_ms"] >= result["total"]["p50_latency_ms"]
+    assert sorted(result["infotypes"]) == ["Age", "Email_Address"]
+    # stage timers break down the time of whole column classifications
+    total = result["total"]
+    assert total["column_seconds"] >= sum(total["stage_seconds"].values())
+    assert total["other_seconds"] == pytest.approx(
+        total["column_seconds"] - sum(total["stage_seconds"].values())
+    )
+    assert "classification time" in format_report(result)
+
+    assert compare_to_baseline(result, result, tolerance=0.2) == []
+    slower = copy.deepcopy(result)
+    slower["total"]["columns_per_sec"] /= 2
+    slower["infotypes"]["Age"]["p99_latency_ms"] *= 2
+    assert [
+        regression.split(":")[0]
+        for regression in compare_to_baseline(slower, result, tolerance=0.2)
+    ] == ["total columns_per_sec", "Age p99_latency_ms"]
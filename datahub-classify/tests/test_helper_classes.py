@@ -0,0 +1,46 @@
+import pickle
+from typing import cast
+
+import numpy as np
+
+from datahub_classify.helper_classes import (
+    ColumnValues,
+    CompactInfotypeProposal,
+    DebugInfo,
+    InfotypeProposal,
+)
+
+
+def test_column_values_normalize():
+    column_values = ColumnValues.normalize(
+        np.array(["Foo ", "nan", " ", None, "BAR", 42], dtype=object)
+    )
+    assert column_values.raw == ["Foo ", "BAR", 42]
+    assert column_values.strings == ["Foo ", "BAR", "42"]
+    assert column_values.lowered == ["foo ", "bar", "42"]
+    assert column_values.stripped == ["Foo", "BAR", "42"]
+    assert len(column_values) == 3
+    assert ColumnValues.from_values(column_values) is column_values
+
+
+def test_compact_infotype_proposal():
+    # scores computed by the inspectors are NumPy floats
+    debug_info = DebugInfo(
+        cast(float, np.float64(1.0)), None, 1, cast(float, np.float64(0.88)), 64
+    )
+    proposal = CompactInfotypeProposal.from_proposal(
+        InfotypeProposal("Email_Address", cast(float, np.float64(0.9)), debug_info)
+    )
+    assert not hasattr(proposal, "__dict__")
+    assert proposal.infotype == "Email_Address"
+    assert proposal.confidence_level == 0.9
+    assert proposal.debug_info == debug_info
+    assert type(proposal.debug_info.name) is float
+    assert proposal == InfotypeProposal("Email_Address", 0.9, debug_info)
+    assert InfotypeProposal("Email_Address", 0.9, debug_info) == proposal
+    assert proposal != InfotypeProposal("Email_Address", 0.8, debug_info)
+    # changes to the debug_info are kept
+    proposal.debug_info.values_consumed = 50
+    assert proposal.debug_info.values_consumed == 50
+    assert pickle.loads(pickle.dumps(proposal)) == proposal
+    assert CompactInfotypeProposal.from_proposal(proposal) is proposal
@@ -0,0 +1,42 @@
+import copy
+from typing import Any, Dict
+
+from datahub_classify.helper_classes import Metadata
+from datahub_classify.infotype_helper import (
+    compute_max_confidence,
+    default_phone_number_regions,
+    get_phone_number_validator,
+    inspect_for_email_address,
+    inspect_for_phone_number,
+)
+from datahub_classify.reference_input import input1
+
+
+def test_inspect_for_phone_number():
+    config: Dict[str, Any] = copy.deepcopy(input1["Phone_Number"])
+    metadata = Metadata({"Name": "comment", "Description": "", "Datatype": "str"})
+    values = ["+1 650-253-0000", "0700123456", "john@example.com", "n/a", 42]
+    for regions, values_score in [(["US"], 0.4), ([], 0.2)]:
+        config["Values"]["regions"] = regions
+        _, debug_info = inspect_for_phone_number(metadata, values * 3, config)
+        assert debug_info.values == values_score
+
+
+def test_phone_number_validation_does_not_depend_on_earlier_values():
+    value = "011807"
+    expected = get_phone_number_validator(default_phone_number_regions)(value)
+    is_valid_phone_number = get_phone_number_validator(default_phone_number_regions)
+    for earlier_value in ["0080820", "0080820", "+1 650-253-0000", "0700123456"]:
+        is_valid_phone_number(earlier_value)
+    assert is_valid_phone_number(value) == expected
+
+
+def test_compute_max_confidence_bounds_confidence():
+    config: Dict[str, Any] = input1["Email_Address"]
+    values = ["john@example.com", "jane@example.org", "n/a", "unknown"]
+    for name in ["email", "comment"]:
+        metadata = Metadata({"Name": name, "Description": "", "Datatype": "str"})
+        confidence, _ = inspect_for_email_address(metadata, values, config)
+        assert compute_max_confidence(metadata, config) >= confidence
+    metadata = Metadata({"Name": "comment", "Description": "", "Datatype": "int"})
+    assert compute_max_confidence(metadata, config) <= 0.6
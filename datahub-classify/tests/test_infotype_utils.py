@@ -0,0 +1,220 @@
+import re
+from typing import Any, Dict, List
+
+import pytest
+
+from datahub_classify.helper_classes import DebugInfo
+from datahub_classify.infotype_utils import (
+    EarlyExit,
+    LazyModule,
+    NamePatternMatcher,
+    compile_name_patterns,
+    compile_value_matcher,
+    compile_value_patterns,
+    count_distinct_values,
+    detect_named_entities_spacy,
+    detect_named_entity_spacy,
+    match_compiled_regex,
+    match_compiled_regex_for_values,
+    match_regex,
+    match_regex_for_values,
+    parse_keyword_pattern,
+    score_values,
+)
+from datahub_classify.reference_input import input1
+
+
+@pytest.mark.parametrize(
+    "text,regex_list,expected_score",
+    [
+        ("Email_Address", ["^.*mail.*add.*$", "email"], 1),
+        ("customer mail", ["mail"], 0.65),
+        ("customer_id", ["mail"], 0),
+        ("E-Mail", ["email"], 1),
+        ("phone", ["[invalid", "phone"], 1),
+    ],
+)
+def test_match_compiled_regex_same_as_match_regex(text, regex_list, expected_score):
+    compiled_patterns = compile_name_patterns(regex_list)
+    assert match_compiled_regex(text, compiled_patterns) == expected_score
+    assert match_regex(text, regex_list) == expected_score
+
+
+@pytest.mark.parametrize(
+    "pattern,expected_keyword_pattern",
+    [
+        ("^.*card.*number.*$", ((("card",), ("number",)), False, False)),
+        (".*phone.*(num|no).*", ((("phone",), ("num", "no")), False, False)),
+        ("email", ((("email",),), True, True)),
+        ("ccn[^a-z]+.*", None),
+        (".*", None),
+    ],
+)
+def test_parse_keyword_pattern(pattern, expected_keyword_pattern):
+    keyword_pattern = parse_keyword_pattern(pattern, re.compile(pattern))
+    if expected_keyword_pattern is None:
+        assert keyword_pattern is None
+    else:
+        assert keyword_pattern is not None
+        assert keyword_pattern[:3] == expected_keyword_pattern
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Email_Address",
+        "customer mail",
+        "telephone_no",
+        "cell",
+        "card holder number",
+        "ccn_2",
+        "src ip address",
+        "mailing list id",
+        "dest_addr",
+        "page",
+        "age",
+        "user\nname",
+        "",
+    ],
+)
+def test_name_pattern_matcher_same_as_match_compiled_regex(text):
+    configs: Dict[str, Dict[str, Any]] = input1
+    regex_lists: Dict[str, List[str]] = {
+        infotype: config["Name"]["regex"] for infotype, config in configs.items()
+    }
+    regex_lists["Invalid"] = ["[invalid", "^.*invalid$"]
+    matcher = NamePatternMatcher(regex_lists)
+    for infotype, regex_list in regex_lists.items():
+        assert matcher.score(text, infotype) == match_compiled_regex(
+            text, compile_name_patterns(regex_list)
+        )
+
+
+def test_match_compiled_regex_for_values():
+    regex_list = ["male", "female", "m", "f"]
+    values = ["Male", "female", "F", "unknown", "M", "male", 1, None]
+    value_matcher = compile_value_matcher(regex_list)
+    assert match_compiled_regex_for_values(values, value_matcher) == 5 / 8
+    assert match_regex_for_values(values, regex_list) == 5 / 8
+
+
+def test_compile_value_patterns_skips_invalid_regex():
+    assert len(compile_value_patterns(["[invalid", "valid"])) == 1
+
+
+def test_value_pattern_matcher_single_pass():
+    matcher = compile_value_matcher([r"^4[0-9]{3}$", r"(a)\1", "b|c", r"(?i)ok"])
+    assert matcher.combined_pattern is not None
+    assert len(matcher.standalone_patterns) == 2
+    assert [matcher.fullmatch(v) for v in ["4123", "aa", "b", "c", "OK", "bc"]] == [
+        True,
+        True,
+        True,
+        True,
+        True,
+        False,
+    ]
+
+
+def test_detect_named_entities_spacy_batch():
+    spacy = pytest.importorskip("spacy")
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([{"label": "PERSON", "pattern": "John Smith"}])
+    values = ["John Smith", "unknown", 12, "Mr John Smith"]
+    assert [
+        detect_named_entity_spacy([nlp], ["PERSON"], value)
+        for value in ["John Smith", "unknown", "Mr John Smith"]
+    ] == [True, False, True]
+    assert detect_named_entities_spacy([nlp], ["PERSON"], values, batch_size=2) == [
+        True,
+        False,
+        False,
+        True,
+    ]
+
+
+def test_score_values_early_exit():
+    validated = []
+
+    def validate_values(values):
+        validated.extend(values)
+        return [value.startswith("valid") for value in values]
+
+    values = [f"valid{i}" for i in range(10)] + [f"invalid{i}" for i in range(90)]
+    assert score_values(values, validate_values) == 0.1
+    assert len(validated) == 100
+
+    validated.clear()
+    # can no longer reach a score above 0.5 after 60 values
+    score = score_values(
+        values,
+        validate_values,
+        early_exit=EarlyExit(
+            lambda min_score, max_score: max_score <= 0.5, batch_size=20
+        ),
+    )
+    assert len(validated) == 60
+    assert score == 10 / 60
+
+    validated.clear()
+    # already passed a score of 0.1 after 10 values
+    score = score_values(
+        values,
+        validate_values,
+        weight=1.5,
+        early_exit=EarlyExit(
+            lambda min_score, max_score: min_score > 0.1, batch_size=10
+        ),
+    )
+    assert score == 1.0
+    assert len(validated) == 10
+
+
+def test_score_values_validates_distinct_values_once():
+    validated = []
+
+    def validate_values(values):
+        validated.extend(values)
+        return [value in ("M", "F") for value in values]
+
+    values = ["M", "F", "x", "M", "M", "F", 1, "1", 1.0] * 10
+    assert score_values(values, validate_values) == 50 / 90
+    assert validated == ["M", "F", "x", 1, "1", 1.0]
+    assert count_distinct_values([[1], [1]]) == ([[1], [1]], [1, 1])
+
+
+def test_score_values_adaptive_sampling():
+    validated = []
+
+    def validate_values(values):
+        validated.extend(values)
+        return [value % 10 < 3 for value in values]
+
+    values = list(range(1000))
+    debug_info = DebugInfo()
+    early_exit = EarlyExit(
+        lambda min_score, max_score: max_score <= 0.5 or min_score > 0.5,
+        batch_size=50,
+        sampling_z_score=2.576,
+        debug_info=debug_info,
+    )
+    score = score_values(values, validate_values, early_exit=early_exit)
+    # a sample of 50 values already rules out a score above 0.5
+    assert debug_info.values_consumed == len(validated) == 50
+    assert 0.1 < score < 0.5
+
+    # undecided samples double until all values are scored
+    validated.clear()
+    early_exit.is_decided = lambda min_score, max_score: False
+    assert score_values(values, validate_values, early_exit=early_exit) == 0.3
+    assert debug_info.values_consumed == 1000
+    assert sorted(validated) == values
+
+
+def test_lazy_module_missing_extra():
+    module = LazyModule("datahub_classify_missing_module", extra="pandas")
+    with pytest.raises(ImportError, match=r"acryl-datahub-classify\[pandas\]"):
+        module.DataFrame
+    with pytest.raises(ImportError):
+        LazyModule("datahub_classify_missing_module").DataFrame
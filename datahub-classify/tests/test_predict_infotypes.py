@@ -0,0 +1,591 @@
+import asyncio
+import copy
+import pickle
+import random
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from datahub_classify import infotype_helper, infotype_predictor, result_cache
+from datahub_classify.classifier_plan import get_classifier_plan
+from datahub_classify.helper_classes import (
+    ColumnChanges,
+    ColumnInfo,
+    CompactInfotypeProposal,
+    InspectionOptions,
+    Metadata,
+)
+from datahub_classify.infotype_helper import compute_max_confidence
+from datahub_classify.infotype_predictor import (
+    predict_infotypes,
+    predict_infotypes_async,
+    predict_infotypes_from_store,
+    predict_infotypes_incremental,
+    predict_infotypes_stream,
+    predict_infotypes_table,
+    score_column_metadata,
+)
+from datahub_classify.reference_input import input1 as input_dict
+from datahub_classify.result_cache import ClassificationResultCache, compute_column_key
+from datahub_classify.sample_store import SampleStore, write_sample_store
+from datahub_classify.spacy_models import set_spacy_model
+from datahub_classify.stats import (
+    METADATA_STAGE,
+    VALUES_LIBRARY_STAGE,
+    VALUES_REGEX_STAGE,
+    ClassificationStats,
+)
+
+infotypes_to_use = [
+    "Email_Address",
+    "Gender",
+    "IP_Address_v4",
+    "US_Social_Security_Number",
+    "Age",
+]
+
+
+def get_column_infos():
+    columns = {
+        "email": [f"user{i}@example.com" for i in range(100)],
+        "gender": ["Male", "Female", "nan", "F", "M"] * 20,
+        "ip": [f"10.0.{i}.1" for i in range(100)],
+        "ssn": [f"123-45-{6789 + i}" for i in range(100)],
+        "age": [str(20 + i % 50) for i in range(100)],
+        "comment": ["lorem ipsum"] * 100,
+        "few_values": ["a@b.com"] * 10,
+    }
+    return [
+        ColumnInfo(
+            Metadata(
+                {
+                    "Name": name,
+                    "Description": f"This column contains {name}",
+                    "Datatype": "str",
+                    "Dataset_Name": "test_dataset",
+                }
+            ),
+            values,
+        )
+        for name, values in columns.items()
+    ]
+
+
+def get_predictions(column_infos):
+    return [
+        (
+            column_info.metadata.name,
+            [
+                (proposal.infotype, proposal.confidence_level, proposal.debug_info)
+                for proposal in column_info.infotype_proposals or []
+            ],
+        )
+        for column_info in column_infos
+    ]
+
+
+@pytest.fixture(scope="module")
+def expected_predictions():
+    column_infos = predict_infotypes(
+        get_column_infos(), 0.6, input_dict, infotypes_to_use
+    )
+    return get_predictions(column_infos)
+
+
+def test_predict_infotypes(expected_predictions):
+    best_infotypes = {
+        name: max(proposals, key=lambda p: p[1])[0] if proposals else None
+        for name, proposals in expected_predictions
+    }
+    assert best_infotypes == {
+        "email": "Email_Address",
+        "gender": "Gender",
+        "ip": "IP_Address_v4",
+        "ssn": "US_Social_Security_Number",
+        "age": "Age",
+        "comment": None,
+        "few_values": None,
+    }
+
+
+def test_predict_infotypes_in_parallel(expected_predictions):
+    column_infos = get_column_infos()
+    result = predict_infotypes(
+        column_infos, 0.6, copy.deepcopy(input_dict), infotypes_to_use, n_workers=2
+    )
+    assert result is column_infos
+    assert get_predictions(result) == expected_predictions
+    assert "nan" not in column_infos[1].values
+
+
+@pytest.mark.parametrize("n_workers, spacy_loads", [(None, 1), (2, 0)])
+def test_spacy_model_loaded_by_workers_only(monkeypatch, n_workers, spacy_loads):
+    loads = []
+    monkeypatch.setattr(
+        infotype_predictor, "get_spacy_models", lambda: loads.append(True)
+    )
+    predict_infotypes([], 0.6, input_dict, ["Full_Name"], n_workers=n_workers)
+    assert len(loads) == spacy_loads
+
+
+@pytest.mark.parametrize("n_workers", [None, 2])
+def test_predict_infotypes_stream(expected_predictions, n_workers):
+    consumed = []
+
+    def column_info_generator():
+        for column_info in get_column_infos():
+            consumed.append(column_info.metadata.name)
+            yield column_info
+
+    stream = predict_infotypes_stream(
+        column_info_generator(),
+        0.6,
+        input_dict,
+        infotypes_to_use,
+        n_workers=n_workers,
+        chunk_size=1,
+        max_pending_chunks=2,
+    )
+    first_column_info = next(stream)
+    assert first_column_info.metadata.name == "email"
+    # input is pulled lazily, bounded by the number of pending chunks
+    assert len(consumed) <= 2
+    column_infos = [first_column_info] + list(stream)
+    assert get_predictions(column_infos) == expected_predictions
+
+
+@pytest.mark.parametrize("use_thread_pool", [False, True])
+def test_predict_infotypes_async(expected_predictions, use_thread_pool):
+    consumed = []
+
+    async def fetch_column_infos():
+        for column_info in get_column_infos():
+            # sampling I/O
+            await asyncio.sleep(0)
+            consumed.append(column_info.metadata.name)
+            yield column_info
+
+    async def classify(executor):
+        stats = ClassificationStats()
+        stream = predict_infotypes_async(
+            fetch_column_infos(),
+            0.6,
+            input_dict,
+            infotypes_to_use,
+            max_pending_chunks=2,
+            executor=executor,
+            stats=stats,
+        )
+        first_column_info = await stream.__anext__()
+        # input is pulled lazily, bounded by the number of pending chunks
+        assert len(consumed) <= 3
+        column_infos = [first_column_info] + [
+            column_info async for column_info in stream
+        ]
+        assert stats.columns == 7
+        return column_infos
+
+    if use_thread_pool:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            column_infos = asyncio.run(classify(executor))
+    else:
+        column_infos = asyncio.run(classify(None))
+    assert get_predictions(column_infos) == expected_predictions
+    assert "nan" not in column_infos[1].values
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        InspectionOptions(early_exit=True, early_exit_batch_size=10),
+        InspectionOptions(adaptive_sampling=True, early_exit_batch_size=10),
+    ],
+)
+def test_predict_infotypes_with_early_exit(expected_predictions, options):
+    column_infos = predict_infotypes(
+        get_column_infos(), 0.6, input_dict, infotypes_to_use, options=options
+    )
+    assert [
+        (name, [proposal[0] for proposal in proposals])
+        for name, proposals in get_predictions(column_infos)
+    ] == [
+        (name, [proposal[0] for proposal in proposals])
+        for name, proposals in expected_predictions
+    ]
+
+
+@pytest.mark.parametrize("n_workers", [None, 2])
+def test_predict_infotypes_with_result_cache(expected_predictions, n_workers, tmp_path):
+    with ClassificationResultCache(str(tmp_path / "results.db")) as result_cache:
+        for _ in range(2):
+            column_infos = predict_infotypes(
+                get_column_infos(),
+                0.6,
+                input_dict,
+                infotypes_to_use,
+                n_workers=n_workers,
+                result_cache=result_cache,
+            )
+            assert get_predictions(column_infos) == expected_predictions
+            assert "nan" not in column_infos[1].values
+
+        # a different threshold does not reuse cached proposals
+        predict_infotypes(
+            get_column_infos(),
+            0.5,
+            input_dict,
+            infotypes_to_use,
+            result_cache=result_cache,
+        )
+        if n_workers is None:
+            assert (result_cache.hits, result_cache.misses) == (7, 14)
+
+
+def test_result_cache_key_covers_spacy_model_and_version(monkeypatch):
+    column_info = get_column_infos()[0]
+    column_key = compute_column_key(column_info, "config", ["Full_Name"], 0.6)
+    set_spacy_model("en_core_web_lg")
+    try:
+        assert (
+            compute_column_key(column_info, "config", ["Full_Name"], 0.6) != column_key
+        )
+    finally:
+        set_spacy_model(None)
+    monkeypatch.setattr(result_cache, "__version__", "1.0.0")
+    assert compute_column_key(column_info, "config", ["Full_Name"], 0.6) != column_key
+
+
+def test_in_memory_result_cache_not_shared_with_workers():
+    with ClassificationResultCache(":memory:") as in_memory_cache:
+        with pytest.raises(ValueError, match="in-memory"):
+            predict_infotypes(
+                get_column_infos(),
+                0.6,
+                input_dict,
+                infotypes_to_use,
+                n_workers=2,
+                result_cache=in_memory_cache,
+            )
+        with pytest.raises(ValueError, match="in-memory"):
+            pickle.dumps(in_memory_cache)
+
+
+@pytest.mark.parametrize("n_workers", [None, 2])
+def test_predict_infotypes_with_compact_results(
+    expected_predictions, n_workers, tmp_path
+):
+    with ClassificationResultCache(str(tmp_path / "results.db")) as result_cache:
+        predict_infotypes(
+            get_column_infos(),
+            0.6,
+            input_dict,
+            infotypes_to_use,
+            options=InspectionOptions(),
+            result_cache=result_cache,
+        )
+        column_infos = predict_infotypes(
+            get_column_infos(),
+            0.6,
+            input_dict,
+            infotypes_to_use,
+            n_workers=n_workers,
+            options=InspectionOptions(compact_results=True, keep_values=False),
+            result_cache=result_cache,
+        )
+        if n_workers is None:
+            # results are cached regardless of how they are returned
+            assert result_cache.hits == 7
+    assert get_predictions(column_infos) == expected_predictions
+    for column_info in column_infos:
+        assert column_info.values == []
+        for proposal in column_info.infotype_proposals or []:
+            assert isinstance(proposal, CompactInfotypeProposal)
+            assert type(proposal.confidence_level) is float
+            assert type(proposal.debug_info.values) is float
+
+
+@pytest.mark.parametrize("n_workers", [None, 2])
+def test_predict_infotypes_with_stats(expected_predictions, n_workers):
+    stats = ClassificationStats()
+    column_stats: Dict[str, ClassificationStats] = {}
+
+    def on_column_stats(column_info: ColumnInfo, s: ClassificationStats) -> None:
+        column_stats[column_info.metadata.name] = s
+
+    column_infos = predict_infotypes(
+        get_column_infos(),
+        0.6,
+        input_dict,
+        infotypes_to_use,
+        n_workers=n_workers,
+        stats=stats,
+        on_column_stats=on_column_stats,
+    )
+    assert get_predictions(column_infos) == expected_predictions
+    assert stats.columns == 7
+    assert list(column_stats) == [name for name, _ in expected_predictions]
+    assert all(s.columns == 1 for s in column_stats.values())
+    stages = {(row.infotype, row.stage) for row in stats.to_rows()}
+    assert ("Email_Address", METADATA_STAGE) in stages
+    assert ("Email_Address", VALUES_REGEX_STAGE) in stages
+    assert ("IP_Address_v4", VALUES_LIBRARY_STAGE) in stages
+    assert stats.total_seconds() == pytest.approx(
+        sum(s.total_seconds() for s in column_stats.values())
+    )
+    # stages are timed within the classification of each column
+    assert stats.column_seconds >= stats.total_seconds()
+
+
+def test_values_stage_reuses_metadata_scores(monkeypatch):
+    calls = []
+    compute_name_description_dtype_score = (
+        infotype_helper.compute_name_description_dtype_score
+    )
+
+    def counting_compute_name_description_dtype_score(*args, **kwargs):
+        calls.append(args[0].name)
+        return compute_name_description_dtype_score(*args, **kwargs)
+
+    monkeypatch.setattr(
+        infotype_helper,
+        "compute_name_description_dtype_score",
+        counting_compute_name_description_dtype_score,
+    )
+    stats = ClassificationStats()
+    column_infos = predict_infotypes(
+        get_column_infos()[:1], 0.6, input_dict, ["Email_Address"], stats=stats
+    )
+    assert get_predictions(column_infos)[0][1][0][0] == "Email_Address"
+    # scored once, in the metadata stage
+    assert calls == ["email"]
+
+
+def change_column_infos(column_infos):
+    column_infos[0].metadata = Metadata({"Name": "customer_email"})
+    column_infos[1].metadata = Metadata({"Name": "customer_gender"})
+    column_infos[2].values = [f"host{i}" for i in range(100)]
+    return [
+        ColumnChanges(metadata_fields=["Name", "Description", "Datatype"]),
+        ColumnChanges(metadata_fields=["Name", "Description", "Datatype"]),
+        ColumnChanges(values_changed=True),
+    ] + [ColumnChanges()] * (len(column_infos) - 3)
+
+
+def test_predict_infotypes_incremental():
+    column_infos = predict_infotypes(
+        get_column_infos(), 0.6, input_dict, infotypes_to_use
+    )
+    column_changes = change_column_infos(column_infos)
+    predict_infotypes_incremental(
+        column_infos, column_changes, 0.6, input_dict, infotypes_to_use
+    )
+    changed_column_infos = get_column_infos()
+    change_column_infos(changed_column_infos)
+    expected_column_infos = predict_infotypes(
+        changed_column_infos, 0.6, input_dict, infotypes_to_use
+    )
+    assert get_predictions(column_infos) == get_predictions(expected_column_infos)
+
+    # values are not inspected again unless they are reported as changed
+    column_infos[0].values = ["lorem ipsum"] * 100
+    predict_infotypes_incremental(
+        column_infos[:1],
+        [ColumnChanges(metadata_fields=["Name"])],
+        0.6,
+        input_dict,
+        infotypes_to_use,
+    )
+    assert get_predictions(column_infos[:1]) == get_predictions(
+        expected_column_infos[:1]
+    )
+
+
+def test_predict_infotypes_incremental_with_adaptive_sampling():
+    rng = random.Random(7)
+    values = [
+        ".".join(str(rng.randint(0, 255)) for _ in range(4))
+        if rng.random() < 0.6
+        else f"host{i}"
+        for i in range(1000)
+    ]
+
+    def get_ip_column_infos(name):
+        return [ColumnInfo(Metadata({"Name": name, "Datatype": "str"}), values)]
+
+    options = InspectionOptions(adaptive_sampling=True)
+    column_infos = predict_infotypes(
+        get_ip_column_infos("ip_address"),
+        0.6,
+        input_dict,
+        ["IP_Address_v4"],
+        options=options,
+    )
+    # the full name match settles the proposal on a first sample of the values
+    proposals = column_infos[0].infotype_proposals
+    assert proposals is not None
+    values_consumed = proposals[0].debug_info.values_consumed
+    assert values_consumed is not None and values_consumed < len(values)
+    column_infos[0].metadata = Metadata({"Name": "zipcode", "Datatype": "str"})
+    predict_infotypes_incremental(
+        column_infos,
+        [ColumnChanges(metadata_fields=["Name"])],
+        0.6,
+        input_dict,
+        ["IP_Address_v4"],
+        options=options,
+    )
+    expected_column_infos = predict_infotypes(
+        get_ip_column_infos("zipcode"),
+        0.6,
+        input_dict,
+        ["IP_Address_v4"],
+        options=options,
+    )
+    assert get_predictions(column_infos) == get_predictions(expected_column_infos)
+
+
+@pytest.mark.parametrize("n_workers", [None, 2])
+def test_predict_infotypes_with_numpy_backend(expected_predictions, n_workers):
+    column_infos = get_column_infos()
+    for column_info in column_infos:
+        column_info.values = np.array(column_info.values, dtype=object)
+    ages = column_infos[4].values = np.arange(100) % 50 + 20
+    predict_infotypes(
+        column_infos,
+        0.6,
+        input_dict,
+        infotypes_to_use,
+        n_workers=n_workers,
+        options=InspectionOptions(backend="numpy"),
+    )
+    assert get_predictions(column_infos) == expected_predictions
+    # numeric values stay the same array, rather than a list of NumPy scalars
+    assert column_infos[4].values is ages
+
+
+def test_score_column_metadata():
+    column_infos = get_column_infos() * 2 + [
+        ColumnInfo(Metadata({"Name": " ", "Datatype": "int"}), []),
+        ColumnInfo(Metadata({"Name": "Email", "Description": "email id"}), []),
+    ]
+    metadata_scores = score_column_metadata(column_infos, input_dict)
+    classifier_plan = get_classifier_plan(input_dict)
+    assert metadata_scores.infotypes == list(input_dict.keys())
+    assert metadata_scores.max_confidence.shape == (len(column_infos), len(input_dict))
+    for i, column_info in enumerate(column_infos):
+        for j, infotype in enumerate(metadata_scores.infotypes):
+            config: Dict[str, Any] = input_dict[infotype]
+            assert metadata_scores.max_confidence[i, j] == compute_max_confidence(
+                column_info.metadata,
+                config,
+                classifier_plan.compiled_configs[infotype],
+            )
+    email = metadata_scores.infotypes.index("Email_Address")
+    assert metadata_scores.name[[0, 7, 15], email].tolist() == [1, 1, 1]
+    assert metadata_scores.name[14].tolist() == [0] * len(input_dict)
+
+
+def get_table_predictions(column_infos):
+    return [
+        (
+            column_info.metadata.name,
+            proposal.infotype,
+            float(proposal.confidence_level),
+            proposal.debug_info.values,
+        )
+        for column_info in column_infos
+        for proposal in column_info.infotype_proposals or []
+    ]
+
+
+def get_table():
+    table = pd.DataFrame(
+        {
+            column_info.metadata.name: column_info.values[:100]
+            for column_info in get_column_infos()
+            if column_info.metadata.name != "few_values"
+        }
+    )
+    table.loc[3, "email"] = None
+    column_metadata = {
+        name: {"Description": f"This column contains {name}", "Datatype": "str"}
+        for name in table.columns
+    }
+    return table, column_metadata
+
+
+def test_predict_infotypes_table():
+    table, column_metadata = get_table()
+    expected_column_infos = predict_infotypes(
+        [
+            ColumnInfo(Metadata({"Name": name, **column_metadata[name]}), values)
+            for name, values in table.items()
+        ],
+        0.6,
+        input_dict,
+        infotypes_to_use,
+    )
+    results = predict_infotypes_table(
+        table, 0.6, input_dict, column_metadata, infotypes_to_use
+    )
+    assert [
+        (row.column_name, row.infotype, row.confidence_level, row.values)
+        for row in results.itertuples()
+    ] == get_table_predictions(expected_column_infos)
+
+
+def test_predict_infotypes_arrow_table():
+    pa = pytest.importorskip("pyarrow")
+    table, column_metadata = get_table()
+    results = predict_infotypes_table(
+        table, 0.6, input_dict, column_metadata, infotypes_to_use
+    )
+    arrow_results = predict_infotypes_table(
+        pa.Table.from_pandas(table), 0.6, input_dict, column_metadata, infotypes_to_use
+    )
+    pd.testing.assert_frame_equal(arrow_results, results)
+
+
+@pytest.mark.parametrize("n_workers", [None, 2])
+def test_predict_infotypes_from_store(expected_predictions, n_workers, tmp_path):
+    column_infos = get_column_infos()
+    column_infos[4].values = np.arange(100) % 50 + 20
+    path = str(tmp_path / "samples.dcs")
+    write_sample_store(path, column_infos)
+    with SampleStore(path) as sample_store:
+        column_infos = list(
+            predict_infotypes_from_store(
+                sample_store, 0.6, input_dict, infotypes_to_use, n_workers=n_workers
+            )
+        )
+    assert get_predictions(column_infos) == expected_predictions
+    assert all(len(column_info.values) == 0 for column_info in column_infos)
+
+
+def test_regex_only_infotypes_do_not_import_validator_libraries():
+    script = """
+import sys
+from datahub_classify.helper_classes import ColumnInfo, Metadata
+from datahub_classify.infotype_predictor import predict_infotypes
+from datahub_classify.reference_input import input1
+
+assert "pandas" not in sys.modules
+column_infos = [
+    ColumnInfo(Metadata({"Name": "email"}), [f"user{i}@example.com" for i in range(100)]),
+]
+predict_infotypes(column_infos, 0.6, input1, ["Email_Address", "IP_Address_v4"])
+print(",".join(sorted(
+    library
+    for library in ["phonenumbers", "schwifty", "spacy", "stdnum", "vininfo"]
+    if library in sys.modules
+)))
+"""
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, check=True, text=True
+    ).stdout
+    assert output.strip() == ""
@@ -0,0 +1,62 @@
+import pickle
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+
+from datahub_classify.helper_classes import Metadata
+from datahub_classify.sample_store import (
+    SampleStore,
+    SampleStoreWriter,
+    StringValues,
+)
+
+COLUMNS: Dict[str, Any] = {
+    "ints": np.arange(100, dtype=np.int32),
+    "floats": np.array([1.5, np.nan, -0.0]),
+    "strings": ["foo", "", "héllo", "\ud800"],
+    "string_array": np.array(["a@b.com", "c@d.org"], dtype=object),
+    "mixed": [1, "a", None, 2.5],
+    "empty": [],
+}
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    path = str(tmp_path / "samples.dcs")
+    with SampleStoreWriter(path) as writer:
+        for name, values in COLUMNS.items():
+            writer.add(Metadata({"Name": name, "Datatype": "str"}), values)
+    return path
+
+
+def test_sample_store(store_path):
+    with SampleStore(store_path) as store:
+        column_infos = list(store.column_infos())
+        assert [column_info.metadata.name for column_info in column_infos] == list(
+            COLUMNS
+        )
+        for column_info, values in zip(column_infos, COLUMNS.values()):
+            assert column_info.metadata.datatype == "str"
+            np.testing.assert_array_equal(list(column_info.values), list(values))
+
+        ints = store.get_values(0)
+        assert isinstance(ints, np.ndarray)
+        assert ints.dtype == np.int32
+        # a view of the memory map, not a copy
+        assert not ints.flags.owndata and not ints.flags.writeable
+        strings = store.get_values(2)
+        assert isinstance(strings, StringValues)
+        assert strings[-2] == "héllo" and strings[1:3] == ["", "héllo"]
+        assert pickle.loads(pickle.dumps(strings)) == COLUMNS["strings"]
+        assert isinstance(store.get_values(3), StringValues)
+        assert store.get_values(4) == COLUMNS["mixed"]
+    # values read before close remain readable
+    assert ints.sum() == 4950
+
+
+def test_sample_store_rejects_other_files(tmp_path):
+    path = tmp_path / "not_a_store"
+    path.write_bytes(b"0" * 64)
+    with pytest.raises(ValueError):
+        SampleStore(str(path))
@@ -0,0 +1,16 @@
+import pytest
+
+from datahub_classify.spacy_models import (
+    SpacyModelNotAvailableError,
+    get_spacy_models,
+    set_spacy_model,
+)
+
+
+def test_missing_spacy_model_fails_without_download(tmp_path):
+    set_spacy_model(str(tmp_path / "missing_model"))
+    try:
+        with pytest.raises(SpacyModelNotAvailableError):
+            get_spacy_models()
+    finally:
+        set_spacy_model(None)
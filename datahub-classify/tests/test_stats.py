@@ -0,0 +1,35 @@
+from datahub_classify.stats import (
+    METADATA_STAGE,
+    VALUES_REGEX_STAGE,
+    ClassificationStats,
+    StageStatsRow,
+    timed,
+    timed_column,
+)
+
+
+def test_classification_stats():
+    stats = ClassificationStats(columns=1)
+    stats.record("Email_Address", METADATA_STAGE, 0.5)
+    stats.record("Email_Address", VALUES_REGEX_STAGE, 2.0)
+    with timed(stats, "Age", METADATA_STAGE):
+        pass
+    with timed(None, "Age", VALUES_REGEX_STAGE):
+        pass
+    stats.column_seconds = 3.0
+    with timed_column(None):
+        pass
+
+    total = ClassificationStats()
+    total.merge(stats)
+    total.merge(stats)
+    assert total.columns == 2
+    assert total.column_seconds == 6.0
+    assert total.stages[("Email_Address", METADATA_STAGE)].calls == 2
+    assert total.stages[("Age", METADATA_STAGE)].calls == 2
+    assert ("Age", VALUES_REGEX_STAGE) not in total.stages
+    assert total.total_seconds(infotype="Email_Address") == 5.0
+    assert total.total_seconds(stage=VALUES_REGEX_STAGE) == 4.0
+    assert total.to_rows()[0] == StageStatsRow(
+        "Email_Address", VALUES_REGEX_STAGE, 2, 4.0
+    )
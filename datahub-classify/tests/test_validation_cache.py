@@ -0,0 +1,51 @@
+import copy
+from typing import Any, Dict
+
+from datahub_classify.helper_classes import Metadata
+from datahub_classify.infotype_helper import inspect_for_phone_number
+from datahub_classify.reference_input import input1
+from datahub_classify.validation_cache import ValidationCache, get_validation_cache
+
+
+def test_validation_cache_hits_misses_and_eviction():
+    validated = []
+
+    def validate_values(values):
+        validated.extend(values)
+        return [value.isdigit() for value in values]
+
+    cache = ValidationCache(max_size=3)
+    is_valid = cache.cached("Age", "isdigit", validate_values)
+    assert is_valid(["1", "a", "2"]) == [True, False, True]
+    assert is_valid(["2", "3"]) == [True, True]
+    assert validated == ["1", "a", "2", "3"]
+    assert cache.info() == (1, 4, 3, 3)
+
+    # "1" was the least recently used result and got evicted
+    assert is_valid(["1"]) == [True]
+    assert validated[-1] == "1"
+    # results are not shared across validators
+    assert cache.cached("Age", "other", validate_values)(["2"]) == [True]
+    assert validated[-1] == "2"
+
+    cache.clear()
+    assert cache.info() == (0, 0, 3, 0)
+
+
+def test_validation_cache_disabled():
+    cache = ValidationCache(max_size=0)
+    assert cache.validate("Age", "isdigit", ["1"], lambda v: [True]) == [True]
+    assert cache.info() == (0, 0, 0, 0)
+
+
+def test_cached_phone_numbers_do_not_depend_on_other_columns():
+    config: Dict[str, Any] = copy.deepcopy(input1["Phone_Number"])
+    config["Values"]["regions"] = ["AF", "AX", "AL", "DZ", "AS"]
+    metadata = Metadata({"Name": "comment"})
+    values_scores = []
+    for columns in [[["011807"]], [["0080820", "0080820", "011807"], ["011807"]]]:
+        get_validation_cache().clear()
+        for values in columns:
+            _, debug_info = inspect_for_phone_number(metadata, values, config)
+        values_scores.append(debug_info.values)
+    assert values_scores[0] == values_scores[1]
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from datahub_classify.helper_classes import ColumnValues
+from datahub_classify.infotype_utils import compile_value_matcher
+from datahub_classify.vectorized import (
+    VectorizedColumnValues,
+    normalize_column_values,
+    score_regex_values,
+    to_int_array,
+)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array([1.5, np.nan, -0.0, 0.0, 2.0, 1.5, np.inf]),
+        np.array([3, 1, 3, 120, 7], dtype=np.int32),
+        np.array(["Male", None, " ", "f", "nan", "F", 3], dtype=object),
+        ["Male", "None", "female", 1.0, 1],
+    ],
+)
+def test_numpy_backend_same_as_python_backend(values):
+    column_values = normalize_column_values(values, "numpy")
+    python_column_values = normalize_column_values(values, "python")
+    assert isinstance(column_values, VectorizedColumnValues)
+    assert column_values.strings == python_column_values.strings
+    assert column_values.lowered == python_column_values.lowered
+    for regex_list in [["m", "f", "male", "female"], [r"-?[0-9]+\.0", "inf"]]:
+        matcher = compile_value_matcher(regex_list)
+        assert score_regex_values(column_values, matcher) == score_regex_values(
+            python_column_values, matcher
+        )
+
+
+def test_numeric_values_boxed_only_on_demand():
+    column_values = VectorizedColumnValues.normalize(np.array([25.0, np.nan, 30.5]))
+    assert isinstance(column_values.values, np.ndarray)
+    assert len(column_values) == 2
+    assert column_values.strings == ["25.0", "30.5"]
+    assert to_int_array(column_values).tolist() == [25, 30]
+    assert column_values._raw is None
+    assert column_values.raw == [25.0, 30.5]
+
+
+def test_to_int_array():
+    values = np.array([25.7, 30.0, np.nan])
+    int_array = to_int_array(VectorizedColumnValues.normalize(values))
+    assert int_array.tolist() == [25, 30]
+    assert to_int_array(ColumnValues(["25", 30])).tolist() == [25, 30]
+    with pytest.raises(ValueError):
+        to_int_array(VectorizedColumnValues.normalize(np.array([1.0, np.inf])))
+    with pytest.raises(ValueError):
+        normalize_column_values([], "arrow")
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array([2**64 - 1, 5], dtype=np.uint64),
+        np.array([1e19, -1e19, 2.0**63, 5.5]),
+    ],
+)
+def test_to_int_array_beyond_int64_same_as_python_backend(values):
+    # values do not wrap around, they are converted the way int() converts them
+    assert (
+        to_int_array(normalize_column_values(values, "numpy")).tolist()
+        == to_int_array(normalize_column_values(values, "python")).tolist()
+    )